@@ -21,7 +21,7 @@ celery_app.conf.update(
 
     # Task Time Limits
     # Note: Soft timeouts not supported on Windows (requires SIGUSR1 signal)
-    task_time_limit=2100,  # 35 minutes hard limit for podcast generation
+    task_time_limit=2100,  # 35 minutes hard limit; pipeline stages set tighter per-task limits
 
     # Worker Configuration
     worker_prefetch_multiplier=1,  # Prefetch 1 task per worker
@@ -35,14 +35,30 @@ celery_app.conf.update(
     enable_utc=True,
 
     # Task Routes
+    # The podcast pipeline is a chain of stage tasks routed by resource profile:
+    #   CPU-bound (PyMuPDF, ffmpeg), one process per core:
+    #     celery -A backend.celery_worker worker -Q podcasts_cpu --pool prefork --concurrency <cores>
+    #   Prefork children are daemonic, so they extract large PDFs sequentially. To spread
+    #   a large PDF across PDF_PROCESS_POOL_WORKERS cores instead, run the CPU queue on threads:
+    #     celery -A backend.celery_worker worker -Q podcasts_cpu --pool threads --concurrency <cores / PDF_PROCESS_POOL_WORKERS>
+    #   I/O-bound (Gemini, ElevenLabs, S3, database), many green threads per process:
+    #     celery -A backend.celery_worker worker -Q podcasts,podcasts_io --pool gevent --concurrency 200
     task_routes={
         'backend.tasks.create_podcast_task': {'queue': 'podcasts'},
+        'backend.tasks.extract_stage': {'queue': 'podcasts_cpu'},
+        'backend.tasks.concat_stage': {'queue': 'podcasts_cpu'},
+        'backend.tasks.summarize_stage': {'queue': 'podcasts_io'},
+        'backend.tasks.script_stage': {'queue': 'podcasts_io'},
+        'backend.tasks.synthesize_stage': {'queue': 'podcasts_io'},
+        'backend.tasks.finalize_stage': {'queue': 'podcasts_io'},
     },
 
     # Queue Configuration
     task_queues=(
         Queue('default', Exchange('default'), routing_key='default'),
         Queue('podcasts', Exchange('podcasts'), routing_key='podcasts'),
+        Queue('podcasts_cpu', Exchange('podcasts_cpu'), routing_key='podcasts_cpu'),
+        Queue('podcasts_io', Exchange('podcasts_io'), routing_key='podcasts_io'),
     ),
     task_default_queue='default',
     task_default_exchange='default',
@@ -0,0 +1 @@
+"""Standalone benchmarks; run as modules, e.g. python -m backend.benchmarks.podcast_queries."""
@@ -0,0 +1,197 @@
+"""
+Local stand-ins for the external services used by the podcast pipeline.
+
+FakeGeminiModel replaces google.generativeai.GenerativeModel and
+FakeElevenLabs replaces the ElevenLabs client. Both sleep for configurable
+latencies so the pipeline's concurrency behaves as it would against the real
+APIs. The TTS fake streams real MPEG-1 Layer III frames (silence) of a
+duration matching the text, so concatenation, frame indexing and HLS see
+realistic audio.
+"""
+
+import random
+import threading
+import time
+
+import fitz
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, mono, no CRC
+MP3_BITRATE = 128000
+MP3_SAMPLE_RATE = 44100
+MP3_SAMPLES_PER_FRAME = 1152
+MP3_FRAME_SECONDS = MP3_SAMPLES_PER_FRAME / MP3_SAMPLE_RATE
+_MP3_HEADER = bytes([0xFF, 0xFB, 0x90, 0xC0])
+_MP3_HEADER_PADDED = bytes([0xFF, 0xFB, 0x92, 0xC0])
+_MP3_FRAME_SIZE = 144 * MP3_BITRATE // MP3_SAMPLE_RATE  # 417, plus one byte when padded
+
+# Speaking rate used to turn script text into audio duration
+WORDS_PER_SECOND = 2.5
+
+# Characters per piece of a streamed Gemini response
+STREAM_PIECE_CHARS = 120
+
+LOREM = (
+    "the report examines how distributed systems trade consistency for availability and how "
+    "teams measure the cost of coordination across regions while keeping latency predictable "
+    "for users who expect immediate answers from services that span many machines"
+).split()
+
+
+def silent_mp3_frames(seconds: float):
+    """
+    Yield silent MP3 frames covering roughly `seconds` of audio.
+
+    Frames use the standard padding schedule, so the stream averages exactly
+    128 kbps. All-zero side info and main data decode as silence.
+    """
+    frames = max(1, round(seconds / MP3_FRAME_SECONDS))
+    remainder = 0
+    for _ in range(frames):
+        remainder += (144 * MP3_BITRATE) % MP3_SAMPLE_RATE
+        if remainder >= MP3_SAMPLE_RATE:
+            remainder -= MP3_SAMPLE_RATE
+            yield _MP3_HEADER_PADDED + bytes(_MP3_FRAME_SIZE + 1 - 4)
+        else:
+            yield _MP3_HEADER + bytes(_MP3_FRAME_SIZE - 4)
+
+
+def _jittered(seconds: float, rng: random.Random, jitter: float = 0.25) -> float:
+    return max(0.0, seconds * rng.uniform(1 - jitter, 1 + jitter))
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(LOREM) for _ in range(words)).capitalize() + "."
+
+
+class FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeGeminiModel:
+    """
+    Stand-in for GenerativeModel.generate_content, streamed or not.
+
+    Recognises the title and script prompts built in tasks.py; every other
+    prompt (summary map/reduce) gets a canned summary. A response takes
+    `latency` to start plus its length at `chars_per_second`; a streamed
+    one is yielded in pieces at that rate.
+    """
+
+    def __init__(self, latency: float = 2.0, script_lines: int = 40, words_per_line: int = 25,
+                 summary_words: int = 400, chars_per_second: float = 0, seed: int = 0):
+        """
+        Args:
+            latency: Mean seconds to the first text (±25% jitter)
+            script_lines: Speaker lines in each generated script
+            words_per_line: Mean words per script line
+            summary_words: Words in each generated summary
+            chars_per_second: Generation speed after the first text; 0 = instant
+            seed: Seed for the jitter and text generator
+        """
+        self.latency = latency
+        self.script_lines = script_lines
+        self.words_per_line = words_per_line
+        self.summary_words = summary_words
+        self.chars_per_second = chars_per_second
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def generate_content(self, prompt: str, stream: bool = False, request_options=None):
+        with self._lock:
+            self.calls += 1
+            delay = _jittered(self.latency, self._rng)
+            rng = random.Random(self._rng.random())
+
+        text = self._respond(prompt, rng)
+        if stream:
+            return self._stream(text, delay)
+        time.sleep(delay + self._generation_seconds(text))
+        return FakeResponse(text)
+
+    def _generation_seconds(self, text: str) -> float:
+        return len(text) / self.chars_per_second if self.chars_per_second else 0.0
+
+    def _stream(self, text: str, delay: float):
+        pieces = [text[start:start + STREAM_PIECE_CHARS] for start in range(0, len(text), STREAM_PIECE_CHARS)] or [""]
+        time.sleep(delay)
+        for piece in pieces:
+            time.sleep(self._generation_seconds(piece))
+            yield FakeResponse(piece)
+
+    def _respond(self, prompt: str, rng: random.Random) -> str:
+        if "generate a short, catchy" in prompt:
+            return f"Benchmark Podcast {rng.randint(1, 10 ** 6)}"
+        if "podcast scriptwriter" in prompt:
+            lines = []
+            for i in range(self.script_lines):
+                speaker = "Dorothy" if i % 2 == 0 else "Will"
+                words = max(3, int(rng.gauss(self.words_per_line, self.words_per_line / 4)))
+                lines.append(f"{speaker}: {_sentence(rng, words)}")
+            return "\n".join(lines)
+        return _sentence(rng, self.summary_words)
+
+
+class _FakeTextToSpeech:
+    def __init__(self, owner: "FakeElevenLabs"):
+        self.owner = owner
+
+    def convert(self, voice_id: str, text: str, model_id: str):
+        return self.owner.stream(text)
+
+
+class FakeElevenLabs:
+    """
+    Stand-in for the ElevenLabs client's text_to_speech.convert.
+
+    The returned iterator waits `latency` before the first bytes, then streams
+    the audio at `realtime_factor` times its playback duration.
+    """
+
+    def __init__(self, latency: float = 0.5, realtime_factor: float = 0.1, chunk_bytes: int = 4096, seed: int = 0):
+        """
+        Args:
+            latency: Mean seconds to first byte (±25% jitter)
+            realtime_factor: Generation time as a fraction of audio duration
+            chunk_bytes: Size of the byte chunks yielded
+            seed: Seed for the jitter
+        """
+        self.latency = latency
+        self.realtime_factor = realtime_factor
+        self.chunk_bytes = chunk_bytes
+        self.text_to_speech = _FakeTextToSpeech(self)
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.characters = 0
+
+    def stream(self, text: str):
+        with self._lock:
+            self.calls += 1
+            self.characters += len(text)
+            first_byte = _jittered(self.latency, self._rng)
+        seconds = max(0.5, len(text.split()) / WORDS_PER_SECOND)
+        audio = b"".join(silent_mp3_frames(seconds))
+        chunks = max(1, -(-len(audio) // self.chunk_bytes))
+        per_chunk = seconds * self.realtime_factor / chunks
+
+        time.sleep(first_byte)
+        for start in range(0, len(audio), self.chunk_bytes):
+            if per_chunk:
+                time.sleep(per_chunk)
+            yield audio[start:start + self.chunk_bytes]
+
+
+def make_sample_pdf(path: str, pages: int, seed: int = 0) -> None:
+    """Write a text PDF of `pages` pages of generated prose."""
+    rng = random.Random(seed)
+    doc = fitz.open()
+    try:
+        for number in range(pages):
+            page = doc.new_page()
+            body = "\n\n".join(_sentence(rng, rng.randint(40, 80)) for _ in range(6))
+            page.insert_textbox(fitz.Rect(56, 56, 540, 786), f"Section {number + 1}\n\n{body}", fontsize=10)
+        doc.save(path)
+    finally:
+        doc.close()
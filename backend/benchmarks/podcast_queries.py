@@ -0,0 +1,188 @@
+"""
+Query-plan benchmark for the hot podcast queries.
+
+Seeds a synthetic users/podcasts dataset into a scratch schema, then runs the
+library and active-job queries under EXPLAIN ANALYZE twice: once with only the
+primary-key indexes, and once with the composite/partial indexes declared on
+models.Podcast (the ones migration 0006 creates). Prints plan shape and
+execution time for each so the improvement is visible side by side.
+
+Requires PostgreSQL. Never touches the application tables.
+
+Usage:
+    python -m backend.benchmarks.podcast_queries --podcasts 1000000 --users 20000
+"""
+
+import argparse
+import json
+import statistics
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.schema import CreateIndex, DropIndex
+
+from backend.core.database import Base, db_url
+from backend.models import models
+
+SCHEMA = "podcast_bench"
+
+# Indexes under test; everything else on the table is kept for both runs
+HOT_INDEXES = ("ix_podcasts_owner_created_at", "ix_podcasts_active_status")
+
+# The heaviest library owner, so list queries have many rows to page through
+POWER_USER_ID = "0" * 26
+
+QUERIES = {
+    "library_first_page": """
+        SELECT id, title, status, created_at, duration, final_podcast_url
+        FROM podcasts WHERE owner_id = :owner_id
+        ORDER BY created_at DESC, id DESC LIMIT 20
+    """,
+    "library_keyset_page": """
+        SELECT id, title, status, created_at, duration, final_podcast_url
+        FROM podcasts WHERE owner_id = :owner_id
+          AND (created_at, id) < (
+              SELECT created_at, id FROM podcasts WHERE owner_id = :owner_id
+              ORDER BY created_at DESC, id DESC OFFSET 500 LIMIT 1
+          )
+        ORDER BY created_at DESC, id DESC LIMIT 20
+    """,
+    "library_full_list": """
+        SELECT * FROM podcasts WHERE owner_id = :owner_id ORDER BY created_at DESC
+    """,
+    "active_jobs": """
+        SELECT id, owner_id, status, created_at FROM podcasts
+        WHERE status IN ('pending', 'processing')
+        ORDER BY created_at LIMIT 100
+    """,
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=db_url, help="PostgreSQL URL (defaults to DATABASE_URL)")
+    parser.add_argument("--users", type=int, default=20000)
+    parser.add_argument("--podcasts", type=int, default=1000000)
+    parser.add_argument("--power-user-podcasts", type=int, default=5000, help="Podcasts owned by the measured user")
+    parser.add_argument("--active-ratio", type=float, default=0.01, help="Fraction of podcasts pending/processing")
+    parser.add_argument("--runs", type=int, default=5, help="EXPLAIN ANALYZE runs per query; the median is reported")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch schema afterwards")
+    return parser.parse_args()
+
+
+def seed(conn, args):
+    """Create the scratch tables and fill them with generate_series."""
+    conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    # Raw SQL below resolves unqualified names through search_path
+    conn.execute(text(f"SET search_path TO {SCHEMA}, public"))
+    Base.metadata.create_all(conn, tables=[models.User.__table__, models.Podcast.__table__])
+
+    for index in models.Podcast.__table__.indexes:
+        if index.name in HOT_INDEXES:
+            conn.execute(DropIndex(index))
+
+    conn.execute(text("""
+        INSERT INTO users (id, email, auth_user_id, podcast_limit, podcasts_created)
+        SELECT lpad(i::text, 26, '0'), 'user' || i || '@bench.local', gen_random_uuid(), 100, 0
+        FROM generate_series(0, :users - 1) AS i
+    """), {"users": args.users})
+
+    # Power user first, then the rest spread uniformly over other users and the last two years
+    conn.execute(text("""
+        INSERT INTO podcasts (id, owner_id, status, title, duration, requirements, created_at, final_podcast_url)
+        SELECT
+            lpad(to_hex(i), 26, '0'),
+            CASE WHEN i < :power THEN :power_user
+                 ELSE lpad((1 + (i % (:users - 1)))::text, 26, '0') END,
+            CASE WHEN random() < :active THEN
+                     CASE WHEN random() < 0.5 THEN 'pending' ELSE 'processing' END
+                 WHEN random() < 0.05 THEN 'failed'
+                 ELSE 'complete' END,
+            'Podcast ' || i,
+            (300 + random() * 1500)::int,
+            repeat('requirements ', 40),
+            now() - random() * interval '730 days',
+            'https://bench.local/podcasts/' || i || '.mp3'
+        FROM generate_series(0, :podcasts - 1) AS i
+    """), {
+        "podcasts": args.podcasts,
+        "users": args.users,
+        "power": args.power_user_podcasts,
+        "power_user": POWER_USER_ID,
+        "active": args.active_ratio,
+    })
+    conn.execute(text("ANALYZE users"))
+    conn.execute(text("ANALYZE podcasts"))
+
+
+def create_hot_indexes(conn):
+    for index in models.Podcast.__table__.indexes:
+        if index.name in HOT_INDEXES:
+            conn.execute(CreateIndex(index))
+    conn.execute(text("ANALYZE podcasts"))
+
+
+def explain(conn, sql, runs):
+    """Return (median execution ms, top plan node) for a query."""
+    timings = []
+    node = ""
+    for _ in range(runs):
+        result = conn.execute(
+            text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}"),
+            {"owner_id": POWER_USER_ID},
+        ).scalar()
+        plan = result[0] if isinstance(result, list) else json.loads(result)[0]
+        timings.append(plan["Execution Time"])
+        node = describe(plan["Plan"])
+    return statistics.median(timings), node
+
+
+def describe(plan):
+    """Summarize a plan tree as its node types, outermost first."""
+    parts = []
+    while plan:
+        label = plan["Node Type"]
+        if "Index Name" in plan:
+            label += f" ({plan['Index Name']})"
+        parts.append(label)
+        children = plan.get("Plans") or []
+        plan = children[0] if children else None
+    return " > ".join(parts)
+
+
+def measure(conn, runs):
+    return {name: explain(conn, sql, runs) for name, sql in QUERIES.items()}
+
+
+def main():
+    args = parse_args()
+    engine = create_engine(args.database_url).execution_options(schema_translate_map={None: SCHEMA})
+
+    with engine.begin() as conn:
+        print(f"[BENCH] Seeding {args.podcasts:,} podcasts across {args.users:,} users into {SCHEMA}...")
+        seed(conn, args)
+
+    try:
+        with engine.begin() as conn:
+            conn.execute(text(f"SET search_path TO {SCHEMA}, public"))
+            before = measure(conn, args.runs)
+            create_hot_indexes(conn)
+            after = measure(conn, args.runs)
+
+        print()
+        print(f"{'query':<22} {'before ms':>10} {'after ms':>10} {'speedup':>8}")
+        for name in QUERIES:
+            before_ms, before_plan = before[name]
+            after_ms, after_plan = after[name]
+            speedup = before_ms / after_ms if after_ms else float("inf")
+            print(f"{name:<22} {before_ms:>10.2f} {after_ms:>10.2f} {speedup:>7.1f}x")
+            print(f"  before: {before_plan}")
+            print(f"  after:  {after_plan}")
+    finally:
+        if not args.keep:
+            with engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+
+if __name__ == "__main__":
+    main()
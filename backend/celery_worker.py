@@ -1 +1,19 @@
-from . import celery_app
\ No newline at end of file
+from celery.signals import worker_init, worker_process_shutdown
+
+from . import celery_app
+from backend.core import get_settings
+from backend.utils import start_worker_exporter, mark_process_dead
+
+settings = get_settings()
+
+
+@worker_init.connect
+def start_metrics_exporter(**kwargs):
+    """Expose pipeline metrics for Prometheus to scrape from each worker."""
+    if settings.METRICS_ENABLED:
+        start_worker_exporter(settings.METRICS_WORKER_PORT)
+
+
+@worker_process_shutdown.connect
+def release_process_metrics(pid=None, **kwargs):
+    mark_process_dead(pid)
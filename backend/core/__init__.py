@@ -1,6 +1,7 @@
 """Core configuration and database modules."""
 
 from .config import get_settings, Settings
-from .database import engine, SessionLocal, Base
+from .database import engine, SessionLocal, async_engine, AsyncSessionLocal, Base
+from .migrations import run_migrations
 
-__all__ = ["get_settings", "Settings", "engine", "SessionLocal", "Base"]
+__all__ = ["get_settings", "Settings", "engine", "SessionLocal", "async_engine", "AsyncSessionLocal", "Base", "run_migrations"]
@@ -4,6 +4,7 @@ Centralized configuration management for the backend.
 """
 
 import os
+import tempfile
 from functools import lru_cache
 
 
@@ -16,17 +17,30 @@ class Settings:
     SUPABASE_JWT_SECRET: str = os.getenv("SUPABASE_JWT_SECRET", "")
     SUPABASE_JWT_AUDIENCE: str = os.getenv("SUPABASE_JWT_AUDIENCE", "authenticated")  # Default to 'authenticated'
     DATABASE_URL: str = os.getenv("DATABASE_URL", "")
+    DB_AUTO_MIGRATE: bool = os.getenv("DB_AUTO_MIGRATE", "true").lower() == "true"  # Run Alembic upgrade on API startup
 
     # AWS S3
     AWS_ACCESS_KEY_ID: str = os.getenv("AWS_ACCESS_KEY_ID", "")
     AWS_SECRET_ACCESS_KEY: str = os.getenv("AWS_SECRET_ACCESS_KEY", "")
     AWS_S3_BUCKET_NAME: str = os.getenv("AWS_S3_BUCKET_NAME", "")
     AWS_REGION: str = os.getenv("AWS_REGION", "us-east-1")
+    S3_UPLOAD_CHUNK_MB: int = int(os.getenv("S3_UPLOAD_CHUNK_MB", "8"))  # Multipart part size
+    S3_UPLOAD_THRESHOLD_MB: int = int(os.getenv("S3_UPLOAD_THRESHOLD_MB", "8"))  # Multipart above this size
+    S3_UPLOAD_MAX_CONCURRENCY: int = int(os.getenv("S3_UPLOAD_MAX_CONCURRENCY", "4"))  # Parallel part uploads
+    S3_UPLOAD_DURING_CONCAT: bool = os.getenv("S3_UPLOAD_DURING_CONCAT", "false").lower() == "true"  # ffmpeg concat only
+    PRESIGNED_URL_EXPIRATION_SECONDS: int = int(os.getenv("PRESIGNED_URL_EXPIRATION_SECONDS", "3600"))  # Download URL lifetime
+    PRESIGNED_URL_REFRESH_SECONDS: int = int(os.getenv("PRESIGNED_URL_REFRESH_SECONDS", "1800"))  # Re-sign once less than this is left
+    PRESIGNED_URL_CACHE_SIZE: int = int(os.getenv("PRESIGNED_URL_CACHE_SIZE", "10000"))
 
     # Application
     ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
     API_GENERATION_ENABLED: bool = os.getenv("API_GENERATION_ENABLED", "true").lower() == "true"
     RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"  # Enabled by default
+    RATE_LIMIT_LEASE_SECONDS: float = float(os.getenv("RATE_LIMIT_LEASE_SECONDS", "2"))  # How long a process holds leased tokens
+    AUTH_USER_CACHE_TTL_SECONDS: float = float(os.getenv("AUTH_USER_CACHE_TTL_SECONDS", "300"))  # auth_user_id -> DB user id
+    AUTH_USER_CACHE_MAX_SIZE: int = int(os.getenv("AUTH_USER_CACHE_MAX_SIZE", "10000"))
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"  # /metrics and the worker exporter
+    METRICS_WORKER_PORT: int = int(os.getenv("METRICS_WORKER_PORT", "9101"))  # One port per worker on a host
 
     # Redis (optional)
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379")
@@ -44,6 +58,62 @@ class Settings:
     # File upload
     MAX_FILE_SIZE_MB: int = 10
 
+    # ElevenLabs credit cache
+    ELEVENLABS_CREDITS_TTL_SECONDS: float = float(os.getenv("ELEVENLABS_CREDITS_TTL_SECONDS", "60"))
+    ELEVENLABS_CREDITS_REFRESH_SECONDS: float = float(os.getenv("ELEVENLABS_CREDITS_REFRESH_SECONDS", "30"))
+    ELEVENLABS_RESERVATION_TTL_SECONDS: float = float(os.getenv("ELEVENLABS_RESERVATION_TTL_SECONDS", "2100"))  # Renewed at each stage; longer than the slowest
+
+    # Podcast scheduling (fair share across users)
+    SCHEDULER_ENABLED: bool = os.getenv("SCHEDULER_ENABLED", "true").lower() == "true"
+    SCHEDULER_MAX_INFLIGHT: int = int(os.getenv("SCHEDULER_MAX_INFLIGHT", "4"))  # Podcasts generating at once, all workers
+    SCHEDULER_MAX_QUEUED_PER_USER: int = int(os.getenv("SCHEDULER_MAX_QUEUED_PER_USER", "5"))  # 0 = unlimited
+    SCHEDULER_SHORT_DOCUMENT_MB: float = float(os.getenv("SCHEDULER_SHORT_DOCUMENT_MB", "2"))  # PDFs up to this size get priority
+    SCHEDULER_LONG_LANE_EVERY: int = int(os.getenv("SCHEDULER_LONG_LANE_EVERY", "3"))  # Serve long documents at least every Nth dispatch
+    SCHEDULER_INFLIGHT_LEASE_SECONDS: float = float(os.getenv("SCHEDULER_INFLIGHT_LEASE_SECONDS", "2400"))
+    SCHEDULER_DEFAULT_JOB_SECONDS: float = float(os.getenv("SCHEDULER_DEFAULT_JOB_SECONDS", "180"))  # ETA before any job finished
+    TTS_GLOBAL_MAX_CONCURRENCY: int = int(os.getenv("TTS_GLOBAL_MAX_CONCURRENCY", "8"))  # ElevenLabs requests in flight, all workers
+    TTS_SLOT_LEASE_SECONDS: float = float(os.getenv("TTS_SLOT_LEASE_SECONDS", "120"))
+    TTS_SLOT_ACQUIRE_TIMEOUT_SECONDS: float = float(os.getenv("TTS_SLOT_ACQUIRE_TIMEOUT_SECONDS", "300"))  # Then the line's retry takes over
+
+    # Gemini
+    GEMINI_MODEL: str = os.getenv("GEMINI_MODEL", "gemini-2.0-flash-exp")
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))  # Independent prompts in flight
+    LLM_TIMEOUT_SECONDS: float = float(os.getenv("LLM_TIMEOUT_SECONDS", "120"))  # Per-call timeout
+    LLM_MAX_RETRIES: int = int(os.getenv("LLM_MAX_RETRIES", "2"))
+    SCRIPT_STREAMING_ENABLED: bool = os.getenv("SCRIPT_STREAMING_ENABLED", "false").lower() == "true"  # Synthesize lines as the script streams in
+
+    # Document processing
+    PDF_MAX_CHARS: int = int(os.getenv("PDF_MAX_CHARS", "1000000"))  # Safety cap on extracted text
+    PDF_PROCESS_POOL_MIN_PAGES: int = int(os.getenv("PDF_PROCESS_POOL_MIN_PAGES", "200"))  # Use a process pool from this size (not in prefork workers; see task_routes)
+    PDF_PROCESS_POOL_WORKERS: int = int(os.getenv("PDF_PROCESS_POOL_WORKERS", "0"))  # 0 = CPU count
+    SUMMARY_CHUNK_CHARS: int = int(os.getenv("SUMMARY_CHUNK_CHARS", "30000"))  # Max chars per summarization prompt
+
+    # Text-to-speech synthesis
+    TTS_MAX_CONCURRENCY: int = int(os.getenv("TTS_MAX_CONCURRENCY", "4"))  # Lines synthesized in parallel
+    TTS_MAX_RETRIES: int = int(os.getenv("TTS_MAX_RETRIES", "3"))  # Retries per line before failing the task
+    TTS_RETRY_BACKOFF_SECONDS: float = float(os.getenv("TTS_RETRY_BACKOFF_SECONDS", "1.0"))
+    TTS_QUEUE_SIZE: int = int(os.getenv("TTS_QUEUE_SIZE", "4"))  # Streamed script lines buffered ahead of synthesis
+    TTS_SEGMENT_MAX_CHARS: int = int(os.getenv("TTS_SEGMENT_MAX_CHARS", "1000"))  # Per request; 0 = one request per script line
+
+    # Progressive HLS output while synthesis is running
+    HLS_STREAMING_ENABLED: bool = os.getenv("HLS_STREAMING_ENABLED", "true").lower() == "true"
+    HLS_PREFIX: str = os.getenv("HLS_PREFIX", "podcasts/hls/")
+    HLS_TARGET_DURATION: int = int(os.getenv("HLS_TARGET_DURATION", "30"))
+
+    # Final audio concatenation
+    AUDIO_CONCAT_ENGINE: str = os.getenv("AUDIO_CONCAT_ENGINE", "native")  # "native" (in-process) or "ffmpeg"
+
+    # Pipeline checkpoints
+    PIPELINE_WORK_DIR: str = os.getenv("PIPELINE_WORK_DIR", os.path.join(tempfile.gettempdir(), "podcast_pipeline"))
+    PIPELINE_ARTIFACT_PREFIX: str = os.getenv("PIPELINE_ARTIFACT_PREFIX", "podcasts/artifacts/")
+
+    # TTS segment cache
+    TTS_CACHE_ENABLED: bool = os.getenv("TTS_CACHE_ENABLED", "true").lower() == "true"
+    TTS_CACHE_DIR: str = os.getenv("TTS_CACHE_DIR", os.path.join(tempfile.gettempdir(), "podcast_tts_cache"))
+    TTS_CACHE_MAX_MB: int = int(os.getenv("TTS_CACHE_MAX_MB", "2048"))  # Local tier size budget
+    TTS_CACHE_S3_ENABLED: bool = os.getenv("TTS_CACHE_S3_ENABLED", "true").lower() == "true"
+    TTS_CACHE_S3_PREFIX: str = os.getenv("TTS_CACHE_S3_PREFIX", "tts-cache/")
+
     # Email Configuration (SMTP)
     SMTP_HOST: str = os.getenv("SMTP_HOST", "smtp.gmail.com")
     SMTP_PORT: int = int(os.getenv("SMTP_PORT", "587"))
@@ -1,5 +1,7 @@
 import os
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
@@ -31,5 +33,40 @@ engine = create_engine(
 )
 # each instance of session local will be a new database session
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def to_async_url(url: str) -> tuple[str, str]:
+    """
+    Rewrite a sync PostgreSQL URL for asyncpg.
+
+    Returns:
+        Tuple of (async URL, ssl mode); asyncpg takes SSL via connect_args instead of ?sslmode=
+    """
+    async_url = make_url(url)
+    sslmode = async_url.query.get("sslmode", "require")
+    async_url = async_url.set(
+        drivername="postgresql+asyncpg",
+        query={key: value for key, value in async_url.query.items() if key != "sslmode"}
+    )
+    return async_url.render_as_string(hide_password=False), sslmode
+
+
+async_db_url, async_sslmode = to_async_url(db_url)
+
+# Async engine for the API request path; Celery workers keep the sync engine above
+async_engine = create_async_engine(
+    async_db_url,
+    pool_size=20,
+    max_overflow=10,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    echo=os.getenv("SQL_ECHO", "false").lower() == "true",
+    connect_args={
+        'ssl': async_sslmode,             # Same SSL requirement as the sync engine
+        'timeout': 10,                    # Connection timeout in seconds
+    }
+)
+# expire_on_commit=False so committed objects can still be serialized in async endpoints
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
 # this base class will be inherited by all db models
 Base = declarative_base()
\ No newline at end of file
@@ -0,0 +1,48 @@
+"""
+Database schema migrations.
+
+Replaces Base.metadata.create_all: the schema is owned by the Alembic
+revisions in backend/migrations, and the API upgrades to head on startup.
+"""
+
+import logging
+import os
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+
+from .database import engine
+
+logger = logging.getLogger(__name__)
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "alembic.ini")
+
+# Revision matching the schema that create_all used to build
+BASELINE_REVISION = "0001"
+
+
+def get_alembic_config() -> Config:
+    """Build the Alembic config for backend/alembic.ini without reconfiguring app logging."""
+    config = Config(ALEMBIC_INI)
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def run_migrations() -> None:
+    """
+    Upgrade the database to the latest revision.
+
+    Databases created by the old create_all bootstrap have tables but no
+    alembic_version row; they are stamped at the baseline first so only the
+    later revisions run against them.
+    """
+    config = get_alembic_config()
+
+    tables = set(inspect(engine).get_table_names())
+    if "alembic_version" not in tables and "podcasts" in tables:
+        logger.info(f"[MIGRATIONS] Existing schema without version table, stamping {BASELINE_REVISION}")
+        command.stamp(config, BASELINE_REVISION)
+
+    command.upgrade(config, "head")
+    logger.info("[MIGRATIONS] ✓ Database schema is up to date")
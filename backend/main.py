@@ -3,17 +3,27 @@ Podcast Pro Backend API.
 FastAPI application for podcast creation and management.
 """
 
+import json
 import logging
 from typing import Annotated
 
-from fastapi import FastAPI, Depends, HTTPException, Header, Request, Body
-from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
+import redis
 
-from backend.core import get_settings, SessionLocal, engine
-from backend.services import auth_service, s3_service, get_elevenlabs_credits, has_sufficient_credits
-from backend.utils import limiter, setup_rate_limiting, RATE_LIMITS
-from backend.models import models, schemas, crud
+from fastapi import FastAPI, Depends, HTTPException, Header, Request, Body, Response, Query
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core import get_settings, AsyncSessionLocal, run_migrations
+from backend.services import (
+    auth_service, s3_service, get_elevenlabs_credits, has_sufficient_credits, reserve_credits,
+    s3_key_from_url, stream_progress, format_sse, TERMINAL_STATUSES,
+    podcast_scheduler, QueueFullError
+)
+from backend.utils import limiter, setup_rate_limiting, RATE_LIMITS, setup_metrics
+from backend.models import models, schemas, async_crud
+from backend.pipeline import sign_playlist
 from . import tasks
 
 # Configure logging
@@ -22,8 +32,9 @@ logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
-# Create database tables
-models.Base.metadata.create_all(bind=engine)
+# Bring the schema up to date (see backend/migrations)
+if settings.DB_AUTO_MIGRATE:
+    run_migrations()
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -44,28 +55,41 @@ app.add_middleware(
 # Setup rate limiting
 setup_rate_limiting(app)
 
+# Request metrics and the /metrics endpoint for Prometheus
+if settings.METRICS_ENABLED:
+    setup_metrics(app)
+
 
 # ============================================================================
 # DEPENDENCIES
 # ============================================================================
 
-def get_db():
-    """Database session dependency."""
-    db = SessionLocal()
-    try:
+async def get_db():
+    """Async database session dependency."""
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def get_current_user(
+class AuthenticatedUser:
+    """Identity from a verified token plus the resolved database user id."""
+
+    def __init__(self, user_id: str, email: str, metadata: dict, db_user_id: str | None = None):
+        self.id = user_id
+        self.email = email
+        self.user_metadata = metadata
+        self.db_user_id = db_user_id
+
+
+async def get_current_user(
+    request: Request,
     authorization: Annotated[str, Header()] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Extract and validate JWT token, return authenticated user.
 
-    Automatically creates user in database on first API call.
+    Automatically creates user in database on first API call; afterwards the
+    database user id comes from an in-process cache keyed by auth user id.
     Works with all Supabase auth providers (Google, GitHub, email, etc.)
     """
     if not authorization:
@@ -84,23 +108,19 @@ def get_current_user(
         user_id, email = auth_service.extract_user_info(token_claims)
 
         # Create a user object from token claims
-        class AuthenticatedUser:
-            def __init__(self, user_id: str, email: str, metadata: dict):
-                self.id = user_id
-                self.email = email
-                self.user_metadata = metadata
-
         user = AuthenticatedUser(
             user_id=user_id,
             email=email,
             metadata=token_claims.get("user_metadata", {})
         )
 
-        # Auto-create or get database user on first API call
-        # Uses atomic get_or_create to avoid race conditions
+        # Resolve (or on first API call, create) the database user
+        # Cached by auth user id; creation uses atomic get_or_create to avoid race conditions
         if db and email:
-            crud.get_or_create_user(db, email=email, auth_id=user_id)
-            logger.info(f"[AUTH] ✓ User ensured in database: {email}")
+            user.db_user_id = await async_crud.resolve_user_id(db, email=email, auth_id=user_id)
+
+        # Rate limit authenticated routes per user rather than per IP
+        request.state.rate_limit_user = user.db_user_id or user.id
 
         return user
 
@@ -111,13 +131,69 @@ def get_current_user(
         raise HTTPException(status_code=401, detail="Authentication failed") from e
 
 
+def podcast_stream_url(podcast) -> str | None:
+    """
+    Presigned streaming URL for a completed podcast, or None.
+
+    Served from the S3 service's presigned URL cache, so repeated reads and
+    list pages don't re-sign. Works on ORM objects and list rows alike.
+    """
+    if not (podcast.final_podcast_url and podcast.status == models.PodcastStatus.COMPLETE.value):
+        return None
+    try:
+        # S3 key format: podcasts/podcast_{id}.mp3
+        return s3_service.generate_presigned_download_url(f"podcasts/podcast_{podcast.id}.mp3")
+    except Exception as e:
+        # Still return the podcast, but without stream_url
+        logger.error(f"[PODCAST] Failed to generate stream URL for podcast {podcast.id}: {str(e)}")
+        return None
+
+
+def enqueue_podcast(podcast) -> None:
+    """
+    Hand a podcast to the fair-share scheduler, which starts its Celery task when a slot frees up.
+
+    Falls back to enqueueing the task directly when scheduling is disabled or Redis is unreachable.
+
+    Raises:
+        QueueFullError: If the owner already has the maximum number of podcasts waiting
+    """
+    start_job = tasks.create_podcast_task.delay
+    if not settings.SCHEDULER_ENABLED:
+        start_job(podcast.id)
+        return
+
+    document_bytes = None
+    try:
+        document_bytes = s3_service.get_object_size(s3_key_from_url(podcast.original_file_url))
+    except Exception as e:
+        logger.warning(f"[PODCAST] Could not size document for podcast {podcast.id}: {str(e)}")
+
+    try:
+        podcast_scheduler.submit(podcast.id, podcast.owner_id, document_bytes, start_job)
+    except redis.RedisError as e:
+        logger.warning(f"[PODCAST] Scheduler unavailable, enqueueing podcast {podcast.id} directly: {str(e)}")
+        start_job(podcast.id)
+
+
+def podcast_queue_status(podcast) -> tuple:
+    """Return (queue_position, eta_seconds) for a pending or processing podcast, or (None, None)."""
+    if not settings.SCHEDULER_ENABLED or podcast.status in TERMINAL_STATUSES:
+        return None, None
+    try:
+        return podcast_scheduler.queue_status(podcast.id) or (None, None)
+    except redis.RedisError as e:
+        logger.warning(f"[PODCAST] Could not read queue status for podcast {podcast.id}: {str(e)}")
+        return None, None
+
+
 # ============================================================================
 # ENDPOINTS
 # ============================================================================
 
 @app.get("/health")
 @limiter.limit(RATE_LIMITS["health"])
-def health_check(request: Request):
+async def health_check(request: Request):
     """Health check endpoint."""
     return {"status": "healthy"}
 
@@ -126,22 +202,23 @@ def health_check(request: Request):
 
 @app.get("/elevenlabs/credits", response_model=dict)
 @limiter.limit(RATE_LIMITS["get_credits"])
-def get_global_credits(request: Request):
+async def get_global_credits(request: Request):
     """
     Get global ElevenLabs account credits and usage information.
-    This is for admin/monitoring purposes only.
+    This is for admin/monitoring purposes only. Served from the credit cache.
 
     Returns:
         dict: Account credits information including:
             - character_count: Characters used
             - character_limit: Total character limit
-            - characters_available: Characters remaining
+            - characters_available: Characters remaining, net of reservations
+            - characters_reserved: Characters reserved for enqueued podcasts
             - usage_percentage: Percentage of quota used
             - status: Account status
     """
     try:
         logger.info("[ELEVENLABS] Global credits request received")
-        credits = get_elevenlabs_credits()
+        credits = await run_in_threadpool(get_elevenlabs_credits)
         logger.info(f"[ELEVENLABS] ✓ Global credits returned. Available: {credits['characters_available']}")
         return credits
     except Exception as e:
@@ -154,7 +231,7 @@ def get_global_credits(request: Request):
 
 @app.post("/uploads/sign-url/", response_model=dict)
 @limiter.limit(RATE_LIMITS["sign_url"])
-def get_presigned_upload_url(
+async def get_presigned_upload_url(
     request: Request,
     body: schemas.SignedURLRequest,
     current_user=Depends(get_current_user),
@@ -168,7 +245,8 @@ def get_presigned_upload_url(
     """
     try:
         logger.info(f"[UPLOAD] Presigned URL request from user {current_user.id} ({current_user.email}) for file: {body.filename}")
-        response = s3_service.generate_presigned_url(
+        response = await run_in_threadpool(
+            s3_service.generate_presigned_url,
             user_id=current_user.id,
             filename=body.filename
         )
@@ -182,11 +260,11 @@ def get_presigned_upload_url(
 
 @app.post("/podcasts/", response_model=schemas.Podcast, status_code=202)
 @limiter.limit(RATE_LIMITS["create_podcast"])
-def create_podcast(
+async def create_podcast(
     request: Request,
     podcast: schemas.PodcastCreate,
     current_user=Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Create a new podcast with mocked async processing.
@@ -196,16 +274,20 @@ def create_podcast(
     """
     logger.info(f"[PODCAST] Creation request from user {current_user.id} ({current_user.email})")
 
-    # Get or create user
-    db_user = crud.get_user_by_email(db, email=current_user.email)
+    # User resolved during authentication; a primary-key get hits the session identity map on a cache miss
+    db_user = await async_crud.get_user(db, current_user.db_user_id)
+    if db_user is None:
+        # Stale cache entry for a user row that no longer exists
+        async_crud.user_id_cache.invalidate(str(current_user.id))
+        raise HTTPException(status_code=401, detail="User not found")
 
     logger.info(f"[PODCAST] User found/created: {db_user.id}. Podcasts: {db_user.podcasts_created}/{db_user.podcast_limit}")
 
     # Check if global ElevenLabs credits are available
     try:
-        if not has_sufficient_credits(required_characters=5000):
+        if not await run_in_threadpool(has_sufficient_credits, required_characters=5000):
             logger.warning("[PODCAST] ✗ Insufficient global ElevenLabs credits")
-            credits_info = get_elevenlabs_credits()
+            credits_info = await run_in_threadpool(get_elevenlabs_credits)
             raise HTTPException(
                 status_code=402,
                 detail=f"Insufficient ElevenLabs credits. Available: {credits_info['characters_available']}, Required: ~5000. Please purchase more credits."
@@ -227,56 +309,147 @@ def create_podcast(
             detail="You have reached your podcast creation limit"
         )
 
+    # Admission control: cap how many podcasts one user can have waiting
+    if settings.SCHEDULER_ENABLED:
+        try:
+            queue_full = await run_in_threadpool(podcast_scheduler.queue_full, db_user.id)
+        except redis.RedisError as e:
+            logger.warning(f"[PODCAST] Could not check queue depth: {str(e)}")
+            queue_full = False
+        if queue_full:
+            logger.warning(f"[PODCAST] ✗ User {current_user.email} already has the maximum number of podcasts queued")
+            raise HTTPException(
+                status_code=429,
+                detail="You already have podcasts waiting to be generated. Please wait for them to finish."
+            )
+
     # Create podcast in database
-    db_podcast = crud.create_podcast_for_user(db=db, podcast=podcast, user_id=db_user.id)
+    db_podcast = await async_crud.create_podcast_for_user(db=db, podcast=podcast, user_id=db_user.id)
     logger.info(f"[PODCAST] ✓ Podcast created in database. ID: {db_podcast.id}, File URL: {db_podcast.original_file_url}")
 
-    # Trigger async podcast generation task
-    logger.info(f"[PODCAST] ✓ Triggering async generation task for podcast {db_podcast.id}")
-    logger.info(f"[PODCAST] Current status: {db_podcast.status}")
-    tasks.create_podcast_task.delay(db_podcast.id)
-
+    # Queue podcast generation; the scheduler starts the task when it is this podcast's turn
+    logger.info(f"[PODCAST] ✓ Queueing generation for podcast {db_podcast.id}")
+    try:
+        await run_in_threadpool(enqueue_podcast, db_podcast)
+    except QueueFullError as e:
+        # Lost a race with another request from the same user
+        db_podcast.status = models.PodcastStatus.FAILED.value
+        await db.commit()
+        raise HTTPException(
+            status_code=429,
+            detail="You already have podcasts waiting to be generated. Please wait for them to finish."
+        ) from e
+    response = schemas.Podcast.model_validate(db_podcast)
+    response.queue_position, response.eta_seconds = await run_in_threadpool(podcast_queue_status, db_podcast)
+    # Held until the podcast starts, after which the worker keeps renewing it
+    await run_in_threadpool(reserve_credits, db_podcast.id, characters=5000, wait_seconds=response.eta_seconds or 0)
     logger.info(f"[PODCAST] ✓ Response sent to user {current_user.email}. Podcast ID: {db_podcast.id}")
-    return db_podcast
+    return response
 
 
 @app.get("/podcasts/{podcast_id}", response_model=schemas.Podcast)
 @limiter.limit(RATE_LIMITS["get_podcast"])
-def get_podcast(request: Request, podcast_id: str, db: Session = Depends(get_db)):
+async def get_podcast(request: Request, podcast_id: str, db: AsyncSession = Depends(get_db)):
     """Retrieve a specific podcast by ID with secure streaming URL."""
-    db_podcast = crud.get_podcast(db, podcast_id=podcast_id)
+    db_podcast = await async_crud.get_podcast(db, podcast_id=podcast_id)
     if db_podcast is None:
         raise HTTPException(status_code=404, detail="Podcast not found")
 
-    # Generate presigned URL for streaming if podcast is complete
-    if db_podcast.final_podcast_url and db_podcast.status == "complete":
-        try:
-            # Extract S3 key from the stored URL (format: podcasts/podcast_{id}.mp3)
-            s3_key = f"podcasts/podcast_{db_podcast.id}.mp3"
-            stream_url = s3_service.generate_presigned_download_url(s3_key, expiration=3600)
-            # Add stream_url to response (convert to dict to add the field)
-            podcast_dict = db_podcast.__dict__.copy()
-            podcast_dict['stream_url'] = stream_url
-            return podcast_dict
-        except Exception as e:
-            logger.error(f"[PODCAST] Failed to generate stream URL for podcast {podcast_id}: {str(e)}")
-            # Still return the podcast, but without stream_url
-            podcast_dict = db_podcast.__dict__.copy()
-            podcast_dict['stream_url'] = None
-            return podcast_dict
-
-    return db_podcast
-
-
-@app.get("/podcasts/", response_model=list[schemas.Podcast])
+    response = schemas.Podcast.model_validate(db_podcast)
+
+    # Progressive HLS playlist, available as soon as the first segments are synthesized
+    if db_podcast.playlist_key:
+        response.playlist_url = str(request.url_for("get_podcast_playlist", podcast_id=db_podcast.id))
+
+    response.stream_url = await run_in_threadpool(podcast_stream_url, db_podcast)
+    response.queue_position, response.eta_seconds = await run_in_threadpool(podcast_queue_status, db_podcast)
+    return response
+
+
+@app.get("/podcasts/{podcast_id}/playlist.m3u8", name="get_podcast_playlist")
+@limiter.limit(RATE_LIMITS["get_playlist"])
+async def get_podcast_playlist(request: Request, podcast_id: str, db: AsyncSession = Depends(get_db)):
+    """
+    Serve the progressive HLS playlist for a podcast.
+
+    Segment URIs are rewritten into presigned S3 URLs, so players can fetch
+    segments from the private bucket directly.
+    """
+    db_podcast = await async_crud.get_podcast(db, podcast_id=podcast_id)
+    if db_podcast is None or not db_podcast.playlist_key:
+        raise HTTPException(status_code=404, detail="Playlist not found")
+
+    try:
+        playlist_text = await run_in_threadpool(s3_service.get_object_text, db_podcast.playlist_key)
+        base_key = db_podcast.playlist_key.rsplit("/", 1)[0] + "/"
+        signed = await run_in_threadpool(
+            sign_playlist, playlist_text, base_key,
+            s3_service.generate_presigned_download_url
+        )
+    except Exception as e:
+        logger.error(f"[PODCAST] Failed to build playlist for podcast {podcast_id}: {str(e)}")
+        raise HTTPException(status_code=503, detail="Playlist temporarily unavailable") from e
+
+    return Response(
+        content=signed,
+        media_type="application/vnd.apple.mpegurl",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+
+@app.get("/podcasts/{podcast_id}/events")
+@limiter.limit(RATE_LIMITS["podcast_events"])
+async def stream_podcast_events(request: Request, podcast_id: str, db: AsyncSession = Depends(get_db)):
+    """
+    Stream stage and progress events for a podcast as Server-Sent Events.
+
+    Events are published by the worker to Redis pub/sub. The stream ends once
+    the podcast completes or fails; finished podcasts get a single event.
+    """
+    db_podcast = await async_crud.get_podcast(db, podcast_id=podcast_id)
+    # Return the connection to the pool rather than holding it for the life of the stream
+    await db.close()
+    if db_podcast is None:
+        raise HTTPException(status_code=404, detail="Podcast not found")
+
+    if db_podcast.status in TERMINAL_STATUSES:
+        event = json.dumps({"podcast_id": db_podcast.id, "status": db_podcast.status, "stage": db_podcast.pipeline_stage})
+        return StreamingResponse(iter([format_sse(event)]), media_type="text/event-stream")
+
+    return StreamingResponse(
+        stream_progress(podcast_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.get("/podcasts/", response_model=schemas.PodcastPage)
 @limiter.limit(RATE_LIMITS["list_podcasts"])
-def list_user_podcasts(
+async def list_user_podcasts(
     request: Request,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
     current_user=Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """Retrieve all podcasts for the current user."""
-    db_user = crud.get_user_by_email(db, email=current_user.email)
-    if not db_user:
-        return []
-    return crud.get_podcasts_by_user(db=db, user_id=db_user.id)
+    """
+    Retrieve one page of the current user's podcasts, newest first.
+
+    Pass the returned next_cursor back as ?cursor= to fetch the following page.
+    """
+    if not current_user.db_user_id:
+        return schemas.PodcastPage(items=[])
+
+    try:
+        rows, next_cursor = await async_crud.get_podcast_page_by_user(db=db, user_id=current_user.db_user_id, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    stream_urls = await run_in_threadpool(lambda: [podcast_stream_url(row) for row in rows])
+    return schemas.PodcastPage(
+        items=[
+            schemas.PodcastListItem.model_validate(row).model_copy(update={"stream_url": stream_url})
+            for row, stream_url in zip(rows, stream_urls)
+        ],
+        next_cursor=next_cursor,
+    )
@@ -0,0 +1,53 @@
+"""Initial schema: users and podcasts
+
+Matches the tables previously created by Base.metadata.create_all. Databases
+that were bootstrapped that way are stamped at this revision automatically
+(see backend.core.migrations.run_migrations).
+
+Revision ID: 0001
+Revises:
+Create Date: 2025-10-01 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.String(length=26), primary_key=True),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("auth_user_id", sa.UUID(as_uuid=True), nullable=False, unique=True),
+        sa.Column("podcast_limit", sa.Integer()),
+        sa.Column("podcasts_created", sa.Integer()),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "podcasts",
+        sa.Column("id", sa.String(length=26), primary_key=True),
+        sa.Column("status", sa.String()),
+        sa.Column("original_file_url", sa.String(), nullable=True),
+        sa.Column("final_podcast_url", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("title", sa.String(), nullable=True),
+        sa.Column("duration", sa.Integer()),
+        sa.Column("requirements", sa.String(), nullable=True),
+        sa.Column("owner_id", sa.String(length=26), sa.ForeignKey("users.id")),
+    )
+    op.create_index("ix_podcasts_id", "podcasts", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_podcasts_id", table_name="podcasts")
+    op.drop_table("podcasts")
+    op.drop_index("ix_users_email", table_name="users")
+    op.drop_index("ix_users_id", table_name="users")
+    op.drop_table("users")
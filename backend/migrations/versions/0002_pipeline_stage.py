@@ -0,0 +1,33 @@
+"""Podcast pipeline checkpoint marker
+
+Adds podcasts.pipeline_stage, the last completed generation stage, which
+lets a retried task resume where it failed. Skipped if a create_all
+bootstrap already added the column.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-10-01 00:00:01
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def _podcast_columns() -> set:
+    """Columns already on podcasts, or an empty set in offline mode."""
+    if context.is_offline_mode():
+        return set()
+    return {column["name"] for column in sa.inspect(op.get_bind()).get_columns("podcasts")}
+
+
+def upgrade() -> None:
+    if "pipeline_stage" not in _podcast_columns():
+        op.add_column("podcasts", sa.Column("pipeline_stage", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("podcasts", "pipeline_stage")
@@ -0,0 +1,33 @@
+"""Progressive HLS playlist key
+
+Adds podcasts.playlist_key, the S3 key of the playlist published while a
+podcast is being synthesized. Skipped if a create_all bootstrap already
+added the column.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-10-01 00:00:02
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def _podcast_columns() -> set:
+    """Columns already on podcasts, or an empty set in offline mode."""
+    if context.is_offline_mode():
+        return set()
+    return {column["name"] for column in sa.inspect(op.get_bind()).get_columns("podcasts")}
+
+
+def upgrade() -> None:
+    if "playlist_key" not in _podcast_columns():
+        op.add_column("podcasts", sa.Column("playlist_key", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("podcasts", "playlist_key")
@@ -0,0 +1,48 @@
+"""Document fingerprints for upload deduplication
+
+Adds podcasts.content_fingerprint (indexed) and the document_fingerprints
+table mapping a fingerprint to the completed podcast that can be reused.
+Objects a create_all bootstrap already created are skipped.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-10-01 00:00:03
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def _existing():
+    """Return (podcast columns, tables) already present, or empty sets in offline mode."""
+    if context.is_offline_mode():
+        return set(), set()
+    inspector = sa.inspect(op.get_bind())
+    columns = {column["name"] for column in inspector.get_columns("podcasts")}
+    return columns, set(inspector.get_table_names())
+
+
+def upgrade() -> None:
+    columns, tables = _existing()
+
+    if "content_fingerprint" not in columns:
+        op.add_column("podcasts", sa.Column("content_fingerprint", sa.String(length=64), nullable=True))
+        op.create_index("ix_podcasts_content_fingerprint", "podcasts", ["content_fingerprint"])
+
+    if "document_fingerprints" not in tables:
+        op.create_table(
+            "document_fingerprints",
+            sa.Column("fingerprint", sa.String(length=64), primary_key=True),
+            sa.Column("podcast_id", sa.String(length=26), sa.ForeignKey("podcasts.id"), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("document_fingerprints")
+    op.drop_index("ix_podcasts_content_fingerprint", table_name="podcasts")
+    op.drop_column("podcasts", "content_fingerprint")
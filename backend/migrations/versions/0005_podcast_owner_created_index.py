@@ -0,0 +1,36 @@
+"""Index for keyset pagination of the podcast library
+
+ix_podcasts_owner_created_id on (owner_id, created_at, id) serves
+GET /podcasts/ and its (created_at, id) cursor. On PostgreSQL it is built
+CONCURRENTLY so the table stays writable.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-10-01 00:00:04
+"""
+from alembic import op
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    concurrently = op.get_context().dialect.name == "postgresql"
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_podcasts_owner_created_id",
+            "podcasts",
+            ["owner_id", "created_at", "id"],
+            postgresql_concurrently=concurrently,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    concurrently = op.get_context().dialect.name == "postgresql"
+
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_podcasts_owner_created_id", table_name="podcasts", postgresql_concurrently=concurrently, if_exists=True)
@@ -0,0 +1,64 @@
+"""Indexes for the podcast library and active-job queries
+
+- ix_podcasts_owner_created_at: (owner_id, created_at DESC, id DESC) serves the
+  library list and its keyset pagination as an index range scan with no sort.
+  It replaces ix_podcasts_owner_created_id from revision 0005, which is
+  dropped so inserts don't maintain two indexes on the same columns.
+- ix_podcasts_active_status: partial index on pending/processing rows, which
+  stays small because nearly all podcasts end up complete or failed.
+
+On PostgreSQL both are built and the old index dropped CONCURRENTLY so the
+table stays writable.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2025-10-01 00:00:05
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+ACTIVE_STATUSES = ("pending", "processing")
+
+
+def upgrade() -> None:
+    concurrently = op.get_context().dialect.name == "postgresql"
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_podcasts_owner_created_at",
+            "podcasts",
+            ["owner_id", sa.text("created_at DESC"), sa.text("id DESC")],
+            postgresql_concurrently=concurrently,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_podcasts_active_status",
+            "podcasts",
+            ["status", "created_at"],
+            postgresql_where=sa.text(
+                "status IN ({})".format(", ".join(f"'{status}'" for status in ACTIVE_STATUSES))
+            ),
+            postgresql_concurrently=concurrently,
+            if_not_exists=True,
+        )
+        op.drop_index("ix_podcasts_owner_created_id", table_name="podcasts", postgresql_concurrently=concurrently, if_exists=True)
+
+
+def downgrade() -> None:
+    concurrently = op.get_context().dialect.name == "postgresql"
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_podcasts_owner_created_id",
+            "podcasts",
+            ["owner_id", "created_at", "id"],
+            postgresql_concurrently=concurrently,
+            if_not_exists=True,
+        )
+        op.drop_index("ix_podcasts_active_status", table_name="podcasts", postgresql_concurrently=concurrently, if_exists=True)
+        op.drop_index("ix_podcasts_owner_created_at", table_name="podcasts", postgresql_concurrently=concurrently, if_exists=True)
@@ -1,16 +1,19 @@
 """Database models, schemas, and CRUD operations."""
 
-from .models import User, Podcast, PodcastStatus
+from .models import User, Podcast, PodcastStatus, DocumentFingerprint
 from .schemas import (
     SignedURLRequest, PodcastBase, PodcastCreate, Podcast as PodcastSchema,
+    PodcastListItem, PodcastPage,
     UserBase, UserCreate, User as UserSchema,
     SignupRequest, LoginRequest, AuthResponse,
     ForgotPasswordRequest, ResetPasswordRequest,
     UpdatePasswordRequest, LinkPasswordRequest
 )
 from .crud import (
-    get_user_by_email, create_user, get_or_create_user,
-    create_podcast_for_user, get_podcast, get_podcasts_by_user
+    get_user_by_email, create_user, get_or_create_user, resolve_user_id, user_id_cache,
+    create_podcast_for_user, get_podcast, get_podcasts_by_user,
+    get_podcast_page_by_user, encode_podcast_cursor, decode_podcast_cursor,
+    get_completed_podcast_by_fingerprint, complete_podcast_from_duplicate, register_fingerprint
 )
 
 __all__ = [
@@ -18,11 +21,14 @@ __all__ = [
     "User",
     "Podcast",
     "PodcastStatus",
+    "DocumentFingerprint",
     # Schemas
     "SignedURLRequest",
     "PodcastBase",
     "PodcastCreate",
     "PodcastSchema",
+    "PodcastListItem",
+    "PodcastPage",
     "UserBase",
     "UserCreate",
     "UserSchema",
@@ -37,7 +43,15 @@ __all__ = [
     "get_user_by_email",
     "create_user",
     "get_or_create_user",
+    "resolve_user_id",
+    "user_id_cache",
     "create_podcast_for_user",
     "get_podcast",
     "get_podcasts_by_user",
+    "get_podcast_page_by_user",
+    "encode_podcast_cursor",
+    "decode_podcast_cursor",
+    "get_completed_podcast_by_fingerprint",
+    "complete_podcast_from_duplicate",
+    "register_fingerprint",
 ]
@@ -0,0 +1,115 @@
+"""
+Async CRUD operations for the API request path.
+
+Mirrors the functions in crud.py that FastAPI endpoints use, on an
+AsyncSession. Celery workers keep using the sync versions in crud.py;
+query construction and the auth user cache are shared between the two.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from . import models, schemas
+from .crud import user_id_cache, podcast_page_query, paginate_podcast_rows
+from uuid import UUID
+import logging
+
+logger = logging.getLogger(__name__)
+
+# USER CRUD FUNCTIONS
+
+async def get_user_by_email(db: AsyncSession, email: str):
+    return await db.scalar(select(models.User).where(models.User.email == email))
+
+async def get_user(db: AsyncSession, user_id: str):
+    return await db.get(models.User, user_id)
+
+async def create_user(db: AsyncSession, user: schemas.UserCreate, auth_id: UUID):
+    """Create a new user, handling race condition gracefully."""
+    db_user = models.User(email=user.email, auth_user_id=auth_id)
+    db.add(db_user)
+    try:
+        await db.commit()
+        await db.refresh(db_user)
+        logger.info(f"[CRUD] Created new user: {user.email}")
+        return db_user
+    except IntegrityError:
+        # Another request created the same user concurrently
+        await db.rollback()
+        logger.warning(f"[CRUD] Race condition: User {user.email} already exists, fetching existing user")
+        existing_user = await get_user_by_email(db, user.email)
+        if existing_user:
+            return existing_user
+        # If still not found, re-raise the error
+        raise
+
+async def get_or_create_user(db: AsyncSession, email: str, auth_id: UUID) -> models.User:
+    """
+    Atomically get or create a user.
+
+    Args:
+        db: Async database session
+        email: User email
+        auth_id: Supabase auth user ID
+
+    Returns:
+        User model instance (either existing or newly created)
+    """
+    user = await get_user_by_email(db, email)
+    if user:
+        logger.debug(f"[CRUD] User exists: {email}")
+        return user
+
+    # Try to create, but handle race condition
+    return await create_user(db, schemas.UserCreate(email=email), auth_id)
+
+async def resolve_user_id(db: AsyncSession, email: str, auth_id: UUID) -> str:
+    """
+    Resolve an authenticated identity to its users.id, creating the user if needed.
+
+    Shares user_id_cache with crud.resolve_user_id.
+
+    Args:
+        db: Async database session
+        email: User email from the verified token
+        auth_id: Supabase auth user ID from the verified token
+
+    Returns:
+        The user's database ID
+    """
+    cache_key = str(auth_id)
+    user_id = user_id_cache.get(cache_key)
+    if user_id is None:
+        user_id = (await get_or_create_user(db, email=email, auth_id=auth_id)).id
+        user_id_cache.set(cache_key, user_id)
+    return user_id
+
+# PODCAST CRUD FUNCTIONS
+
+async def create_podcast_for_user(db: AsyncSession, podcast: schemas.PodcastCreate, user_id: str):
+    db_podcast = models.Podcast(
+        **podcast.model_dump(),
+        owner_id=user_id
+    )
+    db.add(db_podcast)
+    await db.commit()
+    await db.refresh(db_podcast)  # refreshing to get the new id, status, etc from the database
+    return db_podcast
+
+async def get_podcast(db: AsyncSession, podcast_id: str):
+    return await db.get(models.Podcast, podcast_id)
+
+async def get_podcast_page_by_user(db: AsyncSession, user_id: str, limit: int, cursor: str | None = None):
+    """
+    Fetch one page of a user's podcasts, newest first, using keyset pagination.
+
+    See crud.get_podcast_page_by_user.
+
+    Returns:
+        Tuple of (rows, next_cursor); next_cursor is None on the last page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    result = await db.execute(podcast_page_query(user_id, limit, cursor))
+    return paginate_podcast_rows(result.all(), limit)
@@ -1,12 +1,29 @@
+from sqlalchemy import select, tuple_
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.sql import func
 from . import models, schemas
+from backend.core.config import get_settings
+from backend.utils.cache import TTLCache
+from datetime import datetime
 from uuid import UUID
+import base64
+import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+settings = get_settings()
+
+# Verified Supabase auth user id -> users.id, so authenticated requests skip the user lookup.
+# The mapping is immutable: users are only ever created, never re-keyed or deleted, so
+# no write path invalidates it. A row removed outside the app is caught where it is
+# loaded (create_podcast drops the stale entry and rejects the request).
+user_id_cache = TTLCache(
+    max_size=settings.AUTH_USER_CACHE_MAX_SIZE,
+    ttl_seconds=settings.AUTH_USER_CACHE_TTL_SECONDS
+)
+
 # USER CRUD FUNCTIONS
 
 def get_user_by_email(db: Session, email: str):
@@ -48,12 +65,33 @@ def get_or_create_user(db: Session, email: str, auth_id: UUID) -> models.User:
     """
     user = get_user_by_email(db, email)
     if user:
-        logger.info(f"[CRUD] User exists: {email}")
+        logger.debug(f"[CRUD] User exists: {email}")
         return user
 
     # Try to create, but handle race condition
     return create_user(db, schemas.UserCreate(email=email), auth_id)
 
+def resolve_user_id(db: Session, email: str, auth_id: UUID) -> str:
+    """
+    Resolve an authenticated identity to its users.id, creating the user if needed.
+
+    Served from user_id_cache when possible, so a warm request costs no query.
+
+    Args:
+        db: Database session
+        email: User email from the verified token
+        auth_id: Supabase auth user ID from the verified token
+
+    Returns:
+        The user's database ID
+    """
+    cache_key = str(auth_id)
+    user_id = user_id_cache.get(cache_key)
+    if user_id is None:
+        user_id = get_or_create_user(db, email=email, auth_id=auth_id).id
+        user_id_cache.set(cache_key, user_id)
+    return user_id
+
 # PODCAST CRUD FUNCTIONS
 
 def create_podcast_for_user(db: Session, podcast: schemas.PodcastCreate, user_id: int):
@@ -72,3 +110,123 @@ def get_podcast(db: Session, podcast_id: int):
 
 def get_podcasts_by_user(db: Session, user_id: int):
     return db.query(models.Podcast).filter(models.Podcast.owner_id == user_id).order_by(models.Podcast.created_at.desc()).all()
+
+# Columns the library view needs; keeps requirements and pipeline bookkeeping out of list queries
+PODCAST_LIST_COLUMNS = (
+    models.Podcast.id,
+    models.Podcast.title,
+    models.Podcast.status,
+    models.Podcast.created_at,
+    models.Podcast.duration,
+    models.Podcast.final_podcast_url,
+)
+
+def encode_podcast_cursor(created_at: datetime, podcast_id: str) -> str:
+    """Encode the (created_at, id) position of the last row on a page as an opaque cursor."""
+    payload = json.dumps({"created_at": created_at.isoformat(), "id": podcast_id})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_podcast_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    Decode a cursor produced by encode_podcast_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["created_at"]), str(payload["id"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+def podcast_page_query(user_id: str, limit: int, cursor: str | None = None):
+    """
+    Build the keyset-paginated library query shared by the sync and async CRUD.
+
+    Selects one row more than limit so the caller can tell whether another page exists.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    query = select(*PODCAST_LIST_COLUMNS).where(models.Podcast.owner_id == user_id)
+    if cursor:
+        created_at, podcast_id = decode_podcast_cursor(cursor)
+        query = query.where(
+            tuple_(models.Podcast.created_at, models.Podcast.id) < tuple_(created_at, podcast_id)
+        )
+    return query.order_by(
+        models.Podcast.created_at.desc(), models.Podcast.id.desc()
+    ).limit(limit + 1)
+
+def paginate_podcast_rows(rows: list, limit: int):
+    """Trim the lookahead row from podcast_page_query results and build the next cursor."""
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_podcast_cursor(last.created_at, last.id)
+    return rows, next_cursor
+
+def get_podcast_page_by_user(db: Session, user_id: str, limit: int, cursor: str | None = None):
+    """
+    Fetch one page of a user's podcasts, newest first, using keyset pagination.
+
+    Seeks past the (created_at, id) of the previous page instead of using OFFSET,
+    so every page costs the same regardless of library size. Only the columns in
+    PODCAST_LIST_COLUMNS are selected.
+
+    Args:
+        db: Database session
+        user_id: Owner of the podcasts
+        limit: Maximum rows to return
+        cursor: Cursor returned with the previous page, or None for the first page
+
+    Returns:
+        Tuple of (rows, next_cursor); next_cursor is None on the last page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    rows = db.execute(podcast_page_query(user_id, limit, cursor)).all()
+    return paginate_podcast_rows(rows, limit)
+
+# DOCUMENT FINGERPRINT CRUD FUNCTIONS
+
+def completed_podcast_by_fingerprint_query(fingerprint: str):
+    """Build the lookup for a completed podcast generated from an identical document."""
+    return select(models.Podcast).join(
+        models.DocumentFingerprint, models.DocumentFingerprint.podcast_id == models.Podcast.id
+    ).where(
+        models.DocumentFingerprint.fingerprint == fingerprint,
+        models.Podcast.status == models.PodcastStatus.COMPLETE.value
+    ).limit(1)
+
+def get_completed_podcast_by_fingerprint(db: Session, fingerprint: str):
+    """Return the completed podcast generated from an identical document, if any."""
+    return db.scalars(completed_podcast_by_fingerprint_query(fingerprint)).first()
+
+def apply_duplicate_completion(podcast: models.Podcast, source: models.Podcast, final_url: str, user: models.User):
+    """Copy the results of an identical, already completed podcast onto a new one (no commit)."""
+    podcast.title = source.title
+    podcast.duration = source.duration
+    podcast.final_podcast_url = final_url
+    podcast.pipeline_stage = source.pipeline_stage
+    podcast.status = models.PodcastStatus.COMPLETE.value
+    user.podcasts_created += 1
+
+def complete_podcast_from_duplicate(db: Session, podcast: models.Podcast, source: models.Podcast, final_url: str, user: models.User):
+    """Mark a podcast complete by reusing the artifacts of an identical, already completed podcast."""
+    apply_duplicate_completion(podcast, source, final_url, user)
+    db.commit()
+    db.refresh(podcast)
+    return podcast
+
+def register_fingerprint(db: Session, fingerprint: str, podcast_id: str):
+    """Record a completed podcast for a fingerprint. The first registration wins."""
+    db.add(models.DocumentFingerprint(fingerprint=fingerprint, podcast_id=podcast_id))
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        logger.info(f"[CRUD] Fingerprint {fingerprint[:12]} already registered")
@@ -1,5 +1,5 @@
 import enum
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UUID
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UUID, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ulid import ULID
@@ -40,5 +40,26 @@ class Podcast(Base):
     title = Column(String, nullable=True)
     duration = Column(Integer, default=0)
     requirements = Column(String, nullable=True)  # User customization instructions
+    pipeline_stage = Column(String, nullable=True)  # Last completed generation stage (for resumable retries)
+    playlist_key = Column(String, nullable=True)  # S3 key of the progressive HLS playlist, once segments exist
+    content_fingerprint = Column(String(64), nullable=True, index=True)  # SHA-256 of the PDF + requirements
     owner_id = Column(String(26), ForeignKey("users.id"))
     owner = relationship("User", back_populates="podcasts")
+
+    __table_args__ = (
+        # Library list and keyset pagination, newest first
+        Index("ix_podcasts_owner_created_at", "owner_id", created_at.desc(), id.desc()),
+        # Queued and running jobs only; stays small as podcasts complete
+        Index(
+            "ix_podcasts_active_status", "status", "created_at",
+            postgresql_where=status.in_([PodcastStatus.PENDING.value, PodcastStatus.PROCESSING.value]),
+        ),
+    )
+
+class DocumentFingerprint(Base):
+    """Maps a document fingerprint to the completed podcast whose artifacts can be reused."""
+    __tablename__ = "document_fingerprints"
+
+    fingerprint = Column(String(64), primary_key=True)
+    podcast_id = Column(String(26), ForeignKey("podcasts.id"), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
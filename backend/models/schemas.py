@@ -94,12 +94,36 @@ class Podcast(PodcastBase):
     title: str | None = None
     duration: int
     requirements: str | None = None
+    pipeline_stage: str | None = None  # Last completed generation stage
     stream_url: str | None = None  # Presigned URL for secure streaming
+    playlist_url: str | None = None  # HLS playlist, available while the podcast is still being synthesized
+    queue_position: int | None = None  # 1-based place in the generation queue; 0 once generation has started
+    eta_seconds: int | None = None  # Estimated seconds until the podcast is ready
 
     class Config:
         from_attributes = True
 
 
+class PodcastListItem(BaseModel):
+    """Lightweight podcast schema for the library view."""
+    id: str  # ULID
+    status: str
+    created_at: datetime
+    title: str | None = None
+    duration: int | None = 0
+    final_podcast_url: str | None = None
+    stream_url: str | None = None  # Presigned URL for completed podcasts
+
+    class Config:
+        from_attributes = True
+
+
+class PodcastPage(BaseModel):
+    """One page of podcasts plus the cursor for the next page."""
+    items: list[PodcastListItem]
+    next_cursor: str | None = None
+
+
 class UserBase(BaseModel):
     """Base user schema."""
     email: str
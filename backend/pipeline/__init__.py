@@ -0,0 +1,58 @@
+"""Podcast generation pipeline stages used by the Celery tasks."""
+
+from .tts import ScriptLine, ScriptLineParser, SynthesizedChunk, TTSSynthesizer, parse_script, VOICE_MAP, TTS_MODEL_ID
+from .segmentation import segment_script, iter_segments, split_text
+from .segment_cache import SegmentCache
+from .checkpoints import PipelineStage, CheckpointStore, is_stage_complete, advance_stage
+from .upload import GrowingFileReader, build_transfer_config, upload_file_streaming
+from .hls import HLSPublisher, delete_hls_output, sign_playlist
+from .llm import LLMStage, LLMOrchestrator
+from .summarize import MapReduceSummarizer, split_document, PAGE_SEPARATOR
+from .extract import ExtractionResult, extract_pdf_text, iter_pages
+from .mp3 import Mp3Info, Mp3FrameScanner, index_mp3, audio_start_offset
+from .concat import Mp3Concatenator, IncompatibleAudioError, concat_mp3
+from .metrics import STAGE_SECONDS, CHUNKS_PER_PODCAST, RETRIES, PODCASTS_FINISHED, timed
+
+__all__ = [
+    "ScriptLine",
+    "ScriptLineParser",
+    "SynthesizedChunk",
+    "TTSSynthesizer",
+    "parse_script",
+    "VOICE_MAP",
+    "TTS_MODEL_ID",
+    "segment_script",
+    "iter_segments",
+    "split_text",
+    "SegmentCache",
+    "PipelineStage",
+    "CheckpointStore",
+    "is_stage_complete",
+    "advance_stage",
+    "GrowingFileReader",
+    "build_transfer_config",
+    "upload_file_streaming",
+    "HLSPublisher",
+    "delete_hls_output",
+    "sign_playlist",
+    "LLMStage",
+    "LLMOrchestrator",
+    "MapReduceSummarizer",
+    "split_document",
+    "PAGE_SEPARATOR",
+    "ExtractionResult",
+    "extract_pdf_text",
+    "iter_pages",
+    "Mp3Info",
+    "Mp3FrameScanner",
+    "index_mp3",
+    "audio_start_offset",
+    "Mp3Concatenator",
+    "IncompatibleAudioError",
+    "concat_mp3",
+    "STAGE_SECONDS",
+    "CHUNKS_PER_PODCAST",
+    "RETRIES",
+    "PODCASTS_FINISHED",
+    "timed",
+]
@@ -0,0 +1,117 @@
+"""
+Checkpointing for the podcast generation pipeline.
+Each stage persists its output as an artifact and advances a stage marker on the
+Podcast row, so a retried task resumes at the first incomplete stage. Stage
+tasks hand each other artifact names rather than the artifacts themselves, so
+consecutive stages can run on different workers.
+"""
+
+import enum
+import json
+import os
+import logging
+from typing import Optional
+from botocore.exceptions import ClientError
+
+from .metrics import BYTES_UPLOADED, timed
+
+logger = logging.getLogger(__name__)
+
+
+class PipelineStage(enum.Enum):
+    """Pipeline stages, in execution order."""
+    EXTRACT = "extract"
+    SUMMARIZE = "summarize"
+    TITLE = "title"
+    SCRIPT = "script"
+    SYNTHESIZE = "synthesize"
+    CONCAT = "concat"
+    UPLOAD = "upload"
+
+
+STAGE_ORDER = [stage.value for stage in PipelineStage]
+
+
+def is_stage_complete(current_stage: Optional[str], stage: PipelineStage) -> bool:
+    """Whether the stored marker shows that `stage` has already completed."""
+    if current_stage not in STAGE_ORDER:
+        return False
+    return STAGE_ORDER.index(current_stage) >= STAGE_ORDER.index(stage.value)
+
+
+def advance_stage(current_stage: Optional[str], stage: PipelineStage) -> str:
+    """New marker value after `stage` completes; the marker never moves backwards."""
+    if is_stage_complete(current_stage, stage):
+        return current_stage
+    return stage.value
+
+
+class CheckpointStore:
+    """Stores intermediate pipeline artifacts in S3."""
+
+    def __init__(self, s3_client, bucket_name: str, prefix: str = "podcasts/artifacts/"):
+        """
+        Args:
+            s3_client: boto3 S3 client
+            bucket_name: Bucket holding the artifacts
+            prefix: Key prefix; artifacts live under {prefix}{podcast_id}/{name}
+        """
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.prefix = prefix
+
+    def artifact_key(self, podcast_id: str, name: str) -> str:
+        return f"{self.prefix}{podcast_id}/{name}"
+
+    def save_text(self, podcast_id: str, name: str, text: str) -> None:
+        self.s3_client.put_object(
+            Bucket=self.bucket_name,
+            Key=self.artifact_key(podcast_id, name),
+            Body=text.encode("utf-8"),
+            ContentType="text/plain; charset=utf-8",
+            ACL="private"
+        )
+
+    def load_text(self, podcast_id: str, name: str) -> Optional[str]:
+        """
+        Load a text artifact.
+
+        Returns:
+            The artifact text, or None if it does not exist or cannot be read
+        """
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=self.artifact_key(podcast_id, name))
+            return response["Body"].read().decode("utf-8")
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") not in ("404", "NoSuchKey"):
+                logger.warning(f"[CHECKPOINT] Failed to load {name} for podcast {podcast_id}: {str(e)}")
+            return None
+
+    def save_json(self, podcast_id: str, name: str, data) -> None:
+        self.save_text(podcast_id, name, json.dumps(data))
+
+    def load_json(self, podcast_id: str, name: str):
+        text = self.load_text(podcast_id, name)
+        return json.loads(text) if text is not None else None
+
+    def upload_file(self, podcast_id: str, name: str, path: str) -> None:
+        with timed("artifact_upload"):
+            self.s3_client.upload_file(
+                path, self.bucket_name, self.artifact_key(podcast_id, name),
+                ExtraArgs={"ACL": "private"}
+            )
+        BYTES_UPLOADED.labels("artifact").inc(os.path.getsize(path))
+
+    def download_file(self, podcast_id: str, name: str, path: str) -> None:
+        with timed("artifact_download"):
+            self.s3_client.download_file(self.bucket_name, self.artifact_key(podcast_id, name), path)
+
+    def delete(self, podcast_id: str, names: list[str]) -> None:
+        """Delete artifacts, ignoring ones that do not exist."""
+        keys = [{"Key": self.artifact_key(podcast_id, name)} for name in names]
+        # DeleteObjects accepts at most 1000 keys per request
+        for start in range(0, len(keys), 1000):
+            self.s3_client.delete_objects(
+                Bucket=self.bucket_name,
+                Delete={"Objects": keys[start:start + 1000], "Quiet": True}
+            )
@@ -0,0 +1,264 @@
+"""
+In-process MP3 concatenation.
+Splices the audio frames of each chunk into one file with copy_file_range or
+sendfile, so frame data never passes through Python. ID3 tags and Xing/Info
+header frames of the chunks are left out, and a Xing header describing the
+combined stream is written at the start, so players seek and show the
+duration correctly. Chunks must share MPEG version, layer, sample rate and
+channel mode; anything else needs re-muxing (ffmpeg).
+"""
+
+import os
+import errno
+import struct
+import logging
+from array import array
+from typing import Iterable
+
+from .mp3 import FrameHeader, Mp3Info, index_mp3, parse_frame_header
+
+logger = logging.getLogger(__name__)
+
+# Bytes per pread/write when the kernel copy calls are unavailable
+COPY_BUFFER_BYTES = 1024 * 1024
+
+XING_FLAGS = 0x01 | 0x02 | 0x04  # frame count, byte count, seek table
+XING_TOC_ENTRIES = 100
+
+# errnos meaning "this copy call can't handle these files", rather than an I/O failure
+_UNSUPPORTED_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP}
+
+
+class IncompatibleAudioError(Exception):
+    """Raised when a chunk's encoding differs from the first chunk's, so frames can't be spliced."""
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    return os.copy_file_range(src_fd, dst_fd, count, offset)
+
+
+def _sendfile(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    return os.sendfile(dst_fd, src_fd, offset, count)
+
+
+def _read_write(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    data = os.pread(src_fd, min(count, COPY_BUFFER_BYTES), offset)
+    return os.write(dst_fd, data) if data else 0
+
+
+# Tried in order; a method the platform or filesystem rejects is dropped for the process
+_copy_methods = [
+    method for method, available in (
+        (_copy_file_range, hasattr(os, "copy_file_range")),
+        (_sendfile, hasattr(os, "sendfile")),
+        (_read_write, True),
+    ) if available
+]
+
+
+def copy_range(src_fd: int, dst_fd: int, offset: int, count: int) -> None:
+    """
+    Append count bytes of src_fd, starting at offset, at dst_fd's current position.
+
+    Raises:
+        EOFError: If src_fd ends before count bytes were copied
+    """
+    while count > 0:
+        method = _copy_methods[0]
+        try:
+            copied = method(src_fd, dst_fd, offset, count)
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_ERRNOS or method is _read_write:
+                raise
+            logger.info(f"[CONCAT] {method.__name__} unsupported here ({e.strerror}), using the next copy method")
+            if _copy_methods and _copy_methods[0] is method:
+                _copy_methods.pop(0)
+            continue
+        if copied == 0:
+            raise EOFError(f"Source ended with {count} bytes left to copy")
+        offset += copied
+        count -= copied
+
+
+def side_info_length(header: FrameHeader) -> int:
+    """Bytes of Layer III side information after the frame header (and CRC)."""
+    if header.version == 3:
+        return 17 if header.mono else 32
+    return 9 if header.mono else 17
+
+
+def xing_frame_template(first_header_bytes: bytes) -> tuple[bytes, FrameHeader]:
+    """
+    Choose the header of a Xing frame matching the stream's first audio frame.
+
+    The frame keeps the stream's version, sample rate and channel mode, drops
+    CRC protection, and uses the lowest bitrate whose frame fits the Xing data.
+
+    Returns:
+        (4 header bytes, parsed header)
+    """
+    b0, b1, b2, b3 = first_header_bytes[:4]
+    b1 |= 0x01  # no CRC
+    for bitrate_index in range(1, 15):
+        raw = bytes([b0, b1, (bitrate_index << 4) | (b2 & 0x0D), b3])  # keep sample rate and private bits, no padding
+        header = parse_frame_header(raw, 0)
+        needed = 4 + side_info_length(header) + 4 + 4 + 4 + 4 + XING_TOC_ENTRIES
+        if header.length >= needed:
+            return raw, header
+    raise IncompatibleAudioError("No bitrate leaves room for a Xing header at this sample rate")
+
+
+def build_xing_frame(raw_header: bytes, header: FrameHeader, frames: int, stream_bytes: int, toc: bytes) -> bytes:
+    """Encode a Xing frame carrying the frame count, byte count and 100-entry seek table."""
+    body = (
+        raw_header
+        + bytes(side_info_length(header))
+        + b"Xing"
+        + struct.pack(">III", XING_FLAGS, frames, stream_bytes)
+        + toc
+    )
+    return body + bytes(header.length - len(body))
+
+
+class Mp3Concatenator:
+    """
+    Build one MP3 from chunks appended in order.
+
+    Space for the Xing frame is reserved when the first chunk arrives and
+    filled in by finish(), so chunks can be appended as soon as each one is
+    available. Use as a context manager: the output is removed if an error
+    interrupts the build.
+    """
+
+    def __init__(self, output_path: str):
+        """
+        Args:
+            output_path: File to write; replaced if it exists
+        """
+        self.output_path = output_path
+        self.offsets = array("Q")
+        self.frames = 0
+        self.samples = 0
+        self.chunks = 0
+        self._fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        self._format = None  # (version, layer, sample_rate, mono) of the first chunk
+        self._xing = None  # (raw header, parsed header) of the reserved Xing frame
+        self._position = 0
+
+    def append(self, chunk_path: str) -> Mp3Info:
+        """
+        Splice the audio frames of chunk_path onto the output.
+
+        Returns:
+            Mp3Info of the chunk
+
+        Raises:
+            IncompatibleAudioError: If the chunk's encoding differs from the first chunk's
+        """
+        info = index_mp3(chunk_path)
+        if not info.frames:
+            logger.warning(f"[CONCAT] ✗ No audio frames in {chunk_path}, skipping")
+            return info
+
+        src_fd = os.open(chunk_path, os.O_RDONLY)
+        try:
+            first_header_bytes = os.pread(src_fd, 4, info.audio_start)
+            header = parse_frame_header(first_header_bytes, 0)
+            chunk_format = (header.version, header.layer, header.sample_rate, header.mono)
+            if self._format is None:
+                self._start(chunk_format, first_header_bytes)
+            elif chunk_format != self._format:
+                raise IncompatibleAudioError(
+                    f"{os.path.basename(chunk_path)} is {chunk_format}, expected {self._format} "
+                    "(version, layer, sample rate, mono)"
+                )
+
+            copy_range(src_fd, self._fd, info.audio_start, info.audio_bytes)
+        finally:
+            os.close(src_fd)
+
+        shift = self._position - info.audio_start
+        self.offsets.extend(offset + shift for offset in info.frame_offsets)
+        self._position += info.audio_bytes
+        self.frames += info.frames
+        self.samples += info.samples
+        self.chunks += 1
+        return info
+
+    def _start(self, chunk_format: tuple, first_header_bytes: bytes) -> None:
+        self._format = chunk_format
+        if chunk_format[1] == 3:
+            self._xing = xing_frame_template(first_header_bytes)
+            # Placeholder, rewritten by finish() once the totals are known
+            self._position = os.write(self._fd, bytes(self._xing[1].length))
+
+    def _seek_table(self, stream_bytes: int) -> bytes:
+        """Byte position of each percent of the duration, scaled to 0-255."""
+        toc = bytearray(XING_TOC_ENTRIES)
+        for percent in range(XING_TOC_ENTRIES):
+            offset = self.offsets[percent * self.frames // XING_TOC_ENTRIES]
+            toc[percent] = min(255, offset * 256 // stream_bytes)
+        return bytes(toc)
+
+    def finish(self) -> Mp3Info:
+        """
+        Write the Xing header and close the output.
+
+        Returns:
+            Mp3Info of the combined file
+
+        Raises:
+            ValueError: If no chunk had audio frames
+        """
+        try:
+            if not self.frames:
+                raise ValueError("No audio frames to concatenate")
+            audio_start = 0
+            if self._xing:
+                raw_header, header = self._xing
+                frame = build_xing_frame(raw_header, header, self.frames, self._position, self._seek_table(self._position))
+                os.pwrite(self._fd, frame, 0)
+                audio_start = len(frame)
+        finally:
+            self.close()
+        return Mp3Info(self._format[2], self.frames, self.samples, audio_start, self._position, self.offsets)
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        if exc_type is not None and os.path.exists(self.output_path):
+            os.remove(self.output_path)
+        return False
+
+
+def concat_mp3(chunk_paths: Iterable[str], output_path: str) -> Mp3Info:
+    """
+    Concatenate MP3 chunks into output_path without re-encoding or decoding.
+
+    chunk_paths may be a lazy iterable (e.g. of finished downloads); each
+    chunk is spliced as soon as it is yielded.
+
+    Args:
+        chunk_paths: MP3 files, in playback order
+        output_path: Combined MP3 to write
+
+    Returns:
+        Mp3Info of the combined file
+
+    Raises:
+        IncompatibleAudioError: If the chunks' encodings differ; output_path is removed
+        ValueError: If no chunk had audio frames
+    """
+    with Mp3Concatenator(output_path) as concatenator:
+        for chunk_path in chunk_paths:
+            concatenator.append(chunk_path)
+        info = concatenator.finish()
+    logger.info(f"[CONCAT] ✓ Spliced {concatenator.chunks} chunks ({info.frames} frames, {info.duration:.1f}s) into {output_path}")
+    return info
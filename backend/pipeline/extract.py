@@ -0,0 +1,139 @@
+"""
+PDF text extraction for the podcast pipeline.
+Pages are read lazily and extraction stops once the character budget is met.
+Large documents can spread page ranges across a process pool.
+"""
+
+import os
+import math
+import time
+import logging
+import multiprocessing
+import fitz
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from .summarize import PAGE_SEPARATOR
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionResult(NamedTuple):
+    """Extracted text plus statistics reported for each podcast."""
+    text: str
+    page_count: int
+    pages_extracted: int
+    truncated: bool
+    seconds: float
+    parallel: bool
+
+    def stats(self) -> dict:
+        return {
+            "page_count": self.page_count,
+            "pages_extracted": self.pages_extracted,
+            "chars": len(self.text),
+            "truncated": self.truncated,
+            "seconds": round(self.seconds, 3),
+            "parallel": self.parallel,
+        }
+
+
+def iter_pages(pdf_path: str, start: int = 0, stop: int = None):
+    """Yield page texts from start (inclusive) to stop (exclusive), one page at a time."""
+    with fitz.open(pdf_path) as doc:
+        stop = doc.page_count if stop is None else min(stop, doc.page_count)
+        for page_number in range(start, stop):
+            yield doc.load_page(page_number).get_text()
+
+
+def _extract_range(pdf_path: str, start: int, stop: int, max_chars: int) -> list[str]:
+    """Extract a page range, stopping early once max_chars is reached (runs in a worker process)."""
+    pages = []
+    total = 0
+    for text in iter_pages(pdf_path, start, stop):
+        pages.append(text)
+        total += len(text) + len(PAGE_SEPARATOR)
+        if total >= max_chars:
+            break
+    return pages
+
+
+def _collect(pages, max_chars: int) -> tuple:
+    """Join pages until the budget is reached. Returns (text, pages used, truncated)."""
+    parts = []
+    total = 0
+    used = 0
+    for text in pages:
+        parts.append(text)
+        used += 1
+        total += len(text) + len(PAGE_SEPARATOR)
+        if total >= max_chars:
+            break
+
+    text = PAGE_SEPARATOR.join(parts)
+    truncated = len(text) > max_chars
+    return text[:max_chars], used, truncated
+
+
+def extract_pdf_text(pdf_path: str, max_chars: int, pool_min_pages: int = 200, pool_workers: int = None) -> ExtractionResult:
+    """
+    Extract text from a PDF, keeping page boundaries.
+
+    Args:
+        pdf_path: Local path to the PDF
+        max_chars: Character budget; sequential extraction parses no pages past it,
+            the process pool at most the rest of its current wave
+        pool_min_pages: Documents with at least this many pages use a process pool
+        pool_workers: Worker processes for the pool (defaults to the CPU count)
+
+    Returns:
+        ExtractionResult with text joined by PAGE_SEPARATOR
+    """
+    started = time.perf_counter()
+    with fitz.open(pdf_path) as doc:
+        page_count = doc.page_count
+
+    pool_workers = pool_workers or os.cpu_count() or 1
+    # Daemonic processes (Celery prefork children) cannot start a pool of their own
+    if page_count >= pool_min_pages and pool_workers > 1 and not multiprocessing.current_process().daemon:
+        try:
+            text, used, truncated = _extract_parallel(pdf_path, page_count, max_chars, pool_workers)
+            return ExtractionResult(text, page_count, used, truncated or used < page_count, time.perf_counter() - started, True)
+        except Exception as e:
+            logger.warning(f"[EXTRACT] Process pool unavailable ({str(e)}), extracting sequentially")
+
+    text, used, truncated = _collect(iter_pages(pdf_path), max_chars)
+    return ExtractionResult(text, page_count, used, truncated or used < page_count, time.perf_counter() - started, False)
+
+
+def _extract_parallel(pdf_path: str, page_count: int, max_chars: int, workers: int) -> tuple:
+    """
+    Extract contiguous page ranges in worker processes and join them in order.
+
+    Ranges are submitted in waves of one per worker. The first wave reads one
+    page each; later waves are sized from the characters per page seen so far
+    to cover the remaining budget, and no wave is submitted once it is met.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+
+        def ordered_pages():
+            chars = 0
+            pages = 0
+            start = 0
+            while start < page_count and chars < max_chars:
+                wave_pages = math.ceil((max_chars - chars) / max(chars / pages, 1)) if pages else workers
+                range_size = max(1, math.ceil(wave_pages / workers))
+                wave = []
+                for range_start in range(start, min(start + range_size * workers, page_count), range_size):
+                    stop = min(range_start + range_size, page_count)
+                    # A range that stops early meets the remaining budget on its own, so the ranges after it are never read
+                    wave.append(executor.submit(_extract_range, pdf_path, range_start, stop, max_chars - chars))
+                    start = stop
+                for future in wave:
+                    for text in future.result():
+                        chars += len(text) + len(PAGE_SEPARATOR)
+                        pages += 1
+                        yield text
+
+        # Stops pulling pages at the budget; ranges already running in the last wave finish on exit
+        return _collect(ordered_pages(), max_chars)
@@ -0,0 +1,181 @@
+"""
+Progressive HLS output for podcasts that are still being synthesized.
+Chunks are published to S3 as HLS segments in script order, with a growing
+EVENT playlist, so listeners can start before the full episode is ready.
+
+EXT-X-TARGETDURATION may not change once an EVENT playlist is published, so
+it is fixed up front and chunks longer than it are split at frame boundaries
+into several segments.
+"""
+
+import math
+import os
+import logging
+
+from .metrics import BYTES_UPLOADED
+from .mp3 import index_mp3
+
+logger = logging.getLogger(__name__)
+
+PLAYLIST_NAME = "playlist.m3u8"
+
+
+class HLSPublisher:
+    """Publishes synthesized chunks as an HLS EVENT playlist in S3."""
+
+    def __init__(self, s3_client, bucket_name: str, prefix: str, podcast_id: str, target_duration: int = 30):
+        """
+        Args:
+            s3_client: boto3 S3 client
+            bucket_name: Bucket for segments and playlist
+            prefix: Key prefix; files live under {prefix}{podcast_id}/
+            podcast_id: Podcast being published
+            target_duration: EXT-X-TARGETDURATION in seconds; no segment is longer
+        """
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.base_key = f"{prefix}{podcast_id}/"
+        self.podcast_id = podcast_id
+        self.target_duration = max(1, target_duration)
+        self.segments = []  # (segment name, duration) of published segments, in order
+        self._next_index = 0  # next chunk to publish
+        self._pending = {}  # index -> (chunk path, duration), for chunks that finished out of order
+
+    @property
+    def playlist_key(self) -> str:
+        return f"{self.base_key}{PLAYLIST_NAME}"
+
+    def add_chunk(self, index: int, chunk_path: str, duration: float = None) -> int:
+        """
+        Register a finished chunk and publish every chunk that is now contiguous.
+
+        Args:
+            index: Chunk position in the script
+            chunk_path: Chunk MP3 file
+            duration: Exact chunk duration in seconds; the file is indexed if not given
+
+        Returns:
+            Number of segments newly published by this call
+        """
+        self._pending[index] = (chunk_path, duration)
+        segments_before = len(self.segments)
+        while self._next_index in self._pending:
+            self._publish_chunk(*self._pending.pop(self._next_index))
+            self._next_index += 1
+        published = len(self.segments) - segments_before
+
+        if published:
+            self._write_playlist(ended=False)
+        return published
+
+    def finish(self) -> None:
+        """Mark the playlist as complete so players stop polling for new segments."""
+        self._write_playlist(ended=True)
+        logger.info(f"[HLS] Playlist complete for podcast {self.podcast_id} with {len(self.segments)} segments")
+
+    def _publish_chunk(self, chunk_path: str, duration: float = None) -> None:
+        if duration is not None and duration <= self.target_duration:
+            self._upload_file_segment(chunk_path, duration)
+            return
+
+        info = index_mp3(chunk_path)
+        if info.duration <= self.target_duration or info.frames < 2:
+            self._upload_file_segment(chunk_path, info.duration)
+            return
+
+        # Equal runs of whole frames, each within the target duration
+        samples_per_frame = info.samples // info.frames
+        max_frames = max(1, int(self.target_duration * info.sample_rate // samples_per_frame))
+        frames_per_segment = math.ceil(info.frames / math.ceil(info.frames / max_frames))
+        with open(chunk_path, "rb") as f:
+            for first in range(0, info.frames, frames_per_segment):
+                last = min(first + frames_per_segment, info.frames)
+                start = info.frame_offsets[first]
+                end = info.frame_offsets[last] if last < info.frames else info.audio_end
+                f.seek(start)
+                self._upload_segment(f.read(end - start), (last - first) * samples_per_frame / info.sample_rate)
+
+    def _next_segment_name(self) -> str:
+        return f"segment_{len(self.segments):04d}.mp3"
+
+    def _upload_file_segment(self, chunk_path: str, duration: float) -> None:
+        segment_name = self._next_segment_name()
+        self.s3_client.upload_file(
+            chunk_path, self.bucket_name, f"{self.base_key}{segment_name}",
+            ExtraArgs={'ContentType': 'audio/mpeg', 'ACL': 'private'}
+        )
+        BYTES_UPLOADED.labels("hls_segment").inc(os.path.getsize(chunk_path))
+        self.segments.append((segment_name, duration))
+
+    def _upload_segment(self, data: bytes, duration: float) -> None:
+        segment_name = self._next_segment_name()
+        self.s3_client.put_object(
+            Bucket=self.bucket_name, Key=f"{self.base_key}{segment_name}", Body=data,
+            ContentType='audio/mpeg', ACL='private'
+        )
+        BYTES_UPLOADED.labels("hls_segment").inc(len(data))
+        self.segments.append((segment_name, duration))
+
+    def _write_playlist(self, ended: bool) -> None:
+        lines = [
+            "#EXTM3U",
+            "#EXT-X-VERSION:3",
+            "#EXT-X-PLAYLIST-TYPE:EVENT",
+            f"#EXT-X-TARGETDURATION:{self.target_duration}",
+            "#EXT-X-MEDIA-SEQUENCE:0",
+        ]
+        for segment_name, duration in self.segments:
+            lines.append(f"#EXTINF:{duration:.3f},")
+            lines.append(segment_name)
+        if ended:
+            lines.append("#EXT-X-ENDLIST")
+
+        self.s3_client.put_object(
+            Bucket=self.bucket_name,
+            Key=self.playlist_key,
+            Body=("\n".join(lines) + "\n").encode("utf-8"),
+            ContentType="application/vnd.apple.mpegurl",
+            CacheControl="no-cache",
+            ACL="private"
+        )
+
+
+def delete_hls_output(s3_client, bucket_name: str, prefix: str, podcast_id: str) -> int:
+    """
+    Delete a podcast's published playlist and segments.
+
+    Args:
+        s3_client: boto3 S3 client
+        bucket_name: Bucket holding the HLS output
+        prefix: Key prefix the publisher was created with
+        podcast_id: Podcast whose output to delete
+
+    Returns:
+        Number of objects deleted
+    """
+    deleted = 0
+    paginator = s3_client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket_name, Prefix=f"{prefix}{podcast_id}/"):
+        keys = [{"Key": item["Key"]} for item in page.get("Contents", [])]
+        if keys:
+            # A listing page holds at most 1000 keys, the DeleteObjects limit
+            s3_client.delete_objects(Bucket=bucket_name, Delete={"Objects": keys, "Quiet": True})
+            deleted += len(keys)
+    return deleted
+
+
+def sign_playlist(playlist_text: str, base_key: str, sign_url) -> str:
+    """
+    Rewrite segment URIs in a stored playlist into presigned URLs.
+
+    Args:
+        playlist_text: Playlist as stored in S3 (relative segment names)
+        base_key: S3 key prefix the segment names are relative to
+        sign_url: Callable mapping an S3 key to a presigned GET URL
+    """
+    lines = []
+    for line in playlist_text.splitlines():
+        if line and not line.startswith("#"):
+            line = sign_url(f"{base_key}{line}")
+        lines.append(line)
+    return "\n".join(lines) + "\n"
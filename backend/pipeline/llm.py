@@ -0,0 +1,187 @@
+"""
+Orchestration of Gemini calls for the podcast pipeline.
+Models the prompts as a dependency graph, runs independent prompts concurrently
+with per-call timeouts and retries, and records per-stage latency.
+"""
+
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Iterator, Optional
+
+from .metrics import GEMINI_SECONDS, RETRIES, metric_label
+
+logger = logging.getLogger(__name__)
+
+
+class LLMStage:
+    """A single prompt in the LLM stage graph."""
+
+    def __init__(
+        self,
+        name: str,
+        build_prompt: Callable[[dict], str],
+        depends_on: tuple = (),
+        postprocess: Optional[Callable[[str], str]] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+    ):
+        """
+        Args:
+            name: Stage name; its output is stored under this key
+            build_prompt: Builds the prompt from the outputs/inputs gathered so far
+            depends_on: Names of stages or inputs that must be available first
+            postprocess: Optional transform/validation of the response text
+            timeout: Per-call timeout in seconds (orchestrator default if None)
+            max_retries: Retries for this stage (orchestrator default if None)
+        """
+        self.name = name
+        self.build_prompt = build_prompt
+        self.depends_on = tuple(depends_on)
+        self.postprocess = postprocess
+        self.timeout = timeout
+        self.max_retries = max_retries
+
+
+class LLMOrchestrator:
+    """Runs Gemini prompts against a single shared GenerativeModel."""
+
+    def __init__(self, model, max_workers: int = 4, timeout: float = 120, max_retries: int = 2, backoff_seconds: float = 2.0):
+        """
+        Args:
+            model: Shared google.generativeai GenerativeModel instance
+            max_workers: Maximum prompts in flight at once
+            timeout: Default per-call timeout in seconds
+            max_retries: Default retries per call
+            backoff_seconds: Base delay for exponential backoff between retries
+        """
+        self.model = model
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.latencies = {}  # stage name -> seconds, for the most recent call of each stage
+
+    def generate(self, prompt: str, stage: str = "generate", timeout: Optional[float] = None, max_retries: Optional[int] = None) -> str:
+        """
+        Run one prompt with timeout and retries.
+
+        Returns:
+            Response text
+
+        Raises:
+            Exception: The last error once retries are exhausted
+        """
+        timeout = self.timeout if timeout is None else timeout
+        max_retries = self.max_retries if max_retries is None else max_retries
+        started = time.perf_counter()
+
+        for attempt in range(max_retries + 1):
+            try:
+                response = self.model.generate_content(prompt, request_options={"timeout": timeout})
+                text = response.text
+                elapsed = time.perf_counter() - started
+                self.latencies[stage] = elapsed
+                GEMINI_SECONDS.labels(metric_label(stage), "ok").observe(elapsed)
+                logger.info(f"[LLM] Stage '{stage}' finished in {elapsed:.2f}s (attempts: {attempt + 1})")
+                return text
+            except Exception as e:
+                if attempt >= max_retries:
+                    GEMINI_SECONDS.labels(metric_label(stage), "error").observe(time.perf_counter() - started)
+                    logger.error(f"[LLM] ✗ Stage '{stage}' failed after {attempt + 1} attempts: {str(e)}")
+                    raise
+                RETRIES.labels("gemini").inc()
+                delay = self.backoff_seconds * (2 ** attempt)
+                logger.warning(f"[LLM] Stage '{stage}' attempt {attempt + 1} failed: {str(e)}. Retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    def stream(self, prompt: str, stage: str = "generate", timeout: Optional[float] = None, max_retries: Optional[int] = None) -> Iterator[str]:
+        """
+        Run one prompt with a streamed response, yielding text as it arrives.
+
+        Failures before any text arrives are retried as in generate(). Once
+        text has been yielded the consumer has acted on it, so a later failure
+        is raised instead of restarting the response.
+
+        Yields:
+            Pieces of the response text, in order
+
+        Raises:
+            Exception: The last error once retries are exhausted, or any error after the first text
+        """
+        timeout = self.timeout if timeout is None else timeout
+        max_retries = self.max_retries if max_retries is None else max_retries
+        started = time.perf_counter()
+
+        for attempt in range(max_retries + 1):
+            received = False
+            try:
+                for chunk in self.model.generate_content(prompt, stream=True, request_options={"timeout": timeout}):
+                    text = chunk.text
+                    if not text:
+                        continue
+                    if not received:
+                        received = True
+                        logger.info(f"[LLM] Stage '{stage}' first text after {time.perf_counter() - started:.2f}s")
+                    yield text
+                elapsed = time.perf_counter() - started
+                self.latencies[stage] = elapsed
+                GEMINI_SECONDS.labels(metric_label(stage), "ok").observe(elapsed)
+                logger.info(f"[LLM] Stage '{stage}' streamed in {elapsed:.2f}s (attempts: {attempt + 1})")
+                return
+            except Exception as e:
+                if received or attempt >= max_retries:
+                    GEMINI_SECONDS.labels(metric_label(stage), "error").observe(time.perf_counter() - started)
+                    logger.error(f"[LLM] ✗ Stage '{stage}' stream failed after {attempt + 1} attempts: {str(e)}")
+                    raise
+                RETRIES.labels("gemini").inc()
+                delay = self.backoff_seconds * (2 ** attempt)
+                logger.warning(f"[LLM] Stage '{stage}' attempt {attempt + 1} failed: {str(e)}. Retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    def _run_stage(self, stage: LLMStage, results: dict) -> str:
+        text = self.generate(stage.build_prompt(results), stage.name, stage.timeout, stage.max_retries)
+        return stage.postprocess(text) if stage.postprocess else text
+
+    def run(self, stages: list[LLMStage], inputs: Optional[dict] = None) -> dict:
+        """
+        Run a graph of stages, issuing every stage whose dependencies are met concurrently.
+
+        Args:
+            stages: Stages to run
+            inputs: Already-known values that stages may depend on
+
+        Returns:
+            Dict of inputs plus each stage's output, keyed by name
+
+        Raises:
+            ValueError: If a dependency can never be satisfied
+            Exception: The first stage failure
+        """
+        results = dict(inputs or {})
+        pending = {stage.name: stage for stage in stages}
+        known = set(results) | set(pending)
+        for stage in stages:
+            missing = [dep for dep in stage.depends_on if dep not in known]
+            if missing:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stages: {missing}")
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="llm")
+        in_flight = {}
+        try:
+            while pending or in_flight:
+                ready = [stage for stage in pending.values() if all(dep in results for dep in stage.depends_on)]
+                for stage in ready:
+                    del pending[stage.name]
+                    in_flight[executor.submit(self._run_stage, stage, dict(results))] = stage.name
+
+                if not in_flight:
+                    raise ValueError(f"Dependency cycle between stages: {sorted(pending)}")
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[in_flight.pop(future)] = future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return results
@@ -0,0 +1,82 @@
+"""
+Prometheus metrics for the podcast generation pipeline.
+Stage tasks, Gemini calls, per-line TTS requests, ffmpeg and S3 transfers
+record their latency and volume here. The worker exporter and the API's
+/metrics endpoint serve them (see backend/utils/metrics.py).
+"""
+
+import re
+import time
+import logging
+from contextlib import contextmanager
+from prometheus_client import Counter, Histogram
+
+logger = logging.getLogger(__name__)
+
+# Seconds; spans sub-second S3 calls up to the 30-minute synthesis stage
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1200, 1800)
+
+STAGE_SECONDS = Histogram(
+    "podcast_stage_duration_seconds",
+    "Wall time of one pipeline stage task attempt",
+    ["stage", "outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+OPERATION_SECONDS = Histogram(
+    "podcast_operation_duration_seconds",
+    "Wall time of one pipeline operation (S3 transfer, PDF extraction, ffmpeg, MP3 indexing)",
+    ["operation"],
+    buckets=LATENCY_BUCKETS,
+)
+GEMINI_SECONDS = Histogram(
+    "podcast_gemini_call_duration_seconds",
+    "Wall time of one Gemini prompt, including its retries",
+    ["call", "outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+TTS_LINE_SECONDS = Histogram(
+    "podcast_tts_line_duration_seconds",
+    "Wall time of one ElevenLabs request for a script line",
+    ["outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+TTS_CHARACTERS = Counter(
+    "podcast_tts_characters_total",
+    "Characters of script text turned into audio",
+    ["source"],  # synthesized or cached
+)
+CHUNKS_PER_PODCAST = Histogram(
+    "podcast_chunks_per_podcast",
+    "Audio chunks in a podcast's script",
+    buckets=(5, 10, 25, 50, 100, 200, 400, 800),
+)
+BYTES_UPLOADED = Counter(
+    "podcast_uploaded_bytes_total",
+    "Bytes uploaded to S3 by the pipeline",
+    ["kind"],
+)
+RETRIES = Counter(
+    "podcast_retries_total",
+    "Retried Gemini calls, TTS lines and stage tasks",
+    ["operation"],
+)
+PODCASTS_FINISHED = Counter(
+    "podcast_generations_total",
+    "Podcasts that finished generating",
+    ["status"],
+)
+
+
+def metric_label(name: str) -> str:
+    """Drop numeric suffixes (summarize_map_1_7 -> summarize_map) to keep label cardinality bounded."""
+    return re.sub(r"(_\d+)+$", "", name)
+
+
+@contextmanager
+def timed(operation: str):
+    """Record the wall time of the enclosed block under OPERATION_SECONDS."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        OPERATION_SECONDS.labels(operation).observe(time.perf_counter() - started)
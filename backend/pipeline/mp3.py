@@ -0,0 +1,245 @@
+"""
+MP3 frame indexing without decoding or subprocesses.
+Walks MPEG audio frame headers to get exact durations and per-frame byte
+offsets. Works incrementally on bytes as they are written, or over a
+memory-mapped file. ID3v2 tags and Xing/Info/VBRI header frames are skipped,
+so only audio frames are counted.
+"""
+
+import mmap
+import logging
+from array import array
+from typing import NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bitrates in kbps by (MPEG version 1 or 2, layer); MPEG 2.5 uses the MPEG 2 tables
+BITRATES = {
+    (1, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (1, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (1, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (2, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (2, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+# Sample rates by the 2-bit version field: 0 = MPEG 2.5, 2 = MPEG 2, 3 = MPEG 1
+SAMPLE_RATES = {0: (11025, 12000, 8000), 2: (22050, 24000, 16000), 3: (44100, 48000, 32000)}
+
+# Bytes of the first frame needed to recognise a Xing/Info/VBRI header frame
+HEADER_FRAME_PEEK = 4 + 2 + 32 + 4
+
+
+class FrameHeader(NamedTuple):
+    version: int  # 2-bit version field (3 = MPEG 1, 2 = MPEG 2, 0 = MPEG 2.5)
+    layer: int
+    sample_rate: int
+    length: int  # bytes, including the header
+    samples: int  # PCM samples per channel
+    mono: bool
+    crc: bool
+
+
+def parse_frame_header(buf, pos: int) -> Optional[FrameHeader]:
+    """Parse the 4-byte frame header at buf[pos], or return None if there is no valid frame there."""
+    b0, b1, b2, b3 = buf[pos], buf[pos + 1], buf[pos + 2], buf[pos + 3]
+    if b0 != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+
+    version = (b1 >> 3) & 0x03
+    layer = 4 - ((b1 >> 1) & 0x03)
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 0x03
+    if version == 1 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+        # Reserved values; free-format (bitrate index 0) frames are not supported
+        return None
+
+    mpeg1 = version == 3
+    bitrate = BITRATES[(1 if mpeg1 else 2, layer)][bitrate_index] * 1000
+    sample_rate = SAMPLE_RATES[version][rate_index]
+    padding = (b2 >> 1) & 0x01
+
+    if layer == 1:
+        samples = 384
+        length = (12 * bitrate // sample_rate + padding) * 4
+    elif layer == 2 or mpeg1:
+        samples = 1152
+        length = 144 * bitrate // sample_rate + padding
+    else:
+        samples = 576
+        length = 72 * bitrate // sample_rate + padding
+
+    return FrameHeader(version, layer, sample_rate, length, samples, (b3 >> 6) == 3, not (b1 & 0x01))
+
+
+def is_header_frame(buf, pos: int, header: FrameHeader) -> bool:
+    """Whether the frame at pos is a Xing/Info/VBRI header frame rather than audio."""
+    if header.layer != 3:
+        return False
+    if header.version == 3:
+        side_info = 17 if header.mono else 32
+    else:
+        side_info = 9 if header.mono else 17
+    tag_pos = pos + 4 + (2 if header.crc else 0) + side_info
+    return bytes(buf[tag_pos:tag_pos + 4]) in (b"Xing", b"Info") or bytes(buf[pos + 36:pos + 40]) == b"VBRI"
+
+
+class Mp3Info(NamedTuple):
+    """Audio frames found in an MP3 stream."""
+    sample_rate: int
+    frames: int
+    samples: int
+    audio_start: int  # offset of the first audio frame
+    audio_end: int  # offset just past the last complete audio frame
+    frame_offsets: array  # offset of every audio frame, if kept
+
+    @property
+    def duration(self) -> float:
+        """Exact playback duration in seconds."""
+        return self.samples / self.sample_rate if self.sample_rate else 0.0
+
+    @property
+    def audio_bytes(self) -> int:
+        return self.audio_end - self.audio_start
+
+
+class Mp3FrameScanner:
+    """
+    Incremental MP3 frame scanner.
+
+    Feed it the stream's bytes in order, e.g. as they are written to disk,
+    then call finish() for the Mp3Info. Only partial frame headers are
+    buffered; frame bodies are skipped without copying.
+    """
+
+    def __init__(self, keep_offsets: bool = True):
+        """
+        Args:
+            keep_offsets: Record the byte offset of every audio frame
+        """
+        self.keep_offsets = keep_offsets
+        self.offsets = array("Q")
+        self.frames = 0
+        self.samples = 0
+        self.sample_rate = 0
+        self.audio_start = None
+        self.audio_end = 0
+        self._first = None  # header of the first frame; later frames must match it
+        self._base = 0  # stream offset of the next byte fed
+        self._skip = 0  # bytes of the current frame not yet seen
+        self._tail = b""  # unconsumed bytes that may start a frame header
+        self._last_samples = 0
+        self._last_length = 0
+
+    def feed(self, data) -> None:
+        view = memoryview(data)
+        try:
+            if self._skip:
+                skipped = min(self._skip, len(view))
+                self._skip -= skipped
+                self._base += skipped
+                view = view[skipped:]
+            buf = self._tail + bytes(view) if self._tail else view
+            consumed = self._scan(buf)
+            self._tail = bytes(buf[consumed:])
+            self._base += consumed
+            del buf
+        finally:
+            view.release()
+
+    def finish(self) -> Mp3Info:
+        if self._skip and self.frames:
+            # The stream ended inside the last frame; players drop truncated frames
+            self.frames -= 1
+            self.samples -= self._last_samples
+            self.audio_end -= self._last_length
+            if self.keep_offsets:
+                self.offsets.pop()
+        audio_start = self.audio_start if self.audio_start is not None else 0
+        return Mp3Info(
+            self.sample_rate, self.frames, self.samples, audio_start,
+            max(self.audio_end, audio_start), self.offsets
+        )
+
+    def _scan(self, buf) -> int:
+        """Consume whole frames from buf; returns how many bytes were consumed."""
+        pos = 0
+        size = len(buf)
+        while pos + 4 <= size:
+            if self._base + pos == 0 and bytes(buf[:3]) == b"ID3":
+                if size < 10:
+                    return 0
+                tag_size = 10 + ((buf[6] & 0x7F) << 21 | (buf[7] & 0x7F) << 14 | (buf[8] & 0x7F) << 7 | (buf[9] & 0x7F))
+                if buf[5] & 0x10:
+                    tag_size += 10  # footer
+                pos = self._advance(pos, tag_size, size)
+                continue
+
+            header = parse_frame_header(buf, pos)
+            if header is None or (self._first and header[:3] != self._first[:3]):
+                pos += 1
+                continue
+
+            if self._first is None:
+                if size - pos < HEADER_FRAME_PEEK:
+                    return pos
+                self._first = header
+                self.sample_rate = header.sample_rate
+                if is_header_frame(buf, pos, header):
+                    pos = self._advance(pos, header.length, size)
+                    continue
+
+            offset = self._base + pos
+            if self.audio_start is None:
+                self.audio_start = offset
+            if self.keep_offsets:
+                self.offsets.append(offset)
+            self.frames += 1
+            self.samples += header.samples
+            self.audio_end = offset + header.length
+            self._last_samples = header.samples
+            self._last_length = header.length
+            pos = self._advance(pos, header.length, size)
+        return min(pos, size)
+
+    def _advance(self, pos: int, length: int, size: int) -> int:
+        end = pos + length
+        if end > size:
+            self._skip = end - size
+            return size
+        return end
+
+
+def index_mp3(path: str, keep_offsets: bool = True) -> Mp3Info:
+    """
+    Index the audio frames of an MP3 file through a read-only memory map.
+
+    Args:
+        path: MP3 file
+        keep_offsets: Record the byte offset of every audio frame
+
+    Returns:
+        Mp3Info; an empty file or one without frames has 0 frames
+    """
+    scanner = Mp3FrameScanner(keep_offsets=keep_offsets)
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file; mmap cannot map zero bytes
+            return scanner.finish()
+        with mapped:
+            scanner.feed(mapped)
+    return scanner.finish()
+
+
+def audio_start_offset(path: str, peek_bytes: int = 65536) -> int:
+    """Offset of the first audio frame, reading only the start of the file."""
+    scanner = Mp3FrameScanner(keep_offsets=False)
+    with open(path, "rb") as f:
+        while scanner.audio_start is None:
+            data = f.read(peek_bytes)
+            if not data:
+                break
+            scanner.feed(data)
+    return scanner.finish().audio_start
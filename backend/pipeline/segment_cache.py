@@ -0,0 +1,198 @@
+"""
+Content-addressed cache for synthesized TTS segments.
+Segments are keyed by (voice_id, model_id, normalized text) and stored on local
+disk with size-bounded LRU eviction, backed by an optional S3 tier.
+"""
+
+import os
+import re
+import shutil
+import hashlib
+import logging
+import threading
+import unicodedata
+from typing import Optional
+from botocore.exceptions import ClientError
+
+from .metrics import BYTES_UPLOADED
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text so that trivially different lines share a cache entry."""
+    text = unicodedata.normalize("NFC", text)
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+class SegmentCache:
+    """Two-tier (local disk + S3) cache of synthesized MP3 segments."""
+
+    def __init__(self, cache_dir: str, max_bytes: int, s3_client=None, bucket_name: str = None, s3_prefix: str = "tts-cache/"):
+        """
+        Args:
+            cache_dir: Local directory holding cached segments
+            max_bytes: Size budget for the local tier; least recently used entries are evicted beyond it
+            s3_client: Optional boto3 S3 client for the shared tier
+            bucket_name: Bucket for the S3 tier
+            s3_prefix: Key prefix for segments in the S3 tier
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.s3_client = s3_client if bucket_name else None
+        self.bucket_name = bucket_name
+        self.s3_prefix = s3_prefix
+        self._lock = threading.Lock()
+        self._counters = {"local_hits": 0, "s3_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._size_bytes = sum(size for _, size, _ in self._entries())
+
+    @staticmethod
+    def make_key(voice_id: str, model_id: str, text: str) -> str:
+        """Build the content address for a segment."""
+        payload = "\x1f".join([voice_id, model_id, normalize_text(text)])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _local_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.mp3")
+
+    def _s3_key(self, key: str) -> str:
+        return f"{self.s3_prefix}{key[:2]}/{key}.mp3"
+
+    def _count(self, counter: str, amount: int = 1):
+        with self._lock:
+            self._counters[counter] += amount
+
+    def stats(self) -> dict:
+        """Hit/miss counters for this process."""
+        with self._lock:
+            stats = dict(self._counters)
+            stats["size_bytes"] = self._size_bytes
+        lookups = stats["local_hits"] + stats["s3_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["local_hits"] + stats["s3_hits"]) / lookups, 4) if lookups else 0.0
+        return stats
+
+    def fetch(self, key: str, dest_path: str) -> Optional[str]:
+        """
+        Materialize a cached segment at dest_path.
+
+        Checks the local tier first, then S3. S3 hits are promoted to the local tier.
+
+        Returns:
+            The tier that served the segment ("local" or "s3"), or None on a miss
+        """
+        local_path = self._local_path(key)
+
+        if os.path.exists(local_path):
+            try:
+                os.utime(local_path)  # Bump recency for LRU eviction
+                self._link_or_copy(local_path, dest_path)
+                self._count("local_hits")
+                return "local"
+            except FileNotFoundError:
+                pass  # Evicted between the check and the link
+
+        if self.s3_client:
+            try:
+                self._download(key, local_path)
+                self._link_or_copy(local_path, dest_path)
+                self._count("s3_hits")
+                self._evict_if_needed()
+                return "s3"
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") not in ("404", "NoSuchKey"):
+                    logger.warning(f"[TTS CACHE] S3 lookup failed for {key}: {str(e)}")
+            except Exception as e:
+                logger.warning(f"[TTS CACHE] S3 lookup failed for {key}: {str(e)}")
+
+        self._count("misses")
+        return None
+
+    def store(self, key: str, src_path: str) -> None:
+        """Add a freshly synthesized segment to both tiers. Failures are logged, never raised."""
+        local_path = self._local_path(key)
+        try:
+            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+            tmp_path = f"{local_path}.{threading.get_ident()}.tmp"
+            self._link_or_copy(src_path, tmp_path)
+            os.replace(tmp_path, local_path)
+            with self._lock:
+                self._size_bytes += os.path.getsize(local_path)
+            self._count("stores")
+        except OSError as e:
+            logger.warning(f"[TTS CACHE] Failed to store {key} locally: {str(e)}")
+            return
+
+        if self.s3_client:
+            try:
+                self.s3_client.upload_file(
+                    local_path, self.bucket_name, self._s3_key(key),
+                    ExtraArgs={'ContentType': 'audio/mpeg', 'ACL': 'private'}
+                )
+                BYTES_UPLOADED.labels("tts_cache").inc(os.path.getsize(local_path))
+            except Exception as e:
+                logger.warning(f"[TTS CACHE] Failed to store {key} in S3: {str(e)}")
+
+        self._evict_if_needed()
+
+    def _download(self, key: str, local_path: str) -> None:
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        tmp_path = f"{local_path}.{threading.get_ident()}.tmp"
+        try:
+            self.s3_client.download_file(self.bucket_name, self._s3_key(key), tmp_path)
+            os.replace(tmp_path, local_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        with self._lock:
+            self._size_bytes += os.path.getsize(local_path)
+
+    @staticmethod
+    def _link_or_copy(src: str, dest: str) -> None:
+        """Hardlink when possible (same filesystem), otherwise copy."""
+        if os.path.exists(dest):
+            os.remove(dest)
+        try:
+            os.link(src, dest)
+        except OSError:
+            shutil.copyfile(src, dest)
+
+    def _entries(self):
+        """Yield (path, size, mtime) for every cached segment."""
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".mp3"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, stat.st_size, stat.st_mtime
+
+    def _evict_if_needed(self) -> None:
+        """Remove least recently used segments until the local tier fits its budget."""
+        with self._lock:
+            if self._size_bytes <= self.max_bytes:
+                return
+
+            # Rescan: other worker processes may share this directory
+            entries = sorted(self._entries(), key=lambda entry: entry[2])
+            total = sum(size for _, size, _ in entries)
+            evicted = 0
+            for path, size, _ in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                    evicted += 1
+                except FileNotFoundError:
+                    continue
+
+            self._size_bytes = total
+            self._counters["evictions"] += evicted
+
+        if evicted:
+            logger.info(f"[TTS CACHE] Evicted {evicted} segments, local tier now {total} bytes")
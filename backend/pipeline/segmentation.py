@@ -0,0 +1,116 @@
+"""
+Script segmentation between script generation and synthesis.
+Regroups parsed script lines into TTS requests of a useful size: consecutive
+lines of the same speaker are merged up to a character budget, and turns
+over the budget are split at sentence boundaries. Every request still has a
+single speaker, and the text is spoken in exactly the script's order. Works
+on a complete script or on lines streamed from one.
+"""
+
+import re
+import logging
+from typing import Iterable, Iterator
+
+from .tts import ScriptLine
+
+logger = logging.getLogger(__name__)
+
+_SENTENCE_END = re.compile(r'(?:(?<=[.!?…])|(?<=[.!?…]["\')\]]))\s+')
+_CLAUSE_END = re.compile(r'(?<=[,;:—])\s+')
+
+
+def _pack(pieces: list[str], max_chars: int) -> list[str]:
+    """Greedily join pieces with spaces into strings of at most max_chars (single pieces may exceed it)."""
+    packed = []
+    current = ""
+    for piece in pieces:
+        if current and len(current) + 1 + len(piece) > max_chars:
+            packed.append(current)
+            current = piece
+        else:
+            current = f"{current} {piece}" if current else piece
+    if current:
+        packed.append(current)
+    return packed
+
+
+def split_text(text: str, max_chars: int) -> list[str]:
+    """
+    Split text into pieces of at most max_chars, preferring sentence boundaries.
+
+    A sentence longer than max_chars is split at clause punctuation, and
+    failing that between words. A single word longer than max_chars is kept whole.
+    """
+    if len(text) <= max_chars:
+        return [text]
+
+    pieces = []
+    for sentence in _pack(_SENTENCE_END.split(text), max_chars):
+        if len(sentence) <= max_chars:
+            pieces.append(sentence)
+            continue
+        for clause in _pack(_CLAUSE_END.split(sentence), max_chars):
+            pieces.extend([clause] if len(clause) <= max_chars else _pack(clause.split(), max_chars))
+    return pieces
+
+
+def iter_segments(lines: Iterable[ScriptLine], max_chars: int) -> Iterator[ScriptLine]:
+    """
+    Regroup script lines into TTS requests as the lines arrive.
+
+    A speaker's turn is emitted once the next speaker's line arrives (or the
+    lines end), so at most one turn is held back from a streamed script.
+
+    Args:
+        lines: Parsed script lines, in script order
+        max_chars: Character budget per request; 0 passes the lines through unchanged
+
+    Yields:
+        ScriptLine per request, in script order, indexed sequentially
+    """
+    if max_chars <= 0:
+        yield from lines
+        return
+
+    index = 0
+    turn = None  # (speaker, voice_id, texts) of the turn being collected
+
+    def flush():
+        nonlocal index
+        speaker, voice_id, texts = turn
+        # Short lines are packed together; a long one is split, and its pieces packed with its neighbours
+        pieces = [piece for text in texts for piece in split_text(text, max_chars)]
+        for text in _pack(pieces, max_chars):
+            yield ScriptLine(index, speaker, voice_id, text)
+            index += 1
+
+    for line in lines:
+        text = line.text.strip()
+        if not text:
+            continue
+        if turn and turn[0] == line.speaker:
+            turn[2].append(text)
+            continue
+        if turn:
+            yield from flush()
+        turn = (line.speaker, line.voice_id, [text])
+    if turn:
+        yield from flush()
+
+
+def segment_script(lines: list[ScriptLine], max_chars: int, podcast_id: str = "") -> list[ScriptLine]:
+    """
+    Regroup script lines into TTS requests.
+
+    Args:
+        lines: Parsed script lines, in script order
+        max_chars: Character budget per request; 0 keeps the lines as they are
+        podcast_id: Podcast ID for logging
+
+    Returns:
+        ScriptLine per request, in script order, indexed sequentially
+    """
+    segments = list(iter_segments(lines, max_chars))
+    if max_chars > 0:
+        logger.info(f"[TTS] Segmented {len(lines)} script lines into {len(segments)} requests for podcast {podcast_id}")
+    return segments
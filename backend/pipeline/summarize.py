@@ -0,0 +1,166 @@
+"""
+Map-reduce summarization of long documents.
+Documents are split on page and section boundaries, the chunks are summarized
+concurrently, and the partial summaries are reduced into the structured summary
+used for script generation.
+"""
+
+import re
+import logging
+
+from .llm import LLMStage
+
+logger = logging.getLogger(__name__)
+
+# Separator between pages in extracted text
+PAGE_SEPARATOR = "\f"
+
+# Partial summaries that still don't fit after this many map passes are reduced anyway
+MAX_MAP_LEVELS = 3
+
+
+def build_summary_prompt(source_text: str) -> str:
+    """Prompt for the structured podcast summary of a document (or of its partial summaries)."""
+    return f"""
+    Analyze the following text and create a detailed, structured summary.
+    Create a comprehensive 5 minute (strictly) podcast discussion covering all major topics.
+
+    Identify and extract:
+    1. The core thesis or main argument
+    2. The top key topics or supporting points maximizing coverage (for a 5 minute discussion)
+    3. Any important data, statistics, or case studies mentioned
+    4. The primary conclusion or takeaway
+
+    Do not make up information. Base your summary strictly on the provided text.
+
+    ---
+    {source_text}
+    ---
+    """
+
+
+def build_chunk_prompt(chunk_text: str, chunk_number: int, chunk_count: int) -> str:
+    """Prompt summarizing one section of a longer document."""
+    return f"""
+    The following text is part {chunk_number} of {chunk_count} of a longer document.
+    Summarize this part in detail so it can later be merged with summaries of the other parts.
+
+    Capture:
+    1. The arguments and topics covered in this part
+    2. Any important data, statistics, or case studies, with their figures
+    3. Any conclusions drawn in this part
+
+    Do not make up information. Base your summary strictly on the provided text.
+
+    ---
+    {chunk_text}
+    ---
+    """
+
+
+def _split_oversized(text: str, max_chars: int) -> list[str]:
+    """Split text longer than max_chars at section, then paragraph, then line boundaries."""
+    for pattern in (r'\n\s*\n', r'\n'):
+        parts = [part for part in re.split(pattern, text) if part.strip()]
+        if len(parts) > 1:
+            break
+    else:
+        # No structure to split on; fall back to fixed-size cuts
+        return [text[i:i + max_chars] for i in range(0, len(text), max_chars)]
+
+    pieces = []
+    for part in parts:
+        if len(part) > max_chars:
+            pieces.extend(_split_oversized(part, max_chars))
+        else:
+            pieces.append(part)
+    return pieces
+
+
+def split_document(pages: list[str], max_chars: int) -> list[str]:
+    """
+    Group pages into chunks of at most max_chars characters.
+
+    Pages are kept whole where possible; pages larger than a chunk are split
+    on section and paragraph boundaries.
+
+    Args:
+        pages: Page texts in document order
+        max_chars: Maximum characters per chunk
+
+    Returns:
+        Chunk texts in document order
+    """
+    chunks = []
+    current = []
+    current_len = 0
+
+    for page in pages:
+        if not page.strip():
+            continue
+        pieces = _split_oversized(page, max_chars) if len(page) > max_chars else [page]
+        for piece in pieces:
+            if current and current_len + len(piece) > max_chars:
+                chunks.append("\n".join(current))
+                current, current_len = [], 0
+            current.append(piece)
+            current_len += len(piece)
+
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+class MapReduceSummarizer:
+    """Summarizes documents of any length with a bounded number of concurrent Gemini calls."""
+
+    def __init__(self, llm, chunk_chars: int = 30000):
+        """
+        Args:
+            llm: LLMOrchestrator used for all calls (its max_workers bounds parallelism)
+            chunk_chars: Maximum characters sent in a single summarization prompt
+        """
+        self.llm = llm
+        self.chunk_chars = chunk_chars
+
+    def summarize(self, source_text: str, podcast_id: str = "") -> str:
+        """
+        Produce the structured summary for a document.
+
+        Args:
+            source_text: Extracted text, with pages separated by PAGE_SEPARATOR
+            podcast_id: Podcast ID for logging
+
+        Returns:
+            Structured summary text
+        """
+        pages = source_text.split(PAGE_SEPARATOR)
+        if len(source_text) <= self.chunk_chars:
+            return self.llm.generate(build_summary_prompt(source_text.replace(PAGE_SEPARATOR, "\n")), stage="summarize")
+
+        partials = pages
+        level = 0
+        # Map until the partial summaries fit in one reduce prompt
+        while sum(len(partial) for partial in partials) > self.chunk_chars and level < MAX_MAP_LEVELS:
+            chunks = split_document(partials, self.chunk_chars)
+            logger.info(f"[SUMMARY] Map level {level}: summarizing {len(chunks)} chunks for podcast {podcast_id}")
+            partials = self._map(chunks, level)
+            level += 1
+
+        logger.info(f"[SUMMARY] Reducing {len(partials)} partial summaries for podcast {podcast_id}")
+        return self.llm.generate(build_summary_prompt("\n\n".join(partials)), stage="summarize_reduce")
+
+    def _map(self, chunks: list[str], level: int) -> list[str]:
+        if len(chunks) == 1:
+            # Cannot shrink by splitting further; summarize the single chunk as-is
+            return [self.llm.generate(build_chunk_prompt(chunks[0], 1, 1), stage=f"summarize_map_{level}_0")]
+
+        stages = [
+            LLMStage(
+                f"summarize_map_{level}_{i}",
+                lambda _, text=chunk, number=i + 1: build_chunk_prompt(text, number, len(chunks))
+            )
+            for i, chunk in enumerate(chunks)
+        ]
+        outputs = self.llm.run(stages)
+        return [outputs[stage.name] for stage in stages]
@@ -0,0 +1,300 @@
+"""
+Text-to-speech synthesis stage.
+Synthesizes podcast script lines with ElevenLabs using a bounded thread pool,
+writing each line to its own ordered chunk file. Lines can be fed while the
+script is still being generated. Lines already present in the segment cache
+are reused instead of being synthesized again. Each chunk's MP3 frames are
+indexed as it is written, so durations need no later pass.
+"""
+
+import os
+import re
+import time
+import queue
+import logging
+import threading
+from contextlib import nullcontext
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, NamedTuple, Optional
+
+from .metrics import TTS_LINE_SECONDS, TTS_CHARACTERS, RETRIES
+from .mp3 import Mp3FrameScanner, Mp3Info, index_mp3
+
+logger = logging.getLogger(__name__)
+
+# ElevenLabs voice mapping
+VOICE_MAP = {
+    "DOROTHY": "ThT5KcBeYPX3keUQqHPh",
+    "WILL": "bIHbv24MWmeRgasZH58o"
+}
+
+TTS_MODEL_ID = "eleven_multilingual_v2"
+
+
+class ScriptLine(NamedTuple):
+    """A single speakable line of the podcast script."""
+    index: int
+    speaker: str
+    voice_id: str
+    text: str
+
+
+class SynthesizedChunk(NamedTuple):
+    """A chunk file and the index of its MP3 frames."""
+    path: str
+    audio: Mp3Info
+    cache: Optional[str] = None  # Segment cache lookup: "local", "s3", "miss", or None if not consulted
+
+
+def _parse_line(raw_line: str, index: int, podcast_id: str):
+    """Parse one "Speaker: text" line, or return None if it is not speakable."""
+    raw_line = raw_line.strip()
+    if not raw_line:
+        return None
+
+    match = re.match(r'^(\w+):\s*(.*)', raw_line)
+    if not match:
+        return None
+
+    speaker, text_to_speak = match.groups()
+    speaker = speaker.upper()
+
+    if speaker not in VOICE_MAP:
+        logger.warning(f"[TTS] Warning: Skipping line with unknown speaker: {speaker} in podcast {podcast_id}")
+        return None
+
+    return ScriptLine(index, speaker, VOICE_MAP[speaker], text_to_speak)
+
+
+class ScriptLineParser:
+    """
+    Incremental parse_script for a script that arrives in pieces, e.g. a streamed Gemini response.
+
+    feed() returns the lines each piece completes; finish() returns the last
+    line if the script does not end with a newline.
+    """
+
+    def __init__(self, podcast_id: str = ""):
+        """
+        Args:
+            podcast_id: Podcast ID for logging
+        """
+        self.podcast_id = podcast_id
+        self.count = 0
+        self._partial = ""
+
+    def feed(self, text: str) -> list[ScriptLine]:
+        raw_lines = (self._partial + text).split('\n')
+        self._partial = raw_lines.pop()
+        return self._parse(raw_lines)
+
+    def finish(self) -> list[ScriptLine]:
+        raw_line, self._partial = self._partial, ""
+        return self._parse([raw_line])
+
+    def _parse(self, raw_lines: list[str]) -> list[ScriptLine]:
+        lines = []
+        for raw_line in raw_lines:
+            line = _parse_line(raw_line, self.count, self.podcast_id)
+            if line:
+                lines.append(line)
+                self.count += 1
+        return lines
+
+
+def parse_script(script: str, podcast_id: str = "") -> list[ScriptLine]:
+    """
+    Parse a generated script into ordered, speakable lines.
+
+    Lines without a known speaker label are skipped. Indexes are assigned
+    sequentially so they can be used directly as chunk numbers.
+
+    Args:
+        script: Raw script text with "Speaker: text" lines
+        podcast_id: Podcast ID for logging
+
+    Returns:
+        List of ScriptLine in script order
+    """
+    parser = ScriptLineParser(podcast_id)
+    return parser.feed(script.strip()) + parser.finish()
+
+
+def chunk_path(output_dir: str, index: int) -> str:
+    """Path of the chunk file for a given line index."""
+    return os.path.join(output_dir, f"chunk_{index:04d}.mp3")
+
+
+class TTSSynthesizer:
+    """Synthesizes script lines concurrently with per-line retries."""
+
+    def __init__(self, client, max_workers: int = 4, max_retries: int = 3, backoff_seconds: float = 1.0, cache=None,
+                 concurrency=None, queue_size: int = 4):
+        """
+        Args:
+            client: ElevenLabs client instance
+            max_workers: Number of lines synthesized at the same time
+            max_retries: Retries per line before the stage fails
+            backoff_seconds: Base delay for exponential backoff between retries
+            cache: Optional SegmentCache consulted before calling ElevenLabs
+            concurrency: Optional callable returning a context manager held around each
+                ElevenLabs request, e.g. a semaphore shared across workers
+            queue_size: Lines taken from a lazy input ahead of the synthesis workers
+        """
+        self.client = client
+        self.cache = cache
+        self.concurrency = concurrency or nullcontext
+        self.max_workers = max(1, max_workers)
+        self.max_pending = self.max_workers + max(0, queue_size)
+        self.max_retries = max(0, max_retries)
+        self.backoff_seconds = backoff_seconds
+
+    def synthesize_line(self, line: ScriptLine, output_dir: str) -> SynthesizedChunk:
+        """
+        Synthesize one line to its chunk file, retrying transient failures.
+
+        Audio is streamed to a temporary file and renamed into place, so a
+        chunk file only exists once it is complete. A chunk left behind by an
+        earlier attempt of the task is reused as-is.
+
+        Returns:
+            The written chunk file and its frame index
+        """
+        output_path = chunk_path(output_dir, line.index)
+        partial_path = f"{output_path}.part"
+
+        if os.path.exists(output_path):
+            return SynthesizedChunk(output_path, index_mp3(output_path))
+
+        cache_key = None
+        if self.cache:
+            cache_key = self.cache.make_key(line.voice_id, TTS_MODEL_ID, line.text)
+            tier = self.cache.fetch(cache_key, output_path)
+            if tier:
+                TTS_CHARACTERS.labels("cached").inc(len(line.text))
+                return SynthesizedChunk(output_path, index_mp3(output_path), tier)
+
+        for attempt in range(self.max_retries + 1):
+            started = time.perf_counter()
+            try:
+                # The response streams, so the slot is held until the audio is fully read
+                with self.concurrency():
+                    audio_iterator = self.client.text_to_speech.convert(
+                        voice_id=line.voice_id,
+                        text=line.text,
+                        model_id=TTS_MODEL_ID
+                    )
+
+                    # Write chunks directly to file (no buffering in memory), indexing frames on the way
+                    scanner = Mp3FrameScanner()
+                    with open(partial_path, 'wb') as f:
+                        for chunk in audio_iterator:
+                            f.write(chunk)
+                            scanner.feed(chunk)
+
+                os.replace(partial_path, output_path)
+                TTS_LINE_SECONDS.labels("ok").observe(time.perf_counter() - started)
+                TTS_CHARACTERS.labels("synthesized").inc(len(line.text))
+                if cache_key:
+                    self.cache.store(cache_key, output_path)
+                return SynthesizedChunk(output_path, scanner.finish(), "miss" if cache_key else None)
+
+            except Exception as e:
+                TTS_LINE_SECONDS.labels("error").observe(time.perf_counter() - started)
+                if os.path.exists(partial_path):
+                    os.remove(partial_path)
+                if attempt >= self.max_retries:
+                    raise
+                RETRIES.labels("tts_line").inc()
+                delay = self.backoff_seconds * (2 ** attempt)
+                logger.warning(
+                    f"[TTS] Line {line.index} ({line.speaker}) failed on attempt {attempt + 1}: {e}. "
+                    f"Retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+
+    def synthesize(self, lines: Iterable[ScriptLine], output_dir: str, podcast_id: str = "", on_chunk=None) -> list[SynthesizedChunk]:
+        """
+        Synthesize all lines with bounded parallelism.
+
+        lines may be lazy, e.g. parsed from a script that is still being
+        generated. It is consumed on a separate thread that runs at most
+        max_pending lines ahead of the finished ones, so a fast producer is
+        held back rather than queueing the whole script.
+
+        Args:
+            lines: Script lines to synthesize, with sequential indexes
+            output_dir: Directory to write chunk_{index:04d}.mp3 files into
+            podcast_id: Podcast ID for logging
+            on_chunk: Optional callback(line, SynthesizedChunk), called from the calling
+                thread as each chunk completes (in completion order)
+
+        Returns:
+            SynthesizedChunk per line, in script order
+
+        Raises:
+            Exception: The first line failure once its retries are exhausted, or an error raised by lines
+        """
+        chunks = {}
+        completed = 0
+        total = None  # known once lines is exhausted
+        completions = queue.Queue()  # (line, future) as lines finish; (None, count or error) when lines ends
+        pending = threading.BoundedSemaphore(self.max_pending)
+        stop = threading.Event()
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="tts")
+
+        def on_done(line, future):
+            pending.release()
+            completions.put((line, future))
+
+        def feed():
+            submitted = 0
+            try:
+                for line in lines:
+                    while not pending.acquire(timeout=0.5):
+                        if stop.is_set():
+                            return
+                    if stop.is_set():
+                        return
+                    future = executor.submit(self.synthesize_line, line, output_dir)
+                    future.add_done_callback(lambda f, line=line: on_done(line, f))
+                    submitted += 1
+            except Exception as e:
+                completions.put((None, e))
+                return
+            completions.put((None, submitted))
+
+        feeder = threading.Thread(target=feed, name="tts-feed", daemon=True)
+        feeder.start()
+        try:
+            while total is None or completed < total:
+                line, result = completions.get()
+                if line is None:
+                    if isinstance(result, Exception):
+                        raise result
+                    total = result
+                    continue
+                chunks[line.index] = result.result()
+                completed += 1
+                logger.info(f"[TTS] Chunk {line.index} saved for {line.speaker} ({completed}/{total or '?'}) in podcast {podcast_id}")
+                if on_chunk:
+                    on_chunk(line, chunks[line.index])
+        finally:
+            # On failure, stop taking lines and drop those that have not started yet.
+            # The feeder is not joined then: it may be blocked on a slow producer.
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        if self.cache:
+            # Counted from this call's chunks; cache.stats() covers every podcast in the process
+            lookups = Counter(chunk.cache for chunk in chunks.values() if chunk.cache)
+            hits = lookups["local"] + lookups["s3"]
+            hit_rate = hits / (hits + lookups["miss"]) if hits + lookups["miss"] else 0.0
+            logger.info(
+                f"[TTS] Segment cache for podcast {podcast_id}: local hits {lookups['local']}, "
+                f"S3 hits {lookups['s3']}, misses {lookups['miss']} (hit rate {hit_rate:.0%})"
+            )
+
+        return [chunks[index] for index in sorted(chunks)]
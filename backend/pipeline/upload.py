@@ -0,0 +1,115 @@
+"""
+Streaming uploads of generated audio to S3.
+Files are handed to boto3's managed transfer as open handles, so the episode is
+never held in memory, and can be uploaded while ffmpeg is still writing them.
+"""
+
+import os
+import time
+import logging
+from boto3.s3.transfer import TransferConfig
+
+from .metrics import BYTES_UPLOADED, timed
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+
+def build_transfer_config(chunk_size_mb: int = 8, threshold_mb: int = 8, max_concurrency: int = 4) -> TransferConfig:
+    """
+    Build the multipart TransferConfig used for final audio uploads.
+
+    Args:
+        chunk_size_mb: Multipart part size
+        threshold_mb: Files larger than this are uploaded in parts
+        max_concurrency: Parts uploaded in parallel
+    """
+    return TransferConfig(
+        multipart_chunksize=chunk_size_mb * MB,
+        multipart_threshold=threshold_mb * MB,
+        max_concurrency=max_concurrency,
+        use_threads=max_concurrency > 1,
+    )
+
+
+class GrowingFileReader:
+    """
+    Read-only file object over a file that another process is still writing.
+
+    Reads block until the requested bytes are available or the writer has
+    exited, so the reader sees the complete file exactly once.
+    """
+
+    def __init__(self, path: str, process, poll_interval: float = 0.05, timeout: float = 600):
+        """
+        Args:
+            path: File being written
+            process: subprocess.Popen of the writer
+            poll_interval: Delay between checks for new data
+            timeout: Seconds without new data before giving up
+        """
+        self.path = path
+        self.process = process
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.bytes_read = 0
+        self._file = None
+
+    def _open(self):
+        deadline = time.monotonic() + self.timeout
+        while not os.path.exists(self.path):
+            if self.process.poll() is not None:
+                raise RuntimeError(f"Writer exited before creating {self.path}")
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Timed out waiting for {self.path}")
+            time.sleep(self.poll_interval)
+        self._file = open(self.path, 'rb')
+
+    def read(self, size: int = -1) -> bytes:
+        if self._file is None:
+            self._open()
+
+        buffer = bytearray()
+        deadline = time.monotonic() + self.timeout
+        while size < 0 or len(buffer) < size:
+            data = self._file.read(-1 if size < 0 else size - len(buffer))
+            if data:
+                buffer.extend(data)
+                deadline = time.monotonic() + self.timeout
+                continue
+            if self.process.poll() is not None:
+                # Writer finished; drain anything flushed after the last read
+                buffer.extend(self._file.read(-1 if size < 0 else size - len(buffer)))
+                break
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"No new data written to {self.path} for {self.timeout}s")
+            time.sleep(self.poll_interval)
+
+        self.bytes_read += len(buffer)
+        return bytes(buffer)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def close(self):
+        if self._file:
+            self._file.close()
+
+
+def upload_file_streaming(s3_client, fileobj, bucket_name: str, s3_key: str, transfer_config: TransferConfig) -> None:
+    """Upload an open file object to S3 as an MP3 using multipart transfer."""
+    # Sized up front: the transfer may close a regular file handle when it finishes
+    size = None if isinstance(fileobj, GrowingFileReader) else os.fstat(fileobj.fileno()).st_size
+    with timed("s3_upload"):
+        s3_client.upload_fileobj(
+            fileobj,
+            bucket_name,
+            s3_key,
+            ExtraArgs={'ContentType': 'audio/mpeg', 'ACL': 'private'},
+            Config=transfer_config
+        )
+    BYTES_UPLOADED.labels("final_audio").inc(fileobj.bytes_read if size is None else size)
@@ -2,12 +2,28 @@
 
 from .s3_service import s3_service
 from .auth_service import auth_service
-from .elevenlabs_service import get_elevenlabs_credits, has_sufficient_credits
+from .elevenlabs_service import get_elevenlabs_credits, has_sufficient_credits, reserve_credits, renew_credits, release_credits
+from .progress_service import progress_publisher, stream_progress, format_sse, TERMINAL_STATUSES
+from .fingerprint_service import fingerprint_file, combine_fingerprint, s3_key_from_url
+from .scheduler_service import podcast_scheduler, tts_semaphore, QueueFullError
 
 __all__ = [
     "s3_service",
     "auth_service",
     "get_elevenlabs_credits",
     "has_sufficient_credits",
+    "reserve_credits",
+    "renew_credits",
+    "release_credits",
+    "progress_publisher",
+    "stream_progress",
+    "format_sse",
+    "TERMINAL_STATUSES",
+    "fingerprint_file",
+    "combine_fingerprint",
+    "s3_key_from_url",
+    "podcast_scheduler",
+    "tts_semaphore",
+    "QueueFullError",
     "ContentValidationError",
 ]
@@ -1,12 +1,19 @@
 """
 ElevenLabs API service for managing credits and account information.
+The credit balance is cached and refreshed in the background, so request
+handlers don't wait on the subscription endpoint.
 """
 
 import logging
+import threading
+import time
+import redis
 from elevenlabs.client import ElevenLabs
 import os
+from backend.core import get_settings
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_API_KEY")
 
@@ -17,9 +24,11 @@ else:
     elevenlabs_client = ElevenLabs(api_key=ELEVENLABS_API_KEY)
 
 
-def get_elevenlabs_credits() -> dict:
+def fetch_elevenlabs_credits() -> dict:
     """
-    Fetch ElevenLabs account credits and subscription information.
+    Fetch ElevenLabs account credits and subscription information from the API.
+
+    Request handlers should use get_elevenlabs_credits(), which serves a cached balance.
 
     Returns:
         dict: Account information including:
@@ -69,6 +78,182 @@ def get_elevenlabs_credits() -> dict:
         raise
 
 
+class CreditBalanceCache:
+    """
+    Cached ElevenLabs credit balance with a background refresher.
+
+    Characters reserved for enqueued podcasts are deducted from the balance
+    until the worker releases them, so bursts of creates don't all see the
+    same balance. Reservations live in Redis so that workers can release
+    them; they also expire, in case a worker dies before releasing. Workers
+    renew them as the podcast starts and after each stage.
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        ttl_seconds: float = 60,
+        refresh_seconds: float = 30,
+        reservation_ttl_seconds: float = 2100,
+        key: str = "elevenlabs:reservations",
+    ):
+        """
+        Args:
+            redis_url: Redis holding the reservations
+            ttl_seconds: Age after which a cached balance is refreshed inline
+            refresh_seconds: Interval of the background refresh
+            reservation_ttl_seconds: How long an unreleased reservation is deducted after it is made or
+                renewed (longer than the slowest stage)
+            key: Redis hash of podcast id -> "characters:expires_at"
+        """
+        self.redis_url = redis_url
+        self.ttl_seconds = ttl_seconds
+        self.refresh_seconds = refresh_seconds
+        self.reservation_ttl_seconds = reservation_ttl_seconds
+        self.key = key
+        self._client = None
+        self._credits = None
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refresher = None
+
+    def refresh(self) -> dict:
+        """Fetch a fresh balance from ElevenLabs and cache it."""
+        with self._refresh_lock:
+            credits = fetch_elevenlabs_credits()
+            with self._lock:
+                self._credits = credits
+                self._fetched_at = time.monotonic()
+            return credits
+
+    def get(self) -> dict:
+        """
+        Return the cached balance, refreshing inline only if it is missing or stale.
+
+        A stale balance is still served if the refresh fails, up to 10x the TTL.
+        """
+        self._ensure_refresher()
+        with self._lock:
+            credits, age = self._credits, time.monotonic() - self._fetched_at
+        if credits is not None and age < self.ttl_seconds:
+            return credits
+
+        try:
+            return self.refresh()
+        except Exception:
+            if credits is not None and age < self.ttl_seconds * 10:
+                logger.warning(f"[ELEVENLABS] Refresh failed, serving cached credits ({age:.0f}s old)")
+                return credits
+            raise
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = redis.Redis.from_url(self.redis_url, decode_responses=True)
+        return self._client
+
+    def reserve(self, key: str, characters: int, wait_seconds: float = 0) -> None:
+        """Deduct characters for a podcast until released or expired; reserving again renews the lifetime."""
+        expires_at = time.time() + wait_seconds + self.reservation_ttl_seconds
+        self.client.hset(self.key, key, f"{characters}:{expires_at}")
+
+    def release(self, key: str) -> None:
+        """Stop deducting a podcast's reservation."""
+        self.client.hdel(self.key, key)
+
+    def reserved_characters(self) -> int:
+        now = time.time()
+        reserved, expired = 0, []
+        for key, value in self.client.hgetall(self.key).items():
+            characters, expires_at = value.split(":")
+            if float(expires_at) > now:
+                reserved += int(characters)
+            else:
+                expired.append(key)
+        if expired:
+            self.client.hdel(self.key, *expired)
+        return reserved
+
+    def _ensure_refresher(self) -> None:
+        if self._refresher is not None or self.refresh_seconds <= 0 or not elevenlabs_client:
+            return
+        with self._lock:
+            if self._refresher is None:
+                self._refresher = threading.Thread(target=self._refresh_loop, name="elevenlabs-credits", daemon=True)
+                self._refresher.start()
+
+    def _refresh_loop(self) -> None:
+        while True:
+            time.sleep(self.refresh_seconds)
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning(f"[ELEVENLABS] Background credit refresh failed: {str(e)}")
+
+
+credit_cache = CreditBalanceCache(
+    settings.REDIS_URL,
+    ttl_seconds=settings.ELEVENLABS_CREDITS_TTL_SECONDS,
+    refresh_seconds=settings.ELEVENLABS_CREDITS_REFRESH_SECONDS,
+    reservation_ttl_seconds=settings.ELEVENLABS_RESERVATION_TTL_SECONDS
+)
+
+
+def get_elevenlabs_credits() -> dict:
+    """
+    Get ElevenLabs credits from the cache, net of reservations.
+
+    Returns:
+        dict: Same fields as fetch_elevenlabs_credits(), where characters_available
+        excludes characters_reserved for enqueued podcasts
+
+    Raises:
+        Exception: If no balance is cached and ElevenLabs can't be reached
+    """
+    credits = dict(credit_cache.get())
+    try:
+        reserved = credit_cache.reserved_characters()
+    except redis.RedisError as e:
+        logger.warning(f"[ELEVENLABS] Could not read credit reservations, ignoring them: {str(e)}")
+        reserved = 0
+    credits["characters_reserved"] = reserved
+    credits["characters_available"] = credits["characters_available"] - reserved
+    return credits
+
+
+def reserve_credits(podcast_id: str, characters: int = 5000, wait_seconds: float = 0) -> None:
+    """
+    Reserve characters for an enqueued podcast so later checks account for it. Failures are logged, never raised.
+
+    Args:
+        podcast_id: Podcast the characters are reserved for
+        characters: Estimated characters the podcast will synthesize
+        wait_seconds: Expected time in the scheduler queue, added to the reservation's lifetime
+    """
+    try:
+        credit_cache.reserve(podcast_id, characters, wait_seconds)
+        logger.info(f"[ELEVENLABS] Reserved {characters} characters for podcast {podcast_id}")
+    except redis.RedisError as e:
+        logger.warning(f"[ELEVENLABS] Failed to reserve credits for podcast {podcast_id}: {str(e)}")
+
+
+def renew_credits(podcast_id: str, characters: int = 5000) -> None:
+    """Restart a running podcast's reservation lifetime, as it starts and after each stage. Failures are logged, never raised."""
+    try:
+        credit_cache.reserve(podcast_id, characters)
+    except redis.RedisError as e:
+        logger.warning(f"[ELEVENLABS] Failed to renew credits for podcast {podcast_id}: {str(e)}")
+
+
+def release_credits(podcast_id: str) -> None:
+    """Release a podcast's reservation once it has finished or failed. Failures are logged, never raised."""
+    try:
+        credit_cache.release(podcast_id)
+    except redis.RedisError as e:
+        logger.warning(f"[ELEVENLABS] Failed to release credits for podcast {podcast_id}: {str(e)}")
+
+
 def has_sufficient_credits(required_characters: int = 5000) -> bool:
     """
     Check if account has sufficient credits for podcast generation.
@@ -97,4 +282,4 @@ def has_sufficient_credits(required_characters: int = 5000) -> bool:
         return False
 
 
-__all__ = ["get_elevenlabs_credits", "has_sufficient_credits"]
+__all__ = ["get_elevenlabs_credits", "fetch_elevenlabs_credits", "has_sufficient_credits", "reserve_credits", "release_credits"]
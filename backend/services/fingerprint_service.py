@@ -0,0 +1,45 @@
+"""
+Document fingerprinting for deduplicating identical uploads.
+A fingerprint is the SHA-256 of the PDF contents plus the user's requirements,
+so identical submissions can reuse an earlier podcast's artifacts.
+The worker fingerprints the PDF it downloads for text extraction.
+"""
+
+import hashlib
+import logging
+from typing import Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+def s3_key_from_url(file_url: str) -> str:
+    """Extract the S3 object key from a stored S3 URL."""
+    return urlparse(file_url).path.lstrip('/')
+
+
+def combine_fingerprint(pdf_sha256: str, requirements: Optional[str]) -> str:
+    """Combine the PDF digest and the requirements into the document fingerprint."""
+    payload = f"{pdf_sha256}\x1f{(requirements or '').strip()}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def fingerprint_file(path: str, requirements: Optional[str]) -> str:
+    """
+    Fingerprint a downloaded PDF together with its requirements.
+
+    Args:
+        path: Local copy of the uploaded PDF
+        requirements: User customization instructions
+
+    Returns:
+        Hex fingerprint
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return combine_fingerprint(digest.hexdigest(), requirements)
+
+
+__all__ = ["fingerprint_file", "combine_fingerprint", "s3_key_from_url"]
@@ -0,0 +1,134 @@
+"""
+Podcast progress events over Redis pub/sub.
+The Celery worker publishes stage and progress events; the API fans them out
+to clients as Server-Sent Events instead of clients polling the database.
+"""
+
+import json
+import time
+import asyncio
+import logging
+from typing import Optional
+
+import redis
+import redis.asyncio as aioredis
+
+from backend.core import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Latest event per podcast, so late subscribers start from the current state
+SNAPSHOT_TTL_SECONDS = 3600
+
+TERMINAL_STATUSES = ("complete", "failed")
+
+
+def channel_for(podcast_id: str) -> str:
+    return f"podcast:{podcast_id}:events"
+
+
+def snapshot_key(podcast_id: str) -> str:
+    return f"podcast:{podcast_id}:latest"
+
+
+class ProgressPublisher:
+    """Publishes progress events from the worker. Failures are logged, never raised."""
+
+    def __init__(self, redis_url: str):
+        self.redis_url = redis_url
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = redis.Redis.from_url(self.redis_url)
+        return self._client
+
+    def publish(
+        self,
+        podcast_id: str,
+        status: str,
+        stage: Optional[str] = None,
+        message: Optional[str] = None,
+        current: Optional[int] = None,
+        total: Optional[int] = None,
+    ) -> None:
+        """
+        Publish a progress event for a podcast.
+
+        Args:
+            podcast_id: Podcast the event belongs to
+            status: Podcast status (pending, processing, complete, failed)
+            stage: Pipeline stage the event refers to
+            message: Human-readable progress message
+            current: Progress counter within the stage (e.g. lines synthesized)
+            total: Total for the progress counter
+        """
+        event = json.dumps({
+            "podcast_id": podcast_id,
+            "status": status,
+            "stage": stage,
+            "message": message,
+            "current": current,
+            "total": total,
+            "ts": time.time(),
+        })
+        try:
+            pipe = self.client.pipeline()
+            pipe.set(snapshot_key(podcast_id), event, ex=SNAPSHOT_TTL_SECONDS)
+            pipe.publish(channel_for(podcast_id), event)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"[PROGRESS] Failed to publish event for podcast {podcast_id}: {str(e)}")
+
+
+def format_sse(data: str, event: str = "progress") -> str:
+    """Format a Server-Sent Events message."""
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+async def stream_progress(podcast_id: str, heartbeat_seconds: float = 15):
+    """
+    Yield SSE messages for a podcast until it completes or fails.
+
+    Subscribes before reading the snapshot so no event between the two is lost.
+    Comment lines are sent as heartbeats to keep idle connections open.
+    """
+    client = aioredis.Redis.from_url(settings.REDIS_URL)
+    pubsub = client.pubsub()
+    try:
+        await pubsub.subscribe(channel_for(podcast_id))
+
+        snapshot = await client.get(snapshot_key(podcast_id))
+        if snapshot:
+            yield format_sse(snapshot.decode("utf-8"))
+            if json.loads(snapshot).get("status") in TERMINAL_STATUSES:
+                return
+
+        last_sent = time.monotonic()
+        while True:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            if message is None:
+                if time.monotonic() - last_sent >= heartbeat_seconds:
+                    yield ": heartbeat\n\n"
+                    last_sent = time.monotonic()
+                continue
+
+            data = message["data"].decode("utf-8")
+            yield format_sse(data)
+            last_sent = time.monotonic()
+            if json.loads(data).get("status") in TERMINAL_STATUSES:
+                return
+    except asyncio.CancelledError:
+        # Client disconnected
+        raise
+    finally:
+        await pubsub.unsubscribe(channel_for(podcast_id))
+        await pubsub.aclose()
+        await client.aclose()
+
+
+progress_publisher = ProgressPublisher(settings.REDIS_URL)
+
+__all__ = ["ProgressPublisher", "progress_publisher", "stream_progress", "format_sse", "TERMINAL_STATUSES"]
@@ -9,6 +9,7 @@ from datetime import datetime
 from botocore.config import Config
 from botocore.exceptions import ClientError
 from backend.core import get_settings
+from backend.utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +29,11 @@ class S3Service:
             region_name=settings.AWS_REGION,
         )
         self.bucket_name = settings.AWS_S3_BUCKET_NAME
+        # s3_key -> presigned GET URL at the default expiration, dropped once its remaining lifetime reaches the refresh threshold
+        self._download_urls = TTLCache(
+            max_size=settings.PRESIGNED_URL_CACHE_SIZE,
+            ttl_seconds=settings.PRESIGNED_URL_EXPIRATION_SECONDS - settings.PRESIGNED_URL_REFRESH_SECONDS
+        )
 
     def generate_presigned_url(self, user_id: str, filename: str) -> dict:
         """
@@ -90,13 +96,17 @@ class S3Service:
         """
         return f"https://{self.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/{s3_key}"
 
-    def generate_presigned_download_url(self, s3_key: str, expiration: int = 3600) -> str:
+    def generate_presigned_download_url(self, s3_key: str, expiration: int = None) -> str:
         """
         Generate a presigned GET URL for downloading/streaming a file from S3.
 
+        URLs are cached per key and reused while more than
+        PRESIGNED_URL_REFRESH_SECONDS of their lifetime is left, so repeated
+        reads of the same podcast return the same URL instead of re-signing.
+
         Args:
             s3_key: S3 object key
-            expiration: URL expiration time in seconds (default: 1 hour)
+            expiration: URL expiration time in seconds (default: PRESIGNED_URL_EXPIRATION_SECONDS)
 
         Returns:
             Presigned HTTPS URL to the file
@@ -104,18 +114,60 @@ class S3Service:
         Raises:
             Exception: If presigned URL generation fails
         """
+        expiration = expiration or settings.PRESIGNED_URL_EXPIRATION_SECONDS
+        cacheable = expiration == settings.PRESIGNED_URL_EXPIRATION_SECONDS
+        if cacheable:
+            url = self._download_urls.get(s3_key)
+            if url is not None:
+                return url
+
         try:
             url = self.client.generate_presigned_url(
                 'get_object',
                 Params={'Bucket': self.bucket_name, 'Key': s3_key},
                 ExpiresIn=expiration
             )
-            logger.info(f"Generated presigned download URL for {s3_key}")
+            logger.debug(f"Generated presigned download URL for {s3_key}")
+            if cacheable:
+                self._download_urls.set(s3_key, url)
             return url
         except ClientError as e:
             logger.error(f"Failed to generate presigned download URL: {str(e)}")
             raise Exception("Could not generate download URL") from e
 
+    def get_object_text(self, s3_key: str) -> str:
+        """
+        Read a small text object (e.g. an HLS playlist) from S3.
+
+        Args:
+            s3_key: S3 object key
+
+        Returns:
+            Object contents decoded as UTF-8
+
+        Raises:
+            Exception: If the object cannot be read
+        """
+        try:
+            response = self.client.get_object(Bucket=self.bucket_name, Key=s3_key)
+            return response["Body"].read().decode("utf-8")
+        except ClientError as e:
+            logger.error(f"Failed to read {s3_key}: {str(e)}")
+            raise Exception("Could not read object") from e
+
+    def get_object_size(self, s3_key: str) -> int:
+        """
+        Get an object's size in bytes with a HEAD request.
+
+        Raises:
+            Exception: If the object cannot be read
+        """
+        try:
+            return self.client.head_object(Bucket=self.bucket_name, Key=s3_key)["ContentLength"]
+        except ClientError as e:
+            logger.error(f"Failed to stat {s3_key}: {str(e)}")
+            raise Exception("Could not read object") from e
+
 
 # Singleton instance
 s3_service = S3Service()
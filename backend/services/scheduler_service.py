@@ -0,0 +1,458 @@
+"""
+Admission control and fair-share scheduling for podcast generation.
+
+The API submits jobs here instead of enqueueing Celery tasks directly. Jobs
+wait in Redis in per-user queues grouped into priority lanes (short documents
+ahead of long ones), and are handed to Celery round-robin across users only
+while fewer than SCHEDULER_MAX_INFLIGHT jobs are running. One user's backlog
+therefore queues behind their own jobs instead of everyone else's.
+
+Workers release their slot when a job finishes, which dispatches the next
+one. A distributed semaphore additionally caps concurrent ElevenLabs calls
+across all workers.
+"""
+
+import json
+import math
+import random
+import time
+import uuid
+import logging
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+import redis
+
+from backend.core import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Priority order; the last lane is still served every SCHEDULER_LONG_LANE_EVERY dispatches
+LANES = ("short", "long")
+
+# Every key a script touches is passed in KEYS, so each lane keeps its
+# per-user queues as JSON arrays in one hash rather than one list per user.
+SUBMIT_SCRIPT = """
+local queued, jobs, ring, queues = KEYS[1], KEYS[2], KEYS[3], KEYS[4]
+local podcast_id, user_id, lane = ARGV[1], ARGV[2], ARGV[3]
+local now, max_queued = tonumber(ARGV[4]), tonumber(ARGV[5])
+
+if max_queued > 0 and tonumber(redis.call('HGET', queued, user_id) or '0') >= max_queued then
+    return -1
+end
+
+local pending = redis.call('HGET', queues, user_id)
+local user_queue = pending and cjson.decode(pending) or {}
+if #user_queue == 0 then
+    redis.call('RPUSH', ring, user_id)
+end
+user_queue[#user_queue + 1] = podcast_id
+redis.call('HSET', queues, user_id, cjson.encode(user_queue))
+redis.call('HINCRBY', queued, user_id, 1)
+redis.call('HSET', jobs, podcast_id, cjson.encode({user = user_id, lane = lane, enqueued_at = now}))
+return #user_queue
+"""
+
+# Pops jobs round-robin across users, highest-priority lane first, until the
+# in-flight ceiling is reached. Expired in-flight leases are reclaimed first.
+# KEYS[5..] hold a ring and queues key per lane, in priority order.
+DISPATCH_SCRIPT = """
+local inflight, turn_key, jobs, queued = KEYS[1], KEYS[2], KEYS[3], KEYS[4]
+local now, max_inflight, lease = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+local low_lane_every = tonumber(ARGV[4])
+local lane_count = (#KEYS - 4) / 2
+
+redis.call('ZREMRANGEBYSCORE', inflight, '-inf', now)
+
+local function pop_lane(lane)
+    local ring, queues = KEYS[3 + 2 * lane], KEYS[4 + 2 * lane]
+    while true do
+        local user = redis.call('LPOP', ring)
+        if not user then return nil end
+        local pending = redis.call('HGET', queues, user)
+        local user_queue = pending and cjson.decode(pending) or {}
+        local job = table.remove(user_queue, 1)
+        if #user_queue > 0 then
+            redis.call('HSET', queues, user, cjson.encode(user_queue))
+            redis.call('RPUSH', ring, user)
+        else
+            redis.call('HDEL', queues, user)
+        end
+        if job then
+            if redis.call('HINCRBY', queued, user, -1) <= 0 then
+                redis.call('HDEL', queued, user)
+            end
+            return job
+        end
+    end
+end
+
+local started = {}
+while redis.call('ZCARD', inflight) < max_inflight do
+    local turn = redis.call('INCR', turn_key)
+    local job = nil
+    if low_lane_every > 0 and turn % low_lane_every == 0 then
+        job = pop_lane(lane_count)
+    end
+    local i = 1
+    while not job and i <= lane_count do
+        job = pop_lane(i)
+        i = i + 1
+    end
+    if not job then break end
+    redis.call('ZADD', inflight, now + lease, job)
+    local record = redis.call('HGET', jobs, job)
+    if record then
+        local fields = cjson.decode(record)
+        fields.dispatched_at = now
+        redis.call('HSET', jobs, job, cjson.encode(fields))
+    end
+    started[#started + 1] = job
+end
+return started
+"""
+
+# Puts a dispatched job that failed to start back at the head of its user's
+# queue, with that user next in the ring, and frees its in-flight slot.
+REQUEUE_SCRIPT = """
+local inflight, jobs, queued, ring, queues = KEYS[1], KEYS[2], KEYS[3], KEYS[4], KEYS[5]
+local podcast_id = ARGV[1]
+
+redis.call('ZREM', inflight, podcast_id)
+local record = redis.call('HGET', jobs, podcast_id)
+if not record then return 0 end
+
+local fields = cjson.decode(record)
+fields.dispatched_at = nil
+redis.call('HSET', jobs, podcast_id, cjson.encode(fields))
+
+local pending = redis.call('HGET', queues, fields.user)
+local user_queue = pending and cjson.decode(pending) or {}
+if #user_queue == 0 then
+    redis.call('LPUSH', ring, fields.user)
+end
+table.insert(user_queue, 1, podcast_id)
+redis.call('HSET', queues, fields.user, cjson.encode(user_queue))
+redis.call('HINCRBY', queued, fields.user, 1)
+return 1
+"""
+
+ACQUIRE_SLOT_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[3]) then
+    redis.call('ZADD', KEYS[1], ARGV[2], ARGV[4])
+    return 1
+end
+return 0
+"""
+
+
+class QueueFullError(Exception):
+    """Raised when a user already has the maximum number of queued podcasts."""
+
+
+class FairShareScheduler:
+    """Per-user fair queuing with priority lanes and a global in-flight ceiling."""
+
+    def __init__(
+        self,
+        redis_url: str,
+        max_inflight: int = 4,
+        max_queued_per_user: int = 5,
+        short_document_bytes: int = 2 * 1024 * 1024,
+        low_lane_every: int = 3,
+        inflight_lease_seconds: float = 2400,
+        default_job_seconds: float = 180,
+        prefix: str = "scheduler",
+    ):
+        """
+        Args:
+            redis_url: Redis holding the queues (normally the Celery broker)
+            max_inflight: Podcasts generating at the same time across all workers
+            max_queued_per_user: Waiting podcasts allowed per user (0 = unlimited)
+            short_document_bytes: PDFs up to this size go in the priority lane
+            low_lane_every: Serve the long lane at least every N dispatches so it never starves
+            inflight_lease_seconds: Slot lease; reclaimed if a worker dies without releasing it
+            default_job_seconds: Job duration assumed for ETAs before any job has finished
+            prefix: Redis key prefix
+        """
+        self.redis_url = redis_url
+        self.max_inflight = max(1, max_inflight)
+        self.max_queued_per_user = max_queued_per_user
+        self.short_document_bytes = short_document_bytes
+        self.low_lane_every = low_lane_every
+        self.inflight_lease_seconds = inflight_lease_seconds
+        self.default_job_seconds = default_job_seconds
+        self.prefix = prefix
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = redis.Redis.from_url(self.redis_url, decode_responses=True)
+        return self._client
+
+    def _key(self, *parts: str) -> str:
+        return ":".join((self.prefix,) + parts)
+
+    def _lane_keys(self, lane: str) -> list[str]:
+        """Round-robin ring of users and per-user queues hash for a lane."""
+        return [self._key("lane", lane, "ring"), self._key("lane", lane, "queues")]
+
+    def _job(self, podcast_id: str) -> Optional[dict]:
+        record = self.client.hget(self._key("jobs"), podcast_id)
+        return json.loads(record) if record else None
+
+    def _user_queues(self, lane: str) -> dict[str, list[str]]:
+        """Waiting podcast ids per user in a lane."""
+        return {user: json.loads(queue) for user, queue in self.client.hgetall(self._key("lane", lane, "queues")).items()}
+
+    def lane_for(self, document_bytes: Optional[int]) -> str:
+        """Pick a lane from the PDF size; unknown sizes go in the long lane."""
+        if document_bytes is not None and document_bytes <= self.short_document_bytes:
+            return "short"
+        return "long"
+
+    def queue_full(self, user_id: str) -> bool:
+        """Whether the user already has max_queued_per_user podcasts waiting."""
+        if self.max_queued_per_user <= 0:
+            return False
+        return int(self.client.hget(self._key("queued"), user_id) or 0) >= self.max_queued_per_user
+
+    def submit(self, podcast_id: str, user_id: str, document_bytes: Optional[int], start_job: Callable[[str], None]) -> None:
+        """
+        Queue a podcast and dispatch whatever fits under the in-flight ceiling.
+
+        Args:
+            podcast_id: Podcast to generate
+            user_id: Owner, used for fair queuing
+            document_bytes: Size of the uploaded PDF, used to pick the lane
+            start_job: Enqueues the Celery task for a dispatched podcast id
+
+        Raises:
+            QueueFullError: If the user already has max_queued_per_user podcasts waiting
+            redis.RedisError: If Redis is unreachable
+        """
+        lane = self.lane_for(document_bytes)
+        depth = self.client.register_script(SUBMIT_SCRIPT)(
+            keys=[self._key("queued"), self._key("jobs"), *self._lane_keys(lane)],
+            args=[podcast_id, user_id, lane, time.time(), self.max_queued_per_user],
+        )
+        if depth == -1:
+            raise QueueFullError(f"User {user_id} already has {self.max_queued_per_user} podcasts queued")
+        logger.info(f"[SCHEDULER] Queued podcast {podcast_id} in '{lane}' lane (user queue depth {depth})")
+        self.dispatch(start_job)
+
+    def dispatch(self, start_job: Callable[[str], None]) -> list[str]:
+        """
+        Start queued jobs while slots are free.
+
+        Returns:
+            Podcast ids that were started
+        """
+        started = self.client.register_script(DISPATCH_SCRIPT)(
+            keys=[
+                self._key("inflight"), self._key("turn"), self._key("jobs"), self._key("queued"),
+                *(key for lane in LANES for key in self._lane_keys(lane)),
+            ],
+            args=[time.time(), self.max_inflight, self.inflight_lease_seconds, self.low_lane_every],
+        )
+        failed = set()
+        for podcast_id in started:
+            try:
+                start_job(podcast_id)
+                logger.info(f"[SCHEDULER] ✓ Dispatched podcast {podcast_id}")
+            except Exception as e:
+                # Give the slot back and keep the job first in line for the next dispatch
+                logger.error(f"[SCHEDULER] ✗ Failed to start podcast {podcast_id}, re-queued: {str(e)}")
+                self._requeue(podcast_id)
+                failed.add(podcast_id)
+        return [podcast_id for podcast_id in started if podcast_id not in failed]
+
+    def _requeue(self, podcast_id: str) -> None:
+        """Return a dispatched job that never started to the head of its user's queue."""
+        job = self._job(podcast_id)
+        if job is None:
+            self.client.zrem(self._key("inflight"), podcast_id)
+            return
+        self.client.register_script(REQUEUE_SCRIPT)(
+            keys=[self._key("inflight"), self._key("jobs"), self._key("queued"), *self._lane_keys(job["lane"])],
+            args=[podcast_id],
+        )
+
+    def heartbeat(self, podcast_id: str) -> None:
+        """Extend a running job's slot lease."""
+        try:
+            self.client.zadd(
+                self._key("inflight"), {podcast_id: time.time() + self.inflight_lease_seconds}, xx=True
+            )
+        except redis.RedisError as e:
+            logger.warning(f"[SCHEDULER] Heartbeat failed for podcast {podcast_id}: {str(e)}")
+
+    def release(self, podcast_id: str, start_job: Callable[[str], None]) -> None:
+        """
+        Free a finished job's slot, record its duration and dispatch the next job.
+        Failures are logged, never raised.
+        """
+        try:
+            job = self._job(podcast_id)
+            pipe = self.client.pipeline()
+            pipe.zrem(self._key("inflight"), podcast_id)
+            pipe.hdel(self._key("jobs"), podcast_id)
+            pipe.execute()
+
+            if job and "dispatched_at" in job:
+                self._record_duration(time.time() - float(job["dispatched_at"]))
+            self.dispatch(start_job)
+        except redis.RedisError as e:
+            logger.warning(f"[SCHEDULER] Failed to release podcast {podcast_id}: {str(e)}")
+
+    def _record_duration(self, seconds: float) -> None:
+        """Keep an exponentially weighted average of job durations for ETAs."""
+        key = self._key("avg_job_seconds")
+        previous = self.client.get(key)
+        average = seconds if previous is None else 0.8 * float(previous) + 0.2 * seconds
+        self.client.set(key, average)
+
+    def average_job_seconds(self) -> float:
+        value = self.client.get(self._key("avg_job_seconds"))
+        return float(value) if value is not None else self.default_job_seconds
+
+    def queue_status(self, podcast_id: str) -> Optional[tuple[int, int]]:
+        """
+        Estimate a podcast's place in line.
+
+        Position assumes round-robin across users in the podcast's lane and
+        counts every job in higher-priority lanes as ahead, so it is an upper
+        bound for long documents.
+
+        Returns:
+            Tuple of (queue_position, eta_seconds), where position 0 means running,
+            or None if the scheduler has no record of the podcast
+        """
+        job = self._job(podcast_id)
+        if not job:
+            return None
+
+        average = self.average_job_seconds()
+        now = time.time()
+        if "dispatched_at" in job:
+            elapsed = now - float(job["dispatched_at"])
+            return 0, max(0, math.ceil(average - elapsed))
+
+        lane = job["lane"]
+        queues = self._user_queues(lane)
+        user_queue = queues.pop(job["user"], [])
+        if podcast_id not in user_queue:
+            return None
+
+        # Round-robin: each other user gets at most index + 1 turns before this job
+        index = user_queue.index(podcast_id)
+        ahead = index + sum(min(len(queue), index + 1) for queue in queues.values())
+        ahead += sum(
+            len(queue)
+            for higher_lane in LANES[:LANES.index(lane)]
+            for queue in self._user_queues(higher_lane).values()
+        )
+
+        # Wait for slots to free in waves of max_inflight, then run the job itself
+        running = self.client.zcard(self._key("inflight"))
+        waves = math.ceil((ahead + 1) / self.max_inflight) if running >= self.max_inflight else 0
+        return ahead + 1, math.ceil((waves + 1) * average)
+
+
+class DistributedSemaphore:
+    """
+    Redis-backed counting semaphore shared by every worker process.
+
+    Holders take a leased slot, so a crashed worker's slots free themselves
+    after lease_seconds. If Redis is unreachable, calls proceed unthrottled
+    rather than stalling generation.
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        name: str,
+        limit: int,
+        lease_seconds: float = 120,
+        poll_seconds: float = 0.1,
+        acquire_timeout: float = 300,
+    ):
+        """
+        Args:
+            redis_url: Redis holding the semaphore
+            name: Semaphore name (Redis key suffix)
+            limit: Concurrent holders allowed
+            lease_seconds: How long a slot is held before it is considered abandoned
+            poll_seconds: Base delay between acquisition attempts
+            acquire_timeout: Longest wait for a slot before giving up
+        """
+        self.redis_url = redis_url
+        self.key = f"semaphore:{name}"
+        self.limit = limit
+        self.lease_seconds = lease_seconds
+        self.poll_seconds = poll_seconds
+        self.acquire_timeout = acquire_timeout
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = redis.Redis.from_url(self.redis_url)
+        return self._client
+
+    @contextmanager
+    def slot(self):
+        """
+        Hold one slot for the duration of the block.
+
+        Raises:
+            TimeoutError: If no slot frees up within acquire_timeout
+        """
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + self.acquire_timeout
+        try:
+            acquire = self.client.register_script(ACQUIRE_SLOT_SCRIPT)
+            while True:
+                now = time.time()
+                if acquire(keys=[self.key], args=[now, now + self.lease_seconds, self.limit, token]):
+                    break
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"No {self.key} slot free after {self.acquire_timeout:g}s")
+                time.sleep(self.poll_seconds * (1 + random.random()))
+        except redis.RedisError as e:
+            logger.warning(f"[SCHEDULER] Semaphore {self.key} unavailable, continuing without it: {str(e)}")
+            token = None
+
+        try:
+            yield
+        finally:
+            if token:
+                try:
+                    self.client.zrem(self.key, token)
+                except redis.RedisError as e:
+                    logger.warning(f"[SCHEDULER] Failed to release semaphore {self.key}: {str(e)}")
+
+
+podcast_scheduler = FairShareScheduler(
+    settings.REDIS_URL,
+    max_inflight=settings.SCHEDULER_MAX_INFLIGHT,
+    max_queued_per_user=settings.SCHEDULER_MAX_QUEUED_PER_USER,
+    short_document_bytes=int(settings.SCHEDULER_SHORT_DOCUMENT_MB * 1024 * 1024),
+    low_lane_every=settings.SCHEDULER_LONG_LANE_EVERY,
+    inflight_lease_seconds=settings.SCHEDULER_INFLIGHT_LEASE_SECONDS,
+    default_job_seconds=settings.SCHEDULER_DEFAULT_JOB_SECONDS,
+)
+
+tts_semaphore = DistributedSemaphore(
+    settings.REDIS_URL,
+    "elevenlabs_tts",
+    limit=settings.TTS_GLOBAL_MAX_CONCURRENCY,
+    lease_seconds=settings.TTS_SLOT_LEASE_SECONDS,
+    acquire_timeout=settings.TTS_SLOT_ACQUIRE_TIMEOUT_SECONDS,
+)
+
+
+__all__ = ["FairShareScheduler", "DistributedSemaphore", "QueueFullError", "podcast_scheduler", "tts_semaphore"]
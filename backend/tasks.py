@@ -1,18 +1,36 @@
 import os
-import fitz
 import boto3
 import tempfile
-import io
 import re
 import logging
+import shutil
 import subprocess
+import time
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from pydub import AudioSegment
+from typing import Optional
 import google.generativeai as genai
 from elevenlabs.client import ElevenLabs
+from celery import chain
+from celery.exceptions import Retry
 from . import celery_app
-from backend.core import SessionLocal
-from backend.models import models
+from backend.core import SessionLocal, get_settings
+from backend.models import models, crud
+from backend.services.elevenlabs_service import renew_credits, release_credits
+from backend.services.fingerprint_service import fingerprint_file
+from backend.services.progress_service import progress_publisher
+from backend.services.scheduler_service import podcast_scheduler, tts_semaphore
+from backend.pipeline import (
+    TTSSynthesizer, SegmentCache, ScriptLineParser, parse_script, segment_script, iter_segments,
+    PipelineStage, CheckpointStore, is_stage_complete, advance_stage,
+    GrowingFileReader, build_transfer_config, upload_file_streaming,
+    HLSPublisher, delete_hls_output,
+    audio_start_offset, concat_mp3, IncompatibleAudioError,
+    LLMStage, LLMOrchestrator, MapReduceSummarizer,
+    extract_pdf_text,
+    STAGE_SECONDS, CHUNKS_PER_PODCAST, RETRIES, PODCASTS_FINISHED, timed
+)
 # from backend.services import get_validation_service, ContentValidationError, get_mailing_service
 from urllib.parse import urlparse
 
@@ -29,6 +47,48 @@ s3_client = boto3.client(
 )
 BUCKET_NAME = os.getenv("AWS_S3_BUCKET_NAME")
 
+settings = get_settings()
+
+segment_cache = None
+if settings.TTS_CACHE_ENABLED:
+    segment_cache = SegmentCache(
+        cache_dir=settings.TTS_CACHE_DIR,
+        max_bytes=settings.TTS_CACHE_MAX_MB * 1024 * 1024,
+        s3_client=s3_client if settings.TTS_CACHE_S3_ENABLED else None,
+        bucket_name=BUCKET_NAME,
+        s3_prefix=settings.TTS_CACHE_S3_PREFIX
+    )
+
+transfer_config = build_transfer_config(
+    chunk_size_mb=settings.S3_UPLOAD_CHUNK_MB,
+    threshold_mb=settings.S3_UPLOAD_THRESHOLD_MB,
+    max_concurrency=settings.S3_UPLOAD_MAX_CONCURRENCY
+)
+
+# Single shared model instance for every Gemini stage
+gemini_model = genai.GenerativeModel(settings.GEMINI_MODEL)
+llm = LLMOrchestrator(
+    gemini_model,
+    max_workers=settings.LLM_MAX_CONCURRENCY,
+    timeout=settings.LLM_TIMEOUT_SECONDS,
+    max_retries=settings.LLM_MAX_RETRIES
+)
+
+summarizer = MapReduceSummarizer(llm, chunk_chars=settings.SUMMARY_CHUNK_CHARS)
+
+checkpoints = CheckpointStore(s3_client, BUCKET_NAME, settings.PIPELINE_ARTIFACT_PREFIX)
+
+tts_synthesizer = TTSSynthesizer(
+    elevenlabs_client,
+    max_workers=settings.TTS_MAX_CONCURRENCY,
+    max_retries=settings.TTS_MAX_RETRIES,
+    backoff_seconds=settings.TTS_RETRY_BACKOFF_SECONDS,
+    cache=segment_cache,
+    # The cross-worker ElevenLabs cap is part of the scheduler
+    concurrency=tts_semaphore.slot if settings.SCHEDULER_ENABLED else nullcontext,
+    queue_size=settings.TTS_QUEUE_SIZE
+)
+
 def clean_script(script_text: str) -> str:
     """Removes common non-spoken text from an AI-generated script."""
     cleaned_text = re.sub(r'\[.*?\]', '', script_text)
@@ -37,41 +97,28 @@ def clean_script(script_text: str) -> str:
     cleaned_text = re.sub(r'\n{2,}', '\n', cleaned_text)
     return cleaned_text.strip()
 
-def generate_enhanced_content(source_text: str):
-    """Generate content for podcast creation."""
-    model = genai.GenerativeModel('gemini-2.0-flash-exp')
-
-    summary_prompt = f"""
-    Analyze the following text and create a detailed, structured summary.
-    Create a comprehensive 5 minute (strictly) podcast discussion covering all major topics.
-
-    Identify and extract:
-    1. The core thesis or main argument
-    2. The top key topics or supporting points maximizing coverage (for a 5 minute discussion)
-    3. Any important data, statistics, or case studies mentioned
-    4. The primary conclusion or takeaway
+def generate_enhanced_content(source_text: str, podcast_id: str = ""):
+    """Generate content for podcast creation (map-reduce over long documents)."""
+    return summarizer.summarize(source_text, podcast_id)
 
-    Do not make up information. Base your summary strictly on the provided text.
-
-    ---
-    {source_text}
-    ---
-    """
-
-    summary_response = model.generate_content(summary_prompt)
-    return summary_response.text
-
-def concatenate_audio_files(chunk_files: list, output_path: str, podcast_id: str) -> None:
+def concatenate_audio_files(chunk_files: list, output_path: str, podcast_id: str, upload_key: str = None) -> None:
     """
     Efficiently concatenate MP3 chunks using ffmpeg.
 
+    Fallback for chunks the in-process concatenation (concat_mp3) can't
+    splice, e.g. mixed sample rates, and used when AUDIO_CONCAT_ENGINE=ffmpeg.
+
     Uses the ffmpeg concat demuxer for fast, lossless concatenation without re-encoding.
     Memory-efficient as it doesn't load files into RAM.
 
+    When upload_key is given, the multipart upload to S3 starts while ffmpeg is
+    still writing, reading the output file as it grows.
+
     Args:
         chunk_files: List of paths to MP3 chunk files
         output_path: Path to write final concatenated MP3
         podcast_id: Podcast ID for logging
+        upload_key: Optional S3 key to stream the output to during concatenation
     """
     if not chunk_files:
         raise ValueError("No chunk files to concatenate")
@@ -97,13 +144,40 @@ def concatenate_audio_files(chunk_files: list, output_path: str, podcast_id: str
             '-i', concat_file,
             '-c', 'copy',  # Copy codec - no re-encoding, just muxing
             '-loglevel', 'error',  # Only show errors
-            output_path
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
-
-        if result.returncode != 0:
-            raise RuntimeError(f"ffmpeg concatenation failed: {result.stderr}")
+        if upload_key is None:
+            cmd.append(output_path)
+            with timed("ffmpeg_concat"):
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+
+            if result.returncode != 0:
+                raise RuntimeError(f"ffmpeg concatenation failed: {result.stderr}")
+        else:
+            # Bytes already uploaded can't be rewritten, so skip the Xing header ffmpeg patches in at the end
+            cmd += ['-write_xing', '0', '-y', output_path]
+            if os.path.exists(output_path):
+                os.remove(output_path)
+
+            process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+            reader = GrowingFileReader(output_path, process)
+            try:
+                # Recorded as one operation, since the upload finishes with ffmpeg
+                with timed("ffmpeg_concat_and_upload"):
+                    upload_file_streaming(s3_client, reader, BUCKET_NAME, upload_key, transfer_config)
+                    _, stderr = process.communicate(timeout=600)
+            except Exception:
+                process.kill()
+                process.wait()
+                raise
+            finally:
+                reader.close()
+
+            if process.returncode != 0:
+                s3_client.delete_object(Bucket=BUCKET_NAME, Key=upload_key)
+                raise RuntimeError(f"ffmpeg concatenation failed: {stderr}")
+
+            logger.info(f"[TASK] ✓ Streamed {reader.bytes_read} bytes to S3 during concatenation for podcast {podcast_id}")
 
         logger.info(f"[TASK] ✓ ffmpeg concatenation complete for podcast {podcast_id}")
 
@@ -113,53 +187,354 @@ def concatenate_audio_files(chunk_files: list, output_path: str, podcast_id: str
             os.remove(concat_file)
 
 
-def get_audio_duration(mp3_path: str) -> int:
+def download_pdf(podcast) -> str:
     """
-    Get duration of MP3 file in seconds using ffprobe.
+    Download the uploaded PDF from S3 to a temporary file and fingerprint it.
 
-    Efficiently extracts duration metadata without loading entire file into RAM.
+    Sets podcast.content_fingerprint (not committed). The caller removes the file.
 
-    Args:
-        mp3_path: Path to MP3 file
+    Returns:
+        Path of the downloaded PDF
+    """
+    parsed_url = urlparse(podcast.original_file_url)
+    s3_key = parsed_url.path.lstrip('/')
+
+    if not s3_key.lower().endswith('.pdf'):
+        raise NotImplementedError("Only PDFs are supported")
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
+        local_filename = tmp_file.name
+
+    try:
+        with timed("s3_download"):
+            s3_client.download_file(BUCKET_NAME, s3_key, local_filename)
+        podcast.content_fingerprint = fingerprint_file(local_filename, podcast.requirements)
+    except Exception:
+        os.remove(local_filename)
+        raise
+    return local_filename
+
+
+def extract_text_from_pdf(podcast, local_filename: str) -> str:
+    """Extract the text of a downloaded PDF, up to the character budget."""
+    # Pages are read lazily and parsing stops at the budget; page boundaries are kept for the summarizer
+    with timed("pdf_extract"):
+        result = extract_pdf_text(
+            local_filename,
+            max_chars=settings.PDF_MAX_CHARS,
+            pool_min_pages=settings.PDF_PROCESS_POOL_MIN_PAGES,
+            pool_workers=settings.PDF_PROCESS_POOL_WORKERS
+        )
+
+    source_text = result.text
+    if not source_text.strip():
+        raise ValueError("Could not extract any text from the PDF.")
+
+    stats = result.stats()
+    checkpoints.save_json(podcast.id, "extract_stats.json", stats)
+    logger.info(
+        f"[TASK] Text extracted successfully for podcast {podcast.id}. Length: {len(source_text)} chars, "
+        f"pages: {stats['pages_extracted']}/{stats['page_count']}, time: {stats['seconds']}s"
+        f"{' (process pool)' if stats['parallel'] else ''}{' (truncated)' if stats['truncated'] else ''}"
+    )
+    return source_text
+
+
+def build_title_prompt(results: dict) -> str:
+    """Prompt for a short podcast title, from the summary."""
+    detailed_summary = results["summary"]
+    return f"Based on the following summary, generate a short, catchy, and descriptive title (5-10 words). Do not use quotes.\n\nSUMMARY:\n{detailed_summary}"
+
+
+def clean_title(text: str) -> str:
+    return text.strip().replace('"', '')
+
+
+def build_script_prompt(results: dict) -> str:
+    """Prompt for the two-host dialogue script, from the summary."""
+    detailed_summary = results["summary"]
+
+    return f"""You are an expert podcast scriptwriter creating a dynamic, engaging script for two hosts: Dorothy (an insightful analyst) and Will (a curious commentator).
+
+    Target Length: Approximately 1200 words for a 15-30 minute podcast discussion
+
+    Source Material:
+    You will be given a detailed summary of a document. Your task is to transform this summary into a natural, two-person dialogue.
+
+    Critical Instructions:
+    1. Narrative Flow: Create a natural, engaging podcast discussion.
+    2. Focus on Key Insights: Weave the core thesis, key topics, and important data from the summary into the conversation naturally.
+    3. Engaging Dialogue: Use varied sentence lengths, rhetorical questions, and natural pauses.
+    4. Speaker Roles:
+        * Dorothy: Analytical, insightful, drives the main points forward.
+        * Will: Inquisitive, represents the listener's perspective, makes content accessible.
+    5. Format: Start each line with the speaker's label (e.g., "Dorothy:"). No stage directions.
+
+    **Here is the detailed summary to transform:**
+    ---
+    {detailed_summary}
+    ---
+    """
+
+
+def validate_script(script: str) -> str:
+    if not script:
+        raise ValueError("Gemini failed to generate a script.")
+    return script
+
+
+# Title and script both depend only on the summary, so they run concurrently
+TITLE_STAGE = LLMStage("title", build_title_prompt, depends_on=("summary",), postprocess=clean_title)
+SCRIPT_STAGE = LLMStage("script", build_script_prompt, depends_on=("summary",), postprocess=validate_script)
+
+
+def _mark_stage_complete(db, podcast, stage: PipelineStage) -> None:
+    """Advance the podcast's stage marker after a stage has persisted its output."""
+    podcast.pipeline_stage = advance_stage(podcast.pipeline_stage, stage)
+    db.commit()
+    logger.info(f"[TASK] Stage '{stage.value}' complete for podcast {podcast.id}")
+    progress_publisher.publish(podcast.id, podcast.status, stage.value, f"Finished {stage.value}")
+    renew_credits(podcast.id)
+    if settings.SCHEDULER_ENABLED:
+        podcast_scheduler.heartbeat(podcast.id)
+
+
+def _release_scheduler_slot(podcast_id: str) -> None:
+    """Free the podcast's scheduler slot and start the next queued podcast."""
+    if settings.SCHEDULER_ENABLED:
+        podcast_scheduler.release(podcast_id, create_podcast_task.delay)
+
+
+def _report_progress(podcast, stage: PipelineStage, message: str) -> None:
+    """Publish that a stage has started."""
+    progress_publisher.publish(podcast.id, podcast.status, stage.value, message)
+
+
+def _run_text_stage(db, podcast, stage: PipelineStage, artifact_name: str, produce) -> tuple:
+    """
+    Run a stage whose output is text, or reuse its checkpointed artifact.
+
+    Returns:
+        Tuple of (text, reused) where reused is True if the artifact came from a previous attempt
+    """
+    if is_stage_complete(podcast.pipeline_stage, stage):
+        text = checkpoints.load_text(podcast.id, artifact_name)
+        if text is not None:
+            logger.info(f"[TASK] Resuming: reusing '{stage.value}' output for podcast {podcast.id}")
+            return text, True
+
+    _report_progress(podcast, stage, f"Running {stage.value}")
+    text = produce()
+    checkpoints.save_text(podcast.id, artifact_name, text)
+    _mark_stage_complete(db, podcast, stage)
+    return text, False
+
+
+def _reuse_identical_podcast(db, podcast) -> Optional[str]:
+    """
+    Complete a podcast with the audio of a finished podcast made from the same document.
+
+    Only the final MP3 and its audio index are shared; the source's text
+    artifacts stay under its own prefix. Failures fall back to generation.
 
     Returns:
-        Duration in seconds (rounded to nearest integer)
+        The source podcast id, or None if the podcast must be generated
     """
-    if not os.path.exists(mp3_path):
-        raise FileNotFoundError(f"MP3 file not found: {mp3_path}")
+    if not podcast.content_fingerprint:
+        return None
+    source = crud.get_completed_podcast_by_fingerprint(db, podcast.content_fingerprint)
+    if source is None or source.id == podcast.id:
+        return None
 
     try:
-        # Use ffprobe to get duration (metadata only, very fast)
-        cmd = [
-            'ffprobe',
-            '-v', 'error',
-            '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1:nokey=1',
-            mp3_path
-        ]
+        final_mp3_key = f"podcasts/podcast_{podcast.id}.mp3"
+        s3_client.copy_object(
+            Bucket=BUCKET_NAME,
+            Key=final_mp3_key,
+            CopySource={'Bucket': BUCKET_NAME, 'Key': f"podcasts/podcast_{source.id}.mp3"},
+            ACL='private'
+        )
+        audio_index = checkpoints.load_json(source.id, AUDIO_INDEX_ARTIFACT)
+        if audio_index is not None:
+            checkpoints.save_json(podcast.id, AUDIO_INDEX_ARTIFACT, audio_index)
+        user = db.query(models.User).filter(models.User.id == podcast.owner_id).first()
+        crud.complete_podcast_from_duplicate(
+            db, podcast, source, f"https://{BUCKET_NAME}.s3.amazonaws.com/{final_mp3_key}", user
+        )
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"[TASK] Failed to reuse podcast {source.id} for {podcast.id}, generating instead: {str(e)}")
+        return None
+
+    PODCASTS_FINISHED.labels("complete").inc()
+    logger.info(f"[TASK] ✓ Podcast {podcast.id} is a duplicate of {source.id}; reused its audio")
+    return source.id
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
 
-        if result.returncode != 0:
-            logger.warning(f"ffprobe failed for {mp3_path}, falling back to pydub")
-            # Fallback: use pydub (slower but reliable)
-            audio = AudioSegment.from_mp3(mp3_path)
-            return int(audio.duration_seconds)
+def _start_hls_publisher(podcast) -> HLSPublisher:
+    """Create the progressive HLS publisher for a podcast's synthesis stage."""
+    return HLSPublisher(
+        s3_client, BUCKET_NAME, settings.HLS_PREFIX, podcast.id,
+        target_duration=settings.HLS_TARGET_DURATION
+    )
 
-        duration = float(result.stdout.strip())
-        return int(round(duration))
 
+def _delete_hls_output(podcast_id: str) -> None:
+    """Remove the progressive playlist and its segments; failures are logged, never raised."""
+    try:
+        deleted = delete_hls_output(s3_client, BUCKET_NAME, settings.HLS_PREFIX, podcast_id)
+        if deleted:
+            logger.info(f"[TASK] ✓ Deleted {deleted} HLS objects for podcast {podcast_id}")
     except Exception as e:
-        logger.error(f"Failed to get duration for {mp3_path}: {str(e)}")
-        raise
+        logger.warning(f"[TASK] Failed to delete HLS output for podcast {podcast_id}: {str(e)}")
 
 
-@celery_app.task(bind=True)
-def create_podcast_task(self, podcast_id: str):
+def _withdraw_hls_output(db, podcast) -> None:
+    """Stop exposing the progressive playlist and delete it with its segments."""
+    if podcast.playlist_key:
+        podcast.playlist_key = None
+        db.commit()
+    _delete_hls_output(podcast.id)
+
+
+def _work_dir(podcast_id: str) -> str:
+    """Local working directory for audio artifacts, kept across retries of a stage on the same worker."""
+    return os.path.join(settings.PIPELINE_WORK_DIR, f"podcast_{podcast_id}")
+
+
+def _cleanup_work_dir(podcast_id: str) -> None:
+    work_dir = _work_dir(podcast_id)
+    if os.path.exists(work_dir):
+        shutil.rmtree(work_dir)
+        logger.info(f"[TASK] Cleaned up temporary files for podcast {podcast_id}")
+
+
+# Artifact names handed from stage to stage. Each stage task receives a ref dict
+# ({"podcast_id": ..., artifact: name, ...}), adds the artifacts it produced,
+# and returns it for the next stage in the chain.
+SOURCE_TEXT_ARTIFACT = "source_text.txt"
+SUMMARY_ARTIFACT = "summary.txt"
+SCRIPT_ARTIFACT = "script.txt"
+CHUNK_MANIFEST_ARTIFACT = "chunks.json"
+AUDIO_INDEX_ARTIFACT = "audio_index.json"
+CHUNK_ARTIFACT_DIR = "chunks/"
+
+
+class PodcastStageTask(celery_app.Task):
+    """
+    Base class for the podcast pipeline tasks.
+
+    Any error retries the task with exponential backoff; completed stages are
+    checkpointed, so the retry only redoes the failed stage. Once retries are
+    exhausted the podcast is marked failed and its scheduler slot released.
+    """
+    max_retries = 3
+
+    @property
+    def stage_label(self) -> str:
+        return self.name.rsplit(".", 1)[-1].removesuffix("_stage")
+
+    def __call__(self, *args, **kwargs):
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            result = super().__call__(*args, **kwargs)
+            outcome = "ok"
+            return result
+        except Retry:
+            raise
+        except Exception as e:
+            podcast_id = _podcast_id_from_args(args)
+            logger.error(f"[TASK] ✗ Error in {self.name} for podcast {podcast_id}: {e}")
+            logger.warning(f"[TASK] Retry attempt {self.request.retries}/{self.max_retries}: {str(e)}")
+            if self.request.retries < self.max_retries:
+                RETRIES.labels("stage_task").inc()
+                progress_publisher.publish(
+                    podcast_id, models.PodcastStatus.PROCESSING.value,
+                    message=f"Retrying after an error (attempt {self.request.retries + 1}/{self.max_retries})"
+                )
+            # Raises the original error once max_retries is exceeded, which lands in on_failure
+            raise self.retry(exc=e, countdown=min(5 * (2 ** self.request.retries), 600))
+        finally:
+            STAGE_SECONDS.labels(self.stage_label, outcome).observe(time.perf_counter() - started)
+
+    def on_failure(self, exc, task_id, args, kwargs, einfo):
+        podcast_id = _podcast_id_from_args(args)
+        logger.error(f"[TASK] ✗ Max retries exceeded for podcast {podcast_id}. Task failed permanently.")
+        db = SessionLocal()
+        try:
+            podcast = db.query(models.Podcast).filter(models.Podcast.id == podcast_id).first()
+            if podcast:
+                podcast.status = models.PodcastStatus.FAILED.value
+                db.commit()
+                # The EVENT playlist will never get its ENDLIST
+                _withdraw_hls_output(db, podcast)
+        finally:
+            db.close()
+        progress_publisher.publish(podcast_id, models.PodcastStatus.FAILED.value, message="Podcast creation failed")
+        PODCASTS_FINISHED.labels("failed").inc()
+        _cleanup_work_dir(podcast_id)
+        release_credits(podcast_id)
+        _release_scheduler_slot(podcast_id)
+
+
+def _podcast_id_from_args(args) -> str:
+    """create_podcast_task takes the podcast id; stage tasks take a ref dict."""
+    first = args[0]
+    return first["podcast_id"] if isinstance(first, dict) else first
+
+
+@contextmanager
+def _podcast_session(podcast_id: str):
+    """Open a database session with the podcast loaded, for the duration of one stage."""
     db = SessionLocal()
     try:
         podcast = db.query(models.Podcast).filter(models.Podcast.id == podcast_id).first()
-        if not podcast or not podcast.original_file_url:
+        if not podcast:
+            raise ValueError(f"Podcast {podcast_id} not found")
+        yield db, podcast
+    finally:
+        db.close()
+
+
+def _load_artifact(ref: dict, artifact: str) -> str:
+    """Load a text artifact produced by an earlier stage."""
+    text = checkpoints.load_text(ref["podcast_id"], ref[artifact])
+    if text is None:
+        raise RuntimeError(f"Artifact '{ref[artifact]}' missing for podcast {ref['podcast_id']}")
+    return text
+
+
+def build_podcast_pipeline(podcast_id: str):
+    """
+    The generation pipeline as a chain of stage tasks.
+
+    Stages are routed by resource profile (see task_routes): PDF extraction
+    and audio concatenation run on the CPU queue, Gemini, ElevenLabs and
+    bookkeeping stages on the I/O queue.
+    """
+    return chain(
+        extract_stage.s({"podcast_id": podcast_id}),
+        summarize_stage.s(),
+        script_stage.s(),
+        synthesize_stage.s(),
+        concat_stage.s(),
+        finalize_stage.s(),
+    )
+
+
+@celery_app.task(bind=True, base=PodcastStageTask)
+def create_podcast_task(self, podcast_id: str):
+    """
+    Generate a podcast from its uploaded PDF.
+
+    Validates the podcast, marks it processing, and starts the stage chain
+    (extract, summarize, title and script, synthesize, concat and upload,
+    finalize). Each stage checkpoints its output and passes artifact names
+    on, so a retry resumes at the failed stage on any worker.
+    """
+    with _podcast_session(podcast_id) as (db, podcast):
+        if not podcast.original_file_url:
             logger.error(f"[TASK] Error: Podcast file or file URL not found for ID: {podcast_id}")
             raise ValueError("Podcast or URL not found")
 
@@ -169,31 +544,51 @@ def create_podcast_task(self, podcast_id: str):
 
         podcast.status = models.PodcastStatus.PROCESSING.value
         db.commit()
-        
-        parsed_url = urlparse(podcast.original_file_url)
-        s3_key = parsed_url.path.lstrip('/')
+        progress_publisher.publish(podcast.id, podcast.status, podcast.pipeline_stage, "Processing started")
+        # The reservation made at enqueue only had to last through the queue
+        renew_credits(podcast.id)
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-            local_filename = tmp_file.name
+        if podcast.pipeline_stage:
+            logger.info(f"[TASK] Resuming podcast {podcast.id} after stage '{podcast.pipeline_stage}'")
 
-        s3_client.download_file(BUCKET_NAME, s3_key, local_filename)
+    build_podcast_pipeline(podcast_id).apply_async()
+    return "Podcast pipeline started."
 
-        if not s3_key.lower().endswith('.pdf'):
-            raise NotImplementedError("Only PDFs are supported")
 
-        doc = fitz.open(local_filename)
-        source_text = "".join(page.get_text() for page in doc)
-        doc.close()
+@celery_app.task(bind=True, base=PodcastStageTask, time_limit=900)
+def extract_stage(self, ref: dict) -> dict:
+    """
+    Stage: download the PDF and extract its text.
 
-        if len(source_text) > 40000:
-            source_text = source_text[:40000]
-        
-        os.remove(local_filename)
+    The download is fingerprinted before it is parsed, so a podcast made
+    from the same PDF and requirements as a finished one skips extraction
+    and every later stage.
+    """
+    with _podcast_session(ref["podcast_id"]) as (db, podcast):
+        local_filename = None
+        if not is_stage_complete(podcast.pipeline_stage, PipelineStage.EXTRACT):
+            local_filename = download_pdf(podcast)
+            db.commit()
 
-        if not source_text.strip():
-            raise ValueError("Could not extract any text from the PDF.")
+        def extract():
+            nonlocal local_filename
+            if local_filename is None:
+                # Stage marker set but its artifact is gone
+                local_filename = download_pdf(podcast)
+            return extract_text_from_pdf(podcast, local_filename)
 
-        logger.info(f"[TASK] Text extracted successfully for podcast {podcast.id}. Length: {len(source_text)} chars.")
+        try:
+            # Same PDF and requirements as a finished podcast: later stages pass the ref through
+            source_id = _reuse_identical_podcast(db, podcast)
+            if source_id:
+                # Nothing will be synthesized, so its reserved characters are free again
+                release_credits(podcast.id)
+                return {**ref, "reused_from": source_id}
+
+            _run_text_stage(db, podcast, PipelineStage.EXTRACT, SOURCE_TEXT_ARTIFACT, extract)
+        finally:
+            if local_filename:
+                os.remove(local_filename)
 
         # Validate content before processing
         # logger.info(f"[TASK] Running content validation for podcast {podcast.id}...")
@@ -210,139 +605,301 @@ def create_podcast_task(self, podcast_id: str):
         #     logger.error(f"[TASK] ✗ Content validation failed: {str(e)}")
         #     raise ValueError(f"Content validation failed: {str(e)}")
 
-        # Generate enhanced content for podcast
-        detailed_summary = generate_enhanced_content(source_text)
+    return {**ref, "source_text": SOURCE_TEXT_ARTIFACT}
 
-        db.commit()
-        
-        # Generate title
-        logger.info(f"[TASK] Generating title for podcast {podcast.id}...")
-        model = genai.GenerativeModel('gemini-2.0-flash-exp')
-        title_prompt = f"Based on the following summary, generate a short, catchy, and descriptive title (5-10 words). Do not use quotes.\n\nSUMMARY:\n{detailed_summary}"
-        title_response = model.generate_content(title_prompt)
-        generated_title = title_response.text.strip().replace('"', '')
-        podcast.title = generated_title
-        db.commit()
 
-        # Generate script for podcast
-        prompt = f"""You are an expert podcast scriptwriter creating a dynamic, engaging script for two hosts: Dorothy (an insightful analyst) and Will (a curious commentator).
+@celery_app.task(bind=True, base=PodcastStageTask, time_limit=900)
+def summarize_stage(self, ref: dict) -> dict:
+    """Stage: map-reduce summary of the extracted text."""
+    if "reused_from" in ref:
+        return ref
+    with _podcast_session(ref["podcast_id"]) as (db, podcast):
+        _run_text_stage(
+            db, podcast, PipelineStage.SUMMARIZE, SUMMARY_ARTIFACT,
+            lambda: generate_enhanced_content(_load_artifact(ref, "source_text"), podcast.id)
+        )
+    return {**ref, "summary": SUMMARY_ARTIFACT}
+
 
-        Target Length: Approximately 1200 words for a 15-30 minute podcast discussion
+@celery_app.task(bind=True, base=PodcastStageTask, time_limit=600)
+def script_stage(self, ref: dict) -> dict:
+    """
+    Stages: title and script, generated concurrently from the summary.
 
-        Source Material:
-        You will be given a detailed summary of a document. Your task is to transform this summary into a natural, two-person dialogue.
+    With SCRIPT_STREAMING_ENABLED only the title is generated here; the
+    script is streamed straight into synthesis by the next stage.
+    """
+    if "reused_from" in ref:
+        return ref
+    with _podcast_session(ref["podcast_id"]) as (db, podcast):
+        need_title = not (is_stage_complete(podcast.pipeline_stage, PipelineStage.TITLE) and podcast.title)
+        script_reused = is_stage_complete(podcast.pipeline_stage, PipelineStage.SCRIPT) \
+            and checkpoints.load_text(podcast.id, SCRIPT_ARTIFACT) is not None
+        need_script = not script_reused and not settings.SCRIPT_STREAMING_ENABLED
+
+        llm_stages = ([TITLE_STAGE] if need_title else []) + ([SCRIPT_STAGE] if need_script else [])
+        if llm_stages:
+            logger.info(f"[TASK] Generating {', '.join(stage.name for stage in llm_stages)} for podcast {podcast.id}...")
+            _report_progress(podcast, PipelineStage.SCRIPT, "Writing the script")
+            outputs = llm.run(llm_stages, inputs={"summary": _load_artifact(ref, "summary")})
+
+            if need_title:
+                # Title is persisted on the podcast row itself
+                podcast.title = outputs["title"]
+                _mark_stage_complete(db, podcast, PipelineStage.TITLE)
+            if need_script:
+                # Chunks from an earlier attempt belong to a different script
+                _cleanup_work_dir(podcast.id)
+                checkpoints.save_text(podcast.id, SCRIPT_ARTIFACT, outputs["script"])
+                _mark_stage_complete(db, podcast, PipelineStage.SCRIPT)
+        else:
+            logger.info(f"[TASK] Resuming: reusing 'title' and 'script' output for podcast {podcast.id}")
+
+        if need_script or script_reused:
+            logger.info(f"[TASK] Script ready for podcast {podcast.id}.")
+        else:
+            logger.info(f"[TASK] Script for podcast {podcast.id} will be streamed into synthesis.")
+
+    return {**ref, "script": SCRIPT_ARTIFACT}
+
+
+class _ScriptStream:
+    """
+    The script prompt's streamed response, parsed into lines as it arrives.
 
-        Critical Instructions:
-        1. Narrative Flow: Create a natural, engaging podcast discussion.
-        2. Focus on Key Insights: Weave the core thesis, key topics, and important data from the summary into the conversation naturally.
-        3. Engaging Dialogue: Use varied sentence lengths, rhetorical questions, and natural pauses.
-        4. Speaker Roles:
-            * Dorothy: Analytical, insightful, drives the main points forward.
-            * Will: Inquisitive, represents the listener's perspective, makes content accessible.
-        5. Format: Start each line with the speaker's label (e.g., "Dorothy:"). No stage directions.
+    lines() runs on the synthesizer's feed thread, so it only checkpoints the
+    finished script; the stage marks SCRIPT complete from its own thread.
+    """
 
-        **Here is the detailed summary to transform:**
-        ---
-        {detailed_summary}
-        ---
-        """
-        
-        response = model.generate_content(prompt)
-        script = response.text
+    def __init__(self, podcast_id: str, summary: str):
+        self.podcast_id = podcast_id
+        self.summary = summary
+        self.saved = False
+
+    def lines(self):
+        parser = ScriptLineParser(self.podcast_id)
+        pieces = []
+        for text in llm.stream(build_script_prompt({"summary": self.summary}), SCRIPT_STAGE.name):
+            pieces.append(text)
+            yield from parser.feed(text)
+        yield from parser.finish()
+
+        script = validate_script("".join(pieces))
+        if not parser.count:
+            raise ValueError("Gemini's script has no speaker lines.")
+        checkpoints.save_text(self.podcast_id, SCRIPT_ARTIFACT, script)
+        self.saved = True
+        logger.info(f"[TASK] Streamed script of {parser.count} lines saved for podcast {self.podcast_id}")
+
+
+@celery_app.task(bind=True, base=PodcastStageTask, time_limit=1800)
+def synthesize_stage(self, ref: dict) -> dict:
+    """
+    Stage: synthesize every script line with ElevenLabs.
 
-        if not script:
-            raise ValueError("Gemini failed to generate a script.")
+    Chunks are uploaded as artifacts as they complete, and recorded in a
+    manifest with their frame counts and exact durations, so the concat stage
+    can run on another machine without measuring the audio again. With
+    SCRIPT_STREAMING_ENABLED and no script yet, the script is generated here
+    and each line is synthesized as soon as Gemini has written it.
+    """
+    if "reused_from" in ref:
+        return ref
+    ref = {**ref, "chunks": CHUNK_MANIFEST_ARTIFACT}
+    with _podcast_session(ref["podcast_id"]) as (db, podcast):
+        if is_stage_complete(podcast.pipeline_stage, PipelineStage.SYNTHESIZE) \
+                and checkpoints.load_json(podcast.id, CHUNK_MANIFEST_ARTIFACT) is not None:
+            logger.info(f"[TASK] Resuming: reusing 'synthesize' output for podcast {podcast.id}")
+            return ref
+
+        stream = None
+        if is_stage_complete(podcast.pipeline_stage, PipelineStage.SCRIPT) or not settings.SCRIPT_STREAMING_ENABLED:
+            # Fewer, evenly sized requests; deterministic, so a retry maps lines to the same chunk files
+            script_lines = segment_script(
+                parse_script(_load_artifact(ref, "script"), podcast.id), settings.TTS_SEGMENT_MAX_CHARS, podcast.id
+            )
+            total_lines = len(script_lines)
+        else:
+            # Chunks from an earlier attempt belong to a different script
+            _cleanup_work_dir(podcast.id)
+            _report_progress(podcast, PipelineStage.SCRIPT, "Writing the script")
+            stream = _ScriptStream(podcast.id, _load_artifact(ref, "summary"))
+            # Lines are synthesized as Gemini writes them; segmenting holds back at most one speaker turn
+            script_lines = iter_segments(stream.lines(), settings.TTS_SEGMENT_MAX_CHARS)
+            total_lines = None
+
+        # Chunks completed by earlier attempts on this worker are reused from the work dir
+        work_dir = _work_dir(podcast.id)
+        os.makedirs(work_dir, exist_ok=True)
 
-        logger.info(f"[TASK] Script generated successfully for podcast {podcast.id}.")
         logger.info(f"[TASK] Creating audio with ElevenLabs for podcast {podcast.id}...")
+        if podcast.playlist_key or self.request.retries:
+            # The new publisher starts an empty playlist; an EVENT playlist must never lose segments
+            _withdraw_hls_output(db, podcast)
+        publisher = _start_hls_publisher(podcast) if settings.HLS_STREAMING_ENABLED else None
+        lines_done = 0
+
+        with ThreadPoolExecutor(max_workers=settings.S3_UPLOAD_MAX_CONCURRENCY, thread_name_prefix="chunk-upload") as uploader:
+            uploads = []
+
+            def on_chunk(line, chunk):
+                nonlocal lines_done
+                lines_done += 1
+                uploads.append(uploader.submit(checkpoints.upload_file, podcast.id, _chunk_artifact_name(line.index), chunk.path))
+                progress_publisher.publish(
+                    podcast.id, podcast.status, PipelineStage.SYNTHESIZE.value,
+                    f"Synthesizing line {lines_done}" + (f"/{total_lines}" if total_lines else ""), lines_done, total_lines
+                )
+                # Publish in script order; expose the playlist once the first segment is live
+                if publisher and publisher.add_chunk(line.index, chunk.path, chunk.audio.duration) and podcast.playlist_key is None:
+                    podcast.playlist_key = publisher.playlist_key
+                    db.commit()
+                    logger.info(f"[TASK] ✓ First HLS segment live for podcast {podcast.id}")
+
+            try:
+                chunks = tts_synthesizer.synthesize(script_lines, work_dir, podcast.id, on_chunk=on_chunk)
+            finally:
+                # A retry after a synthesis failure reuses the streamed script and its chunks
+                if stream and stream.saved:
+                    _mark_stage_complete(db, podcast, PipelineStage.SCRIPT)
+            if publisher:
+                publisher.finish()
+            for upload in uploads:
+                upload.result()
+
+        CHUNKS_PER_PODCAST.observe(len(chunks))
+        manifest = [
+            {
+                "name": _chunk_artifact_name(index),
+                "duration": chunk.audio.duration,
+                "frames": chunk.audio.frames,
+                "audio_bytes": chunk.audio.audio_bytes,
+            }
+            for index, chunk in enumerate(chunks)
+        ]
+        checkpoints.save_json(podcast.id, CHUNK_MANIFEST_ARTIFACT, manifest)
+        _mark_stage_complete(db, podcast, PipelineStage.SYNTHESIZE)
+        _cleanup_work_dir(podcast.id)
+        logger.info(f"[TASK] All {len(chunks)} audio segments generated for podcast {podcast.id}.")
 
-        # ElevenLabs voice mapping
-        voice_map = {
-            "DOROTHY": "ThT5KcBeYPX3keUQqHPh",
-            "WILL": "bIHbv24MWmeRgasZH58o"
-        }
+    return ref
 
-        # Create temp directory for audio chunks
-        temp_dir = tempfile.mkdtemp(prefix=f"podcast_{podcast.id}_")
-        chunk_files = []
-        script_lines = script.strip().split('\n')
-        chunk_index = 0
 
-        try:
-            # Generate audio chunks and save directly to disk
-            for line in script_lines:
-                line = line.strip()
-                if not line:
-                    continue
-
-                match = re.match(r'^(\w+):\s*(.*)', line)
-                if match:
-                    speaker, text_to_speak = match.groups()
-                    speaker = speaker.upper()
-
-                    if speaker in voice_map:
-                        logger.info(f"[TASK] Generating audio for {speaker} in podcast {podcast.id}...")
-
-                        # Stream audio directly to disk (minimal memory usage)
-                        chunk_file = os.path.join(temp_dir, f"chunk_{chunk_index:04d}.mp3")
-
-                        audio_iterator = elevenlabs_client.text_to_speech.convert(
-                            voice_id=voice_map[speaker],
-                            text=text_to_speak,
-                            model_id="eleven_multilingual_v2"
-                        )
-
-                        # Write chunks directly to file (no buffering in memory)
-                        with open(chunk_file, 'wb') as f:
-                            for chunk in audio_iterator:
-                                f.write(chunk)
-
-                        chunk_files.append(chunk_file)
-                        chunk_index += 1
-                        logger.info(f"[TASK] Chunk {chunk_index} saved for {speaker}")
-                    else:
-                        logger.warning(f"[TASK] Warning: Skipping line with unknown speaker: {speaker} in podcast {podcast.id}")
-
-            logger.info(f"[TASK] All {chunk_index} audio segments generated for podcast {podcast.id}. Concatenating with ffmpeg...")
-
-            # Concatenate all chunks using ffmpeg (efficient, low memory)
-            final_mp3_temp = os.path.join(temp_dir, "final_podcast.mp3")
-            concatenate_audio_files(chunk_files, final_mp3_temp, podcast.id)
-
-            # Calculate duration by checking the final file
-            duration_seconds = get_audio_duration(final_mp3_temp)
-            podcast.duration = duration_seconds
-            logger.info(f"[TASK] Audio concatenation complete. Duration: {duration_seconds}s")
-
-            # Read final file and upload to S3
+def _chunk_artifact_name(index: int) -> str:
+    return f"{CHUNK_ARTIFACT_DIR}{index:04d}.mp3"
+
+
+def _save_audio_index(podcast_id: str, manifest: list[dict], final_mp3_path: str) -> None:
+    """
+    Store where each chunk (one script line) starts in the final MP3, for seeking and chapters.
+
+    Offsets are computed from the chunk frame indexes plus the position of
+    the first audio frame in the final file, without reading the rest of it.
+    """
+    offset = audio_start_offset(final_mp3_path)
+    start = 0.0
+    entries = []
+    for index, entry in enumerate(manifest):
+        entries.append({"index": index, "start": round(start, 3), "duration": round(entry["duration"], 3), "offset": offset})
+        start += entry["duration"]
+        offset += entry["audio_bytes"]
+    checkpoints.save_json(podcast_id, AUDIO_INDEX_ARTIFACT, entries)
+
+
+@celery_app.task(bind=True, base=PodcastStageTask, time_limit=900)
+def concat_stage(self, ref: dict) -> dict:
+    """Stages: concatenate the chunks into the final MP3 and upload it."""
+    if "reused_from" in ref:
+        return ref
+    with _podcast_session(ref["podcast_id"]) as (db, podcast):
+        final_mp3_key = f"podcasts/podcast_{podcast.id}.mp3"
+        if is_stage_complete(podcast.pipeline_stage, PipelineStage.UPLOAD):
+            logger.info(f"[TASK] Resuming: final audio already uploaded for podcast {podcast.id}")
+            return ref
+
+        work_dir = _work_dir(podcast.id)
+        os.makedirs(work_dir, exist_ok=True)
+        final_mp3_temp = os.path.join(work_dir, "final_podcast.mp3")
+        uploaded = False
+
+        if not (is_stage_complete(podcast.pipeline_stage, PipelineStage.CONCAT) and os.path.exists(final_mp3_temp)):
+            manifest = checkpoints.load_json(podcast.id, ref["chunks"])
+            if manifest is None:
+                raise RuntimeError(f"Artifact '{ref['chunks']}' missing for podcast {podcast.id}")
+
+            _report_progress(podcast, PipelineStage.CONCAT, "Stitching audio")
+            chunk_names = [entry["name"] for entry in manifest]
+            chunk_files = [os.path.join(work_dir, os.path.basename(name)) for name in chunk_names]
+
+            def download(name, path):
+                checkpoints.download_file(podcast.id, name, path)
+                return path
+
+            native = settings.AUDIO_CONCAT_ENGINE == "native"
+            with ThreadPoolExecutor(max_workers=settings.S3_UPLOAD_MAX_CONCURRENCY, thread_name_prefix="chunk-download") as downloader:
+                downloaded = downloader.map(download, chunk_names, chunk_files)
+                if native:
+                    # Splice each chunk in as soon as it and the ones before it are downloaded
+                    try:
+                        with timed("native_concat"):
+                            concat_mp3(downloaded, final_mp3_temp)
+                    except IncompatibleAudioError as e:
+                        logger.warning(f"[TASK] ✗ Chunks can't be spliced for podcast {podcast.id}, using ffmpeg: {str(e)}")
+                        native = False
+                # Wait for the remaining downloads (all of them on the ffmpeg path)
+                list(downloaded)
+
+            if not native:
+                logger.info(f"[TASK] Concatenating {len(chunk_files)} audio segments with ffmpeg for podcast {podcast.id}...")
+                upload_key = final_mp3_key if settings.S3_UPLOAD_DURING_CONCAT else None
+                concatenate_audio_files(chunk_files, final_mp3_temp, podcast.id, upload_key=upload_key)
+                uploaded = upload_key is not None
+
+            # Both engines copy frames as-is, so the duration is the sum of the chunks'
+            podcast.duration = int(round(sum(entry["duration"] for entry in manifest)))
+            _save_audio_index(podcast.id, manifest, final_mp3_temp)
+            _mark_stage_complete(db, podcast, PipelineStage.CONCAT)
+            logger.info(f"[TASK] Audio concatenation complete. Duration: {podcast.duration}s")
+
+        # Stage: upload (the file is local to this worker, so it is not split into its own task)
+        if not uploaded:
+            _report_progress(podcast, PipelineStage.UPLOAD, "Uploading")
+            # Stream the file handle straight to S3 (no full copy in memory)
             with open(final_mp3_temp, 'rb') as f:
-                final_buffer = io.BytesIO(f.read())
-
-            final_mp3_key = f"podcasts/podcast_{podcast.id}.mp3"
-            s3_client.upload_fileobj(
-                final_buffer,
-                BUCKET_NAME,
-                final_mp3_key,
-                ExtraArgs={'ContentType': 'audio/mpeg', 'ACL': 'private'}
-            )
+                upload_file_streaming(s3_client, f, BUCKET_NAME, final_mp3_key, transfer_config)
+        podcast.final_podcast_url = f"https://{BUCKET_NAME}.s3.amazonaws.com/{final_mp3_key}"
+        _mark_stage_complete(db, podcast, PipelineStage.UPLOAD)
+        _cleanup_work_dir(podcast.id)
+
+    return ref
 
-            final_url = f"https://{BUCKET_NAME}.s3.amazonaws.com/{final_mp3_key}"
+
+@celery_app.task(bind=True, base=PodcastStageTask)
+def finalize_stage(self, ref: dict) -> str:
+    """Mark the podcast complete, register its fingerprint and start the next queued podcast."""
+    with _podcast_session(ref["podcast_id"]) as (db, podcast):
+        if podcast.status != models.PodcastStatus.COMPLETE.value:
+            user = db.query(models.User).filter(models.User.id == podcast.owner_id).first()
             podcast.status = models.PodcastStatus.COMPLETE.value
-            podcast.final_podcast_url = final_url
             user.podcasts_created += 1
             db.commit()
+            PODCASTS_FINISHED.labels("complete").inc()
+        progress_publisher.publish(podcast.id, podcast.status, podcast.pipeline_stage, "Podcast ready")
 
-        except Exception as e:
-            raise
-        finally:
-            # Clean up temp directory and all chunk files
-            import shutil
-            if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
-                logger.info(f"[TASK] Cleaned up temporary files for podcast {podcast.id}")
+        # Make this podcast's artifacts reusable for identical future uploads
+        if podcast.content_fingerprint and "reused_from" not in ref:
+            crud.register_fingerprint(db, podcast.content_fingerprint, podcast.id)
+
+        # Chunks and the progressive playlist are only needed until the final MP3 exists
+        if "chunks" in ref:
+            manifest = checkpoints.load_json(podcast.id, ref["chunks"]) or []
+            checkpoints.delete(podcast.id, [entry["name"] for entry in manifest] + [ref["chunks"]])
+        _withdraw_hls_output(db, podcast)
+        release_credits(podcast.id)
+        _release_scheduler_slot(podcast.id)
 
         logger.info(f"[TASK] ✓ Task Succeeded! Enhanced podcast created. ID: {podcast.id}")
-        logger.info(f"[TASK] Duration: {duration_seconds}s, Final URL: {final_url}")
+        logger.info(f"[TASK] Duration: {podcast.duration}s, Final URL: {podcast.final_podcast_url}")
         # WORK IN PROGRESS
         # Send success notification email
         # try:
@@ -367,26 +924,4 @@ def create_podcast_task(self, podcast_id: str):
         #     # Don't fail the task if email sending fails
         #     logger.info("[TASK] Continuing despite email notification failure")
 
-    except Exception as e:
-        logger.error(f"[TASK] ✗ Error in create_podcast_task for ID {podcast_id}: {e}")
-        if 'podcast' in locals() and db.is_active:
-            podcast.status = models.PodcastStatus.FAILED.value
-            db.commit()
-
-        # Log retry attempt with exponential backoff
-        exc_message = f"Task failed for podcast {podcast_id}: {str(e)}"
-        logger.warning(f"[TASK] Retry attempt {self.request.retries}/{self.max_retries}: {exc_message}")
-
-        # Retry with exponential backoff
-        try:
-            raise self.retry(exc=e, countdown=min(5 * (2 ** self.request.retries), 600))
-        except self.MaxRetriesExceededError:
-            logger.error(f"[TASK] ✗ Max retries exceeded for podcast {podcast_id}. Task failed permanently.")
-            if 'podcast' in locals() and db.is_active:
-                podcast.status = models.PodcastStatus.FAILED.value
-                db.commit()
-            raise
-    finally:
-        db.close()
-
-    return "Podcast created successfully."
\ No newline at end of file
+    return "Podcast created successfully."
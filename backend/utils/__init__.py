@@ -1,5 +1,8 @@
 """Utility modules for the application."""
 
-from .rate_limit import limiter, RATE_LIMITS, setup_rate_limiting
+from .rate_limit import limiter, RATE_LIMITS, setup_rate_limiting, RateLimitExceeded
+from .cache import TTLCache
+from .metrics import setup_metrics, start_worker_exporter, mark_process_dead
 
-__all__ = ["limiter", "RATE_LIMITS", "setup_rate_limiting"]
+__all__ = ["limiter", "RATE_LIMITS", "setup_rate_limiting", "RateLimitExceeded", "TTLCache",
+           "setup_metrics", "start_worker_exporter", "mark_process_dead"]
@@ -0,0 +1,111 @@
+"""
+Prometheus metrics export for the API and the Celery workers.
+
+The API records request latency per route and serves every metric of its
+process at /metrics. Workers serve theirs from a small HTTP exporter started
+when the worker boots. Pipeline metrics are defined in backend/pipeline/metrics.py.
+
+When a server runs several processes (uvicorn --workers, a prefork Celery
+pool), set PROMETHEUS_MULTIPROC_DIR so each process writes its samples there
+and the endpoint aggregates them.
+"""
+
+import os
+import time
+import logging
+
+from fastapi import FastAPI, Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Histogram, generate_latest, multiprocess, start_http_server
+)
+
+logger = logging.getLogger(__name__)
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Time from receiving a request to sending its response headers",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+
+def metrics_registry():
+    """Registry to export: aggregated across processes in multiprocess mode, else this process's."""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording HTTP_REQUEST_SECONDS.
+
+    Requests are labelled by route template (/podcasts/{podcast_id}) rather
+    than path, and timed until the response starts, so long-lived event
+    streams are not counted as slow requests.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        observed = False
+
+        def observe(status: int):
+            nonlocal observed
+            observed = True
+            route = scope.get("route")
+            HTTP_REQUEST_SECONDS.labels(
+                scope["method"], route.path if route else "unmatched", str(status)
+            ).observe(time.perf_counter() - started)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                observe(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if not observed:
+                observe(500)
+
+
+def setup_metrics(app: FastAPI):
+    """
+    Record request metrics and serve /metrics on the FastAPI app.
+
+    Args:
+        app: FastAPI application instance
+    """
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        return Response(generate_latest(metrics_registry()), media_type=CONTENT_TYPE_LATEST)
+
+
+def start_worker_exporter(port: int) -> None:
+    """Serve this worker's metrics on port, from a background thread."""
+    try:
+        start_http_server(port, registry=metrics_registry())
+        logger.info(f"[METRICS] ✓ Worker metrics exporter listening on port {port}")
+    except OSError as e:
+        # Another worker on this host already holds the port; set METRICS_WORKER_PORT per worker
+        logger.warning(f"[METRICS] ✗ Could not start worker metrics exporter on port {port}: {str(e)}")
+
+
+def mark_process_dead(pid: int) -> None:
+    """Drop a finished worker process's live samples in multiprocess mode."""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid)
+
+
+__all__ = ["setup_metrics", "start_worker_exporter", "mark_process_dead", "HTTP_REQUEST_SECONDS"]
@@ -1,16 +1,33 @@
 """
 Rate limiting configuration and utilities for API endpoints.
-Uses slowapi for request-based rate limiting.
+Uses Redis-backed token buckets so limits hold across workers and nodes.
+
+Each (route, client) pair owns a token bucket stored in Redis and updated
+atomically by a Lua script. Authenticated routes are keyed by user id, others
+by client IP. To keep Redis at one round trip per request or fewer, each
+process leases a share of a bucket's remaining tokens, spends them locally
+and hands back whatever it did not spend on its next call. Rejections are
+remembered until their retry time.
 """
 
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
+import functools
+import inspect
+import logging
+import math
+import time
+from dataclasses import dataclass
+
+import redis.asyncio as aioredis
+from redis.exceptions import NoScriptError, RedisError
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
+
+from backend.core import get_settings
+from .cache import TTLCache
 
-# Initialize the limiter with get_remote_address as the key function
-limiter = Limiter(key_func=get_remote_address)
+logger = logging.getLogger(__name__)
+settings = get_settings()
 
 # Rate limit configurations
 RATE_LIMITS = {
@@ -35,6 +52,8 @@ RATE_LIMITS = {
     "create_podcast": "10/hour",  # Creating podcasts
     "get_podcast": "100/hour",  # Fetching single podcast
     "list_podcasts": "50/hour",  # Listing user's podcasts
+    "get_playlist": "1000/hour",  # HLS playlist reloads while a podcast is being synthesized
+    "podcast_events": "100/hour",  # Opening a progress event stream (one long-lived connection each)
 
     # ============================================================================
     # ADMIN/MONITORING
@@ -43,9 +62,248 @@ RATE_LIMITS = {
     "health": "1000/hour",  # Health checks (minimal restriction)
 }
 
+PERIOD_SECONDS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+# Refill the bucket and take back ARGV[4] unspent leased tokens, then grant
+# the ARGV[3] fraction of what remains (at least one token).
+# Returns {granted, retry_after_seconds}; the float is returned as a string
+# because Redis truncates Lua numbers to integers.
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local refill_per_second = tonumber(ARGV[2])
+local lease_fraction = tonumber(ARGV[3])
+local returned = tonumber(ARGV[4])
+
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * refill_per_second + returned)
+
+local granted = 0
+local retry_after = 0
+if tokens >= 1 then
+    granted = math.min(math.floor(tokens), math.max(1, math.floor(tokens * lease_fraction)))
+    tokens = tokens - granted
+else
+    retry_after = (1 - tokens) / refill_per_second
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / refill_per_second) + 1)
+return {granted, tostring(retry_after)}
+"""
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a client has no tokens left for a route."""
+
+    def __init__(self, limit: str, retry_after: float):
+        super().__init__(f"Rate limit exceeded: {limit}")
+        self.limit = limit
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class Rate:
+    """A parsed "N/period" limit as a token bucket."""
+    limit: str
+    capacity: int
+    refill_per_second: float
+
+    @classmethod
+    def parse(cls, limit: str) -> "Rate":
+        """
+        Parse a limit such as "10/hour".
+
+        Raises:
+            ValueError: If the limit string is malformed
+        """
+        try:
+            count, period = limit.split("/")
+            capacity = int(count)
+            seconds = PERIOD_SECONDS[period.strip().lower().rstrip("s")]
+        except (ValueError, KeyError) as e:
+            raise ValueError(f"Invalid rate limit: {limit!r}") from e
+        return cls(limit=limit, capacity=capacity, refill_per_second=capacity / seconds)
+
+
+class LocalTokenBucket:
+    """In-process token bucket, used for leases and when Redis is unreachable."""
+
+    def __init__(self, capacity: float, refill_per_second: float, tokens: float = None):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = capacity if tokens is None else tokens
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """Take one token. Returns 0 on success, otherwise seconds until one is available."""
+        now = time.monotonic()
+        if self.refill_per_second:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_per_second)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        if not self.refill_per_second:
+            return float("inf")
+        return (1 - self.tokens) / self.refill_per_second
+
+
+def client_key(request: Request) -> str:
+    """Key a request by authenticated user when known, otherwise by client IP."""
+    user_id = getattr(request.state, "rate_limit_user", None)
+    if user_id:
+        return f"user:{user_id}"
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+
+class RedisRateLimiter:
+    """
+    Distributed token-bucket limiter with a slowapi-style decorator API.
+
+    Usage:
+        @app.get("/things")
+        @limiter.limit("10/hour")
+        async def list_things(request: Request, ...): ...
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        enabled: bool = True,
+        lease_seconds: float = 2.0,
+        lease_fraction: float = 0.1,
+        key_prefix: str = "ratelimit",
+    ):
+        """
+        Args:
+            redis_url: Redis holding the shared buckets
+            enabled: When False, decorated routes are not limited
+            lease_seconds: How long a process may hold leased tokens before handing back unspent ones
+            lease_fraction: Share of a bucket's remaining tokens leased per Redis call
+            key_prefix: Prefix for bucket keys in Redis
+        """
+        self.redis_url = redis_url
+        self.enabled = enabled
+        self.lease_seconds = lease_seconds
+        self.lease_fraction = lease_fraction
+        self.key_prefix = key_prefix
+        self._client = None
+        self._script_sha = None
+        # bucket key -> (LocalTokenBucket of leased tokens, monotonic time it may be spent until)
+        self._leases = TTLCache(max_size=100000, ttl_seconds=PERIOD_SECONDS["day"])
+        # bucket key -> monotonic time before which requests are rejected without asking Redis
+        self._blocked = TTLCache(max_size=100000, ttl_seconds=PERIOD_SECONDS["day"])
+        # bucket key -> LocalTokenBucket used while Redis is unreachable
+        self._fallback = TTLCache(max_size=100000, ttl_seconds=PERIOD_SECONDS["day"])
+        self._redis_down_logged = False
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = aioredis.Redis.from_url(self.redis_url)
+        return self._client
+
+    async def _eval(self, bucket_key: str, rate: Rate, returned: int = 0):
+        args = (rate.capacity, rate.refill_per_second, self.lease_fraction, returned)
+        if self._script_sha is None:
+            self._script_sha = await self.client.script_load(TOKEN_BUCKET_SCRIPT)
+        try:
+            granted, retry_after = await self.client.evalsha(self._script_sha, 1, bucket_key, *args)
+        except NoScriptError:
+            # Redis restarted or flushed its script cache
+            self._script_sha = await self.client.script_load(TOKEN_BUCKET_SCRIPT)
+            granted, retry_after = await self.client.evalsha(self._script_sha, 1, bucket_key, *args)
+        return int(granted), float(retry_after)
+
+    async def hit(self, scope: str, key: str, rate: Rate) -> None:
+        """
+        Consume one token for key on scope.
+
+        Raises:
+            RateLimitExceeded: If the bucket is empty
+        """
+        bucket_key = f"{self.key_prefix}:{scope}:{key}"
+        now = time.monotonic()
+
+        blocked_until = self._blocked.get(bucket_key)
+        if blocked_until is not None and now < blocked_until:
+            raise RateLimitExceeded(rate.limit, blocked_until - now)
+
+        returned = 0
+        lease = self._leases.get(bucket_key)
+        if lease is not None:
+            bucket, spend_until = lease
+            if now < spend_until and bucket.take() == 0:
+                return
+            # Spent or held too long; unspent tokens go back to the shared bucket
+            returned = math.floor(bucket.tokens)
+            self._leases.invalidate(bucket_key)
+
+        try:
+            granted, retry_after = await self._eval(bucket_key, rate, returned)
+            self._redis_down_logged = False
+        except (RedisError, OSError) as e:
+            # Fail open to a per-process bucket rather than rejecting or letting everything through
+            if not self._redis_down_logged:
+                logger.warning(f"[RATE_LIMIT] ✗ Redis unavailable, using local buckets: {str(e)}")
+                self._redis_down_logged = True
+            bucket = self._fallback.get(bucket_key)
+            if bucket is None:
+                bucket = LocalTokenBucket(rate.capacity, rate.refill_per_second)
+                self._fallback.set(bucket_key, bucket)
+            retry_after = bucket.take()
+            if retry_after:
+                raise RateLimitExceeded(rate.limit, retry_after)
+            return
+
+        if granted < 1:
+            self._blocked.set(bucket_key, now + retry_after)
+            raise RateLimitExceeded(rate.limit, retry_after)
+        if granted > 1:
+            self._leases.set(bucket_key, (LocalTokenBucket(granted - 1, 0.0), now + self.lease_seconds))
+
+    def limit(self, limit_value: str):
+        """
+        Decorate an endpoint with a rate limit such as "10/hour".
+
+        The endpoint must accept a `request: Request` argument. Works on sync
+        and async endpoints; the wrapped endpoint is always async.
+        """
+        rate = Rate.parse(limit_value)
+
+        def decorator(func):
+            scope = func.__name__
+            is_async = inspect.iscoroutinefunction(func)
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                request = kwargs.get("request") or next((a for a in args if isinstance(a, Request)), None)
+                if self.enabled and request is not None:
+                    await self.hit(scope, client_key(request), rate)
+                if is_async:
+                    return await func(*args, **kwargs)
+                return await run_in_threadpool(func, *args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+
+limiter = RedisRateLimiter(
+    redis_url=settings.REDIS_URL,
+    enabled=settings.RATE_LIMIT_ENABLED,
+    lease_seconds=settings.RATE_LIMIT_LEASE_SECONDS,
+)
+
+
 def setup_rate_limiting(app: FastAPI):
     """
-    Setup rate limiting error handler and middleware on the FastAPI app.
+    Setup rate limiting error handler on the FastAPI app.
 
     Args:
         app: FastAPI application instance
@@ -57,12 +315,14 @@ async def _rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded)
     """
     Custom error handler for rate limit exceeded exceptions.
     """
+    retry_after = max(1, math.ceil(exc.retry_after))
     return JSONResponse(
         status_code=429,
         content={
             "detail": "Rate limit exceeded. Please try again later.",
-            "retry_after": exc.detail
-        }
+            "retry_after": f"{exc.limit}; retry in {retry_after}s"
+        },
+        headers={"Retry-After": str(retry_after)}
     )
 
-__all__ = ["limiter", "RATE_LIMITS", "setup_rate_limiting"]
+__all__ = ["limiter", "RATE_LIMITS", "setup_rate_limiting", "RateLimitExceeded", "RedisRateLimiter"]
@@ -2,6 +2,9 @@ import { createClient } from "@/utils/supabase/server"
 import { redirect } from "next/navigation"
 import { PodcastListView } from "@/components/podcast-library/podcast-list-view"
 
+// Podcasts fetched from the API per request
+const PAGE_SIZE = 50
+
 export default async function PodcastsPage() {
   const supabase = await createClient()
 
@@ -19,19 +22,22 @@ export default async function PodcastsPage() {
   const token = session?.access_token
 
   let podcasts = []
+  let nextCursor: string | null = null
   if (token) {
     try {
-      const res = await fetch(`${process.env.NEXT_PUBLIC_API_URL}/podcasts/`, {
+      const res = await fetch(`${process.env.NEXT_PUBLIC_API_URL}/podcasts/?limit=${PAGE_SIZE}`, {
         headers: { Authorization: `Bearer ${token}` },
         cache: "no-store",
       })
       if (res.ok) {
-        podcasts = await res.json()
+        const page = await res.json()
+        podcasts = page.items
+        nextCursor = page.next_cursor
       }
     } catch (error) {
       console.error("Failed to fetch podcasts:", error)
     }
   }
 
-  return <PodcastListView initialPodcasts={podcasts} />
+  return <PodcastListView initialPodcasts={podcasts} initialCursor={nextCursor} pageSize={PAGE_SIZE} />
 }
@@ -11,6 +11,7 @@ type Podcast = {
   title?: string
   status: "pending" | "processing" | "complete" | "failed"
   created_at: string
+  progressMessage?: string
 }
 
 interface PodcastCreationClientProps {
@@ -38,35 +39,58 @@ export function PodcastCreationStatus({ podcast: initialPodcast }: PodcastCreati
       return
     }
 
-    const pollInterval = setInterval(async () => {
-      try {
-        const { data: { session } } = await supabase.auth.getSession()
-        if (!session) return
-
-        const res = await fetch(`${process.env.NEXT_PUBLIC_API_URL}/podcasts/${podcast.id}`, {
-          headers: { Authorization: `Bearer ${session.access_token}` },
-          cache: "no-store",
-        })
-
-        if (res.ok) {
-          const updatedPodcast = await res.json()
-          setPodcast(updatedPodcast)
-
-          if (updatedPodcast.status === "complete") {
-            setTimeout(() => {
-              router.push(`/dashboard/podcasts/${podcast.id}`)
-            }, 2000)
-          } else if (updatedPodcast.status === "failed") {
-            toast.error("Podcast creation failed. Please try again.");
-            router.push("/dashboard");
+    let pollInterval: ReturnType<typeof setInterval> | undefined
+
+    const handleUpdate = (updatedPodcast: Partial<Podcast>) => {
+      setPodcast(prev => ({ ...prev, ...updatedPodcast }))
+
+      if (updatedPodcast.status === "complete") {
+        setTimeout(() => {
+          router.push(`/dashboard/podcasts/${podcast.id}`)
+        }, 2000)
+      } else if (updatedPodcast.status === "failed") {
+        toast.error("Podcast creation failed. Please try again.");
+        router.push("/dashboard");
+      }
+    }
+
+    // Fallback when the event stream is unavailable
+    const startPolling = () => {
+      if (pollInterval) return
+      pollInterval = setInterval(async () => {
+        try {
+          const { data: { session } } = await supabase.auth.getSession()
+          if (!session) return
+
+          const res = await fetch(`${process.env.NEXT_PUBLIC_API_URL}/podcasts/${podcast.id}`, {
+            headers: { Authorization: `Bearer ${session.access_token}` },
+            cache: "no-store",
+          })
+
+          if (res.ok) {
+            handleUpdate(await res.json())
           }
+        } catch (error) {
+          console.error("Failed to poll podcast status:", error)
         }
-      } catch (error) {
-        console.error("Failed to poll podcast status:", error)
-      }
-    }, 3000)
+      }, 3000)
+    }
 
-    return () => clearInterval(pollInterval)
+    // Server-pushed progress events
+    const events = new EventSource(`${process.env.NEXT_PUBLIC_API_URL}/podcasts/${podcast.id}/events`)
+    events.addEventListener("progress", (event) => {
+      const data = JSON.parse((event as MessageEvent).data)
+      handleUpdate({ status: data.status, progressMessage: data.message ?? undefined })
+    })
+    events.onerror = () => {
+      events.close()
+      startPolling()
+    }
+
+    return () => {
+      events.close()
+      if (pollInterval) clearInterval(pollInterval)
+    }
   }, [podcast.id, podcast.status, router, supabase])
 
   const getStatusDisplay = () => {
@@ -80,7 +104,7 @@ export function PodcastCreationStatus({ podcast: initialPodcast }: PodcastCreati
       case "processing":
         return {
           title: "Creating",
-          description: "Converting your document to audio...",
+          description: podcast.progressMessage ?? "Converting your document to audio...",
           animationClass: ""
         }
       case "complete":
@@ -7,6 +7,7 @@ import { Input } from "@/components/ui/input"
 import { DashboardHeader } from "@/components/dashboard/dashboard-header"
 import { DropdownMenu, DropdownMenuContent, DropdownMenuItem, DropdownMenuTrigger } from "@/components/ui/dropdown-menu"
 import { useRouter } from "next/navigation"
+import { createClient } from "@/utils/supabase/client"
 import { Clock, CheckCircle, AlertCircle, FileText } from 'lucide-react'
 
 type Podcast = {
@@ -25,6 +26,8 @@ type Podcast = {
 
 interface PodcastsClientProps {
   initialPodcasts: Podcast[]
+  initialCursor: string | null
+  pageSize: number
 }
 
 // Skeleton component for loading podcasts
@@ -61,8 +64,10 @@ function PodcastSkeleton() {
   )
 }
 
-export function PodcastListView({ initialPodcasts }: PodcastsClientProps) {
-  const [podcasts] = useState<Podcast[]>(initialPodcasts)
+export function PodcastListView({ initialPodcasts, initialCursor, pageSize }: PodcastsClientProps) {
+  const [podcasts, setPodcasts] = useState<Podcast[]>(initialPodcasts)
+  const [nextCursor, setNextCursor] = useState<string | null>(initialCursor)
+  const [isLoadingMore, setIsLoadingMore] = useState(false)
   const [searchQuery, setSearchQuery] = useState("")
   const [statusFilter, setStatusFilter] = useState<string>("all")
   const [currentPage, setCurrentPage] = useState(1)
@@ -82,6 +87,32 @@ export function PodcastListView({ initialPodcasts }: PodcastsClientProps) {
     setTimeout(() => setLoadingPodcastId(null), 1000)
   }
 
+  const handleLoadMore = async () => {
+    if (!nextCursor) return
+
+    setIsLoadingMore(true)
+    try {
+      const supabase = createClient()
+      const { data: { session } } = await supabase.auth.getSession()
+      if (!session) return
+
+      const params = new URLSearchParams({ limit: String(pageSize), cursor: nextCursor })
+      const res = await fetch(`${process.env.NEXT_PUBLIC_API_URL}/podcasts/?${params}`, {
+        headers: { Authorization: `Bearer ${session.access_token}` },
+        cache: "no-store",
+      })
+      if (res.ok) {
+        const page = await res.json()
+        setPodcasts(prev => [...prev, ...page.items])
+        setNextCursor(page.next_cursor)
+      }
+    } catch (error) {
+      console.error("Failed to load more podcasts:", error)
+    } finally {
+      setIsLoadingMore(false)
+    }
+  }
+
   const handleCreateNew = () => {
     setIsNavigatingToCreate(true)
     router.push("/dashboard")
@@ -387,6 +418,14 @@ export function PodcastListView({ initialPodcasts }: PodcastsClientProps) {
                 </Button>
               </div>
             )}
+
+            {nextCursor && (
+              <div className="flex justify-center mt-6">
+                <Button variant="outline" size="sm" onClick={handleLoadMore} disabled={isLoadingMore}>
+                  {isLoadingMore ? <LoadingSpinner size="sm" /> : "Load older podcasts"}
+                </Button>
+              </div>
+            )}
           </>
         )}
       </main>